@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Batch extraction of every Chase and Discover statement under a folder.
+
+Discovers all statement PDFs below a root folder (one client, one year or a
+whole tax season), collapses identical copies of shared multi-account Chase
+statements, runs the extractions across worker processes and writes every
+monthly CSV through the usual save_transactions versioning. A per-file
+summary table is printed at the end.
+
+Usage:
+    python batch_extract.py <statements_root> [--workers=N] [--output-root=DIR] [--verbose]
+"""
+
+import io
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from extract_chase_robust import ChaseRobustExtractor
+from extract_discover_enhanced import DiscoverExtractor
+from pdf_text import PageTextCache, load_page_texts
+from statement_registry import StatementRegistry
+
+
+def detect_bank(pdf_path: Path, sha256: str = None, cache: Optional[PageTextCache] = None) -> Optional[str]:
+    """Return 'Chase' or 'Discover' for a statement PDF, or None if unknown."""
+    name = pdf_path.name.lower()
+    if 'discover' in name:
+        return 'Discover'
+    if 'chase' in name or re.search(r'\d{8}-statements-\d{4}', name):
+        return 'Chase'
+
+    # Fall back to the first page text (cached, so extraction reuses it)
+    first_page = load_page_texts(str(pdf_path), cache, sha256=sha256)[0].upper()
+    if 'DISCOVER' in first_page:
+        return 'Discover'
+    if 'CHASE' in first_page or 'JPMORGAN' in first_page:
+        return 'Chase'
+    return None
+
+
+def run_statement(bank: str, pdf_path: str, sha256: str, output_root: str) -> Dict:
+    """Extract and save one statement. Runs in a worker process."""
+    result = {
+        'file': pdf_path,
+        'bank': bank,
+        'accounts': [],
+        'transactions': 0,
+        'reconciled': None,
+        'saved': [],
+        'status': 'ok',
+    }
+
+    log = io.StringIO()
+    try:
+        with redirect_stdout(log):
+            if bank == 'Chase':
+                extractor = ChaseRobustExtractor(pdf_path, sha256=sha256)
+                extractor.output_root = Path(output_root)
+                extractor.extract_all_accounts()
+
+                reconciled = True
+                for account, info in extractor.account_sections.items():
+                    result['accounts'].append(account)
+                    result['transactions'] += len(info['transactions'])
+                    net_change = sum(t.amount_cents for t in info['transactions'])
+                    if info['beginning_cents'] + net_change != info['ending_cents']:
+                        reconciled = False
+                    if output_path := extractor.save_transactions(account):
+                        result['saved'].append(str(output_path))
+                result['reconciled'] = reconciled
+            else:
+                extractor = DiscoverExtractor(pdf_path, sha256=sha256)
+                extractor.output_root = Path(output_root)
+                extractor.extract()
+                result['accounts'].append(extractor.account)
+                result['transactions'] = len(extractor.transactions)
+                if output_path := extractor.save_transactions():
+                    result['saved'].append(str(output_path))
+    except Exception as e:
+        result['status'] = f"error: {e}"
+
+    result['log'] = log.getvalue()
+    return result
+
+
+def print_summary(results: List[Dict]):
+    """Print one row per statement file."""
+    print(f"\n{'File':<45} {'Bank':<9} {'Accounts':<16} {'Txns':>5} {'Recon':<6} Status")
+    print("-" * 100)
+    for result in sorted(results, key=lambda r: r['file']):
+        reconciled = {True: 'yes', False: 'NO', None: '-'}[result['reconciled']]
+        print(f"{Path(result['file']).name[:44]:<45} {result['bank']:<9} "
+              f"{','.join(result['accounts'])[:15]:<16} {result['transactions']:>5} "
+              f"{reconciled:<6} {result['status']}")
+    print("-" * 100)
+
+    failed = [r for r in results if r['status'] != 'ok']
+    unreconciled = [r for r in results if r['reconciled'] is False]
+    print(f"{len(results)} statements, {sum(len(r['saved']) for r in results)} monthly files written, "
+          f"{len(failed)} failed, {len(unreconciled)} not reconciled")
+
+
+def main():
+    """Extract every statement PDF below a root folder."""
+    workers = os.cpu_count() or 1
+    output_root = '.'
+    verbose = False
+    args = []
+    for arg in sys.argv[1:]:
+        if arg.startswith('--workers='):
+            workers = int(arg.split('=', 1)[1])
+        elif arg.startswith('--output-root='):
+            output_root = arg.split('=', 1)[1]
+        elif arg == '--verbose':
+            verbose = True
+        else:
+            args.append(arg)
+
+    if not args:
+        print("Usage: python batch_extract.py <statements_root> [--workers=N] [--output-root=DIR] [--verbose]")
+        sys.exit(1)
+
+    root = Path(args[0])
+    registry = StatementRegistry()
+    found = registry.add_directory(root)
+    documents = registry.unique_documents()
+    print(f"Found {found} PDFs under {root} ({len(documents)} unique statements)")
+
+    jobs = []
+    skipped = []
+    for sha256, copies in documents.items():
+        try:
+            bank = detect_bank(copies[0], sha256)
+        except Exception as e:
+            skipped.append((copies[0], f"unreadable PDF ({e})"))
+            continue
+        if bank is None:
+            skipped.append((copies[0], "not a Chase or Discover statement"))
+        else:
+            jobs.append((bank, str(copies[0]), sha256))
+
+    for pdf_path, reason in skipped:
+        print(f"  Skipping {pdf_path}: {reason}")
+
+    results = []
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(run_statement, bank, pdf_path, sha256, output_root)
+                   for bank, pdf_path, sha256 in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            print(f"  [{len(results)}/{len(jobs)}] {Path(result['file']).name}: {result['status']}")
+            if verbose:
+                print(result['log'])
+
+    print_summary(results)
+
+
+if __name__ == "__main__":
+    main()
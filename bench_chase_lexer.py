@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark the single-pass Chase line lexer against the original parser loop.
+
+The legacy loop below is the inner loop of
+ChaseRobustExtractor.extract_transactions_from_page before it moved to
+chase_lexer. The benchmark first checks that both produce the same
+transactions, then reports lines per second for each.
+
+Usage:
+    python bench_chase_lexer.py [statement_text.txt] [repeat]
+"""
+
+import re
+import sys
+import time
+from typing import List
+
+from chase_lexer import parse_lines
+
+
+def legacy_parse_lines(lines: List[str]) -> List[tuple]:
+    """Original per-line parsing loop (string patterns, rescanning lookahead)."""
+    results = []
+    i = 0
+    while i < len(lines):
+        line = lines[i].strip()
+
+        if not line or any(skip in line for skip in ['TRANSACTION DETAIL', 'CHECKING SUMMARY', 'DATE DESCRIPTION', 'AMOUNT BALANCE']):
+            i += 1
+            continue
+
+        date_match = re.match(r'^(\d{2}/\d{2})\s+(.+)', line)
+        if date_match:
+            date_str = date_match.group(1)
+            rest_of_line = date_match.group(2).strip()
+
+            if re.match(r'^\d{2}/\d{2}\s+', rest_of_line):
+                rest_of_line = re.sub(r'^\d{2}/\d{2}\s+', '', rest_of_line)
+
+            amount_pattern = r'(-?\s*[0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})\s*$'
+            amount_only_pattern = r'(-?\s*[0-9,]+\.\d{2})\s*$'
+
+            amount_match = re.search(amount_pattern, rest_of_line)
+            if not amount_match:
+                amount_match = re.search(amount_only_pattern, rest_of_line)
+
+            if amount_match:
+                amount_str = amount_match.group(1).replace(' ', '').replace(',', '')
+                description = rest_of_line[:amount_match.start()].strip()
+                description = re.sub(r'\s*-\s*$', '', description)
+                has_balance = bool(amount_match.lastindex and amount_match.lastindex >= 2)
+                results.append((date_str, description, amount_str, has_balance, False))
+            else:
+                description_parts = [rest_of_line]
+                i += 1
+
+                while i < len(lines):
+                    next_line = lines[i].strip()
+
+                    if re.match(r'^\d{2}/\d{2}', next_line):
+                        i -= 1
+                        break
+
+                    amount_match = re.search(amount_pattern, next_line)
+                    if not amount_match:
+                        amount_only_pattern = r'(-?\s*[0-9,]+\.\d{2})\s*$'
+                        amount_match = re.search(amount_only_pattern, next_line)
+
+                    if amount_match:
+                        amount_str = amount_match.group(1).replace(' ', '').replace(',', '')
+                        desc_part = next_line[:amount_match.start()].strip()
+                        if desc_part and desc_part != '-':
+                            description_parts.append(desc_part)
+                        description = ' '.join(description_parts).strip()
+                        description = re.sub(r'\s*-\s*$', '', description)
+                        has_balance = bool(amount_match.lastindex and amount_match.lastindex >= 2)
+                        results.append((date_str, description, amount_str, has_balance, True))
+                        break
+                    else:
+                        if next_line and next_line != '-':
+                            if not re.match(r'^\d{1,2}/\d{1,2}/\d{4}\d+', next_line):
+                                description_parts.append(next_line)
+                    i += 1
+
+        i += 1
+
+    return results
+
+
+def lexer_parse_lines(lines: List[str]) -> List[tuple]:
+    """Single-pass lexer, in the same result shape as legacy_parse_lines."""
+    return [(date, description, amount, balance is not None, multiline)
+            for date, description, amount, balance, multiline in parse_lines(lines)]
+
+
+def time_parser(parse, lines: List[str], rounds: int = 3) -> float:
+    """Best-of-N wall time in seconds."""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        parse(lines)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Compare correctness and throughput of both parsers."""
+    text_path = sys.argv[1] if len(sys.argv) > 1 else 'pdf_extract.txt'
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    with open(text_path, 'r') as f:
+        lines = f.read().split('\n') * repeat
+
+    legacy = legacy_parse_lines(lines)
+    lexed = lexer_parse_lines(lines)
+    if legacy != lexed:
+        for n, (old, new) in enumerate(zip(legacy, lexed)):
+            if old != new:
+                print(f"MISMATCH at transaction {n}:\n  legacy: {old}\n  lexer:  {new}")
+                break
+        print(f"legacy: {len(legacy)} transactions, lexer: {len(lexed)} transactions")
+        sys.exit(1)
+
+    print(f"Input: {text_path} x{repeat} = {len(lines):,} lines, {len(lexed):,} transactions (identical)")
+    print("-" * 60)
+    legacy_time = time_parser(legacy_parse_lines, lines)
+    lexer_time = time_parser(lexer_parse_lines, lines)
+    print(f"  Legacy loop: {len(lines) / legacy_time:>12,.0f} lines/sec ({legacy_time:.3f}s)")
+    print(f"  Lexer:       {len(lines) / lexer_time:>12,.0f} lines/sec ({lexer_time:.3f}s)")
+    print(f"  Speedup:     {legacy_time / lexer_time:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark float amounts against integer cents on the consolidated CSVs.
+
+Both paths do the consolidate_account summary work: parse every Amount,
+total the credits and debits and compute the net change. The cents path
+keeps the parsed amounts in an array('q'). The benchmark first reports
+where float sums drift from the exact cents totals, then reports rows per
+second for the whole summary and for parsing and totalling separately
+(reconciliation re-totals amounts that are already parsed).
+
+Usage:
+    python bench_money.py [accounts_root] [repeat]
+"""
+
+import csv
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import List, Tuple
+
+from money import credit_debit_totals, format_dollars, parse_cents
+
+
+def float_totals(amounts: List[str]) -> Tuple[float, float]:
+    """Original path: float() per comparison, as consolidate_account did."""
+    total_credits = sum(float(a.replace(',', '')) for a in amounts if float(a.replace(',', '')) > 0)
+    total_debits = sum(float(a.replace(',', '')) for a in amounts if float(a.replace(',', '')) < 0)
+    return total_credits, total_debits
+
+
+def cents_totals(amounts: List[str]) -> Tuple[int, int]:
+    """Integer-cents path: parse once into an int array, sum exactly."""
+    return credit_debit_totals(array('q', (parse_cents(a) for a in amounts)))
+
+
+def parse_floats(amounts: List[str]) -> List[float]:
+    """Parse every amount to a float once."""
+    return [float(a.replace(',', '')) for a in amounts]
+
+
+def parse_cents_array(amounts: List[str]) -> array:
+    """Parse every amount to cents once."""
+    return array('q', (parse_cents(a) for a in amounts))
+
+
+def float_aggregate(values: List[float]) -> Tuple[float, float]:
+    """Credit and debit totals of already parsed floats."""
+    credits = sum(v for v in values if v > 0)
+    return credits, sum(v for v in values if v < 0)
+
+
+def time_path(totals, amounts: List[str], rounds: int = 3) -> float:
+    """Best-of-N wall time in seconds."""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        totals(amounts)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Compare exactness and throughput of float and cents totals."""
+    root = Path(sys.argv[1]) if len(sys.argv) > 1 else Path('accounts')
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    files = sorted(root.glob('*/*/consolidated/*.csv'))
+    if not files:
+        print(f"No consolidated CSVs found under {root}")
+        sys.exit(1)
+
+    amounts = []
+    print(f"{'File':<45} {'Rows':>5} {'Float net':>14} {'Cents net':>14}")
+    print("-" * 82)
+    for path in files:
+        with open(path, 'r', newline='') as f:
+            file_amounts = [row['Amount'] for row in csv.DictReader(f)]
+        amounts.extend(file_amounts)
+
+        float_net = sum(float_totals(file_amounts))
+        cents_net = sum(cents_totals(file_amounts))
+        drift = '' if float_net == cents_net / 100 else '  (float drift)'
+        print(f"{path.name[:44]:<45} {len(file_amounts):>5} {float_net:>14.10f} "
+              f"{format_dollars(cents_net):>14}{drift}")
+
+    amounts *= repeat
+    floats = parse_floats(amounts)
+    cents = parse_cents_array(amounts)
+    print("-" * 82)
+    print(f"Input: {len(files)} files x{repeat} = {len(amounts):,} amounts")
+    for label, float_step, cents_step, data in (
+            ('Summary (parse + totals)', float_totals, cents_totals, (amounts, amounts)),
+            ('Parse only', parse_floats, parse_cents_array, (amounts, amounts)),
+            ('Totals of parsed amounts', float_aggregate, credit_debit_totals, (floats, cents))):
+        float_time = time_path(float_step, data[0])
+        cents_time = time_path(cents_step, data[1])
+        print(f"  {label}:")
+        print(f"    Float:  {len(amounts) / float_time:>12,.0f} rows/sec ({float_time:.3f}s)")
+        print(f"    Cents:  {len(amounts) / cents_time:>12,.0f} rows/sec ({cents_time:.3f}s)")
+        print(f"    Speedup: {float_time / cents_time:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
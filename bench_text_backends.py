@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Benchmark the text backends on a corpus of statement PDFs.
+
+Each available backend (see text_backends) extracts every PDF in a fresh
+process, so speed and peak memory are measured without the page text cache
+and without the other runs; the real cache is neither read nor written.
+The pages are then fed to the usual extractor for the bank, and the rows it
+produces are compared with the [VALIDATED] monthly CSV of the same account
+and month: a validated row counts as recovered when an extracted row has
+the same date and amount.
+
+The report gives pages per second, peak memory (added during extraction,
+by the worker or the command it ran) and recovered rows per backend and
+bank, and names the fastest backend that recovers as many validated rows
+as the best one.
+
+Usage:
+    python bench_text_backends.py <pdf_or_dir> [...] [--backends=PyPDF2,strings]
+"""
+
+import io
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from batch_extract import detect_bank
+from extract_chase_robust import ChaseRobustExtractor
+from extract_discover_enhanced import DiscoverExtractor
+from monthly_files import monthly_dir
+from pdf_text import BACKEND, PageTextCache, extract_page_texts, file_sha256
+from text_backends import available_backends, get_backend
+from transaction import Transaction, read_transactions
+
+
+def _max_rss_mb(who: int) -> float:
+    peak = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def peak_memory_mb(baseline_mb: float) -> float:
+    """Peak memory an extraction added, in MB.
+
+    The growth over baseline_mb (this process's peak before extracting,
+    imports included) of this process or of a command it ran. A command's
+    peak counts the copy of this process it was forked from, so it is
+    measured against the same baseline.
+    """
+    peak = max(_max_rss_mb(resource.RUSAGE_SELF), _max_rss_mb(resource.RUSAGE_CHILDREN))
+    return max(peak - baseline_mb, 0.0)
+
+
+def validated_path(bank: str, account: str, year: int, month: int, output_root: Path = Path('.')) -> Path:
+    """The [VALIDATED] monthly CSV of an account and month (which may not exist)."""
+    return monthly_dir(bank, account, year, output_root) / f"{bank.lower()}_{account}_{year}-{month:02d}[VALIDATED].csv"
+
+
+def recovery(extracted: List[Transaction], validated: List[Transaction]) -> Dict[str, int]:
+    """Validated rows matched by an extracted row with the same date and amount."""
+    found = Counter((tx.date, tx.amount_cents) for tx in extracted)
+    wanted = Counter((tx.date, tx.amount_cents) for tx in validated)
+    recovered = sum((found & wanted).values())
+    return {'recovered': recovered, 'validated': sum(wanted.values()), 'extra': sum(found.values()) - recovered}
+
+
+def extracted_months(bank: str, pdf_path: str, sha256: str, backend: str,
+                     cache: PageTextCache) -> Dict[tuple, List[Transaction]]:
+    """Rows the bank's extractor produces from the backend's text in cache, by (account, year, month)."""
+    with redirect_stdout(io.StringIO()):
+        if bank == 'Chase':
+            extractor = ChaseRobustExtractor(pdf_path, sha256=sha256, backend=backend)
+            extractor.cache = cache
+            extractor.extract_all_accounts()
+            return {(account, extractor.year, extractor.month): info['transactions']
+                    for account, info in extractor.account_sections.items()}
+
+        extractor = DiscoverExtractor(pdf_path, sha256=sha256, backend=backend)
+        extractor.cache = cache
+        extractor.extract()
+        if extractor.account is None or extractor.month is None:
+            return {}
+        return {(extractor.account, extractor.year, extractor.month): extractor.transactions}
+
+
+def measure(backend: str, bank: str, pdf_path: str) -> Dict:
+    """Extract one PDF with one backend and score it. Runs in a fresh worker process."""
+    result = {'backend': backend, 'bank': bank, 'file': pdf_path, 'pages': 0, 'seconds': 0.0,
+              'peak_mb': 0.0, 'months': {}, 'error': None}
+    try:
+        baseline_mb = _max_rss_mb(resource.RUSAGE_SELF)
+        start = time.perf_counter()
+        pages = extract_page_texts(pdf_path, backend=backend)
+        result['seconds'] = time.perf_counter() - start
+        result['peak_mb'] = peak_memory_mb(baseline_mb)
+        # Document pages, so whole-document backends are rated on the same scale
+        result['pages'] = get_backend(BACKEND).page_count(pdf_path)
+
+        # Hand the text to the extractor through a throwaway page text cache,
+        # leaving the real one untouched
+        sha256 = file_sha256(pdf_path)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = PageTextCache(cache_dir)
+            cache.put(sha256, pages, backend, get_backend(backend).version)
+            months = extracted_months(bank, pdf_path, sha256, backend, cache)
+
+        for (account, year, month), transactions in months.items():
+            path = validated_path(bank, account, year, month)
+            if path.exists():
+                result['months'][str(path)] = recovery(transactions, read_transactions(path))
+    except Exception as e:
+        result['error'] = str(e)
+    return result
+
+
+def pdf_files(paths: List[str]) -> List[Path]:
+    """PDFs named directly or found under directories."""
+    files = []
+    for arg in paths:
+        path = Path(arg)
+        files.extend(sorted(path.rglob('*.pdf')) if path.is_dir() else [path])
+    return files
+
+
+def summarize(results: List[Dict]) -> Dict[tuple, Dict]:
+    """Totals per (bank, backend).
+
+    A [VALIDATED] month found through any backend counts for every backend,
+    so one that misses a whole account is charged for all of its rows.
+    """
+    expected: Dict[str, Dict[str, int]] = {}
+    for result in results:
+        for path, counts in result['months'].items():
+            expected.setdefault(result['file'], {})[path] = counts['validated']
+
+    totals: Dict[tuple, Dict] = {}
+    for result in results:
+        entry = totals.setdefault((result['bank'], result['backend']), {
+            'files': 0, 'pages': 0, 'seconds': 0.0, 'peak_mb': 0.0,
+            'recovered': 0, 'validated': 0, 'extra': 0, 'errors': 0})
+        entry['files'] += 1
+        if result['error']:
+            entry['errors'] += 1
+            continue
+        entry['pages'] += result['pages']
+        entry['seconds'] += result['seconds']
+        entry['peak_mb'] = max(entry['peak_mb'], result['peak_mb'])
+        for path, validated in expected.get(result['file'], {}).items():
+            counts = result['months'].get(path, {'recovered': 0, 'extra': 0})
+            entry['recovered'] += counts['recovered']
+            entry['extra'] += counts['extra']
+            entry['validated'] += validated
+    return totals
+
+
+def recommend(totals: Dict[tuple, Dict], bank: str) -> Optional[str]:
+    """Fastest backend for a bank among those recovering the most validated rows."""
+    candidates = {backend: entry for (entry_bank, backend), entry in totals.items()
+                  if entry_bank == bank and not entry['errors'] and entry['pages']}
+    if not candidates:
+        return None
+    best = max(entry['recovered'] for entry in candidates.values())
+    accurate = [backend for backend, entry in candidates.items() if entry['recovered'] == best]
+    return max(accurate, key=lambda backend: candidates[backend]['pages'] / max(candidates[backend]['seconds'], 1e-9))
+
+
+def print_report(totals: Dict[tuple, Dict]):
+    """One row per bank and backend, then the recommendation per bank."""
+    print(f"\n{'Bank':<9} {'Backend':<11} {'Files':>5} {'Pages':>6} {'Pages/s':>9} {'Peak MB':>8}  Recovered")
+    print("-" * 75)
+    for (bank, backend), entry in sorted(totals.items()):
+        rate = entry['pages'] / entry['seconds'] if entry['seconds'] else 0.0
+        if entry['validated']:
+            recovered = (f"{entry['recovered']}/{entry['validated']} "
+                         f"({entry['recovered'] / entry['validated']:.1%}), {entry['extra']} extra")
+        else:
+            recovered = "no [VALIDATED] files"
+        errors = f"  {entry['errors']} failed" if entry['errors'] else ''
+        print(f"{bank:<9} {backend:<11} {entry['files']:>5} {entry['pages']:>6} {rate:>9.1f} "
+              f"{entry['peak_mb']:>8.1f}  {recovered}{errors}")
+    print("-" * 75)
+
+    for bank in sorted({bank for bank, _ in totals}):
+        choice = recommend(totals, bank)
+        compared = any(entry['validated'] for (entry_bank, _), entry in totals.items() if entry_bank == bank)
+        note = '' if compared or choice is None else ' (speed only; no [VALIDATED] rows to compare)'
+        print(f"Recommended for {bank}: {choice or 'none (every backend failed)'}{note}")
+
+
+def main():
+    """Run every available backend over the given statement PDFs."""
+    backends = available_backends()
+    args = []
+    for arg in sys.argv[1:]:
+        if arg.startswith('--backends='):
+            backends = [get_backend(name).name for name in arg.split('=', 1)[1].split(',')]
+        else:
+            args.append(arg)
+
+    if not args:
+        print("Usage: python bench_text_backends.py <pdf_or_dir> [...] [--backends=PyPDF2,strings]")
+        print(f"Available backends: {', '.join(available_backends())}")
+        sys.exit(1)
+
+    # Files named unlike a statement are classified from their first page,
+    # extracted into a throwaway cache
+    corpus = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = PageTextCache(cache_dir)
+        for pdf_path in pdf_files(args):
+            try:
+                bank = detect_bank(pdf_path, cache=cache)
+            except Exception as e:
+                print(f"Skipping {pdf_path}: {e}")
+                continue
+            if bank is None:
+                print(f"Skipping {pdf_path}: not a Chase or Discover statement")
+                continue
+            corpus.append((bank, str(pdf_path)))
+    print(f"{len(corpus)} statements, backends: {', '.join(backends)}")
+
+    # One fresh process per run keeps peak memory per backend and file
+    context = multiprocessing.get_context('spawn')
+    results = []
+    with ProcessPoolExecutor(max_workers=1, mp_context=context, max_tasks_per_child=1) as pool:
+        for backend in backends:
+            for bank, pdf_path in corpus:
+                result = pool.submit(measure, backend, bank, pdf_path).result()
+                if result['error']:
+                    print(f"  ✗ {backend} {Path(pdf_path).name}: {result['error']}")
+                results.append(result)
+
+    print_report(summarize(results))
+
+
+if __name__ == "__main__":
+    main()
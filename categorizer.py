@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Rule-table transaction categorizer shared by the Chase extractors.
+
+A rule is a category plus one or more keyword groups. It matches when every
+group has at least one of its keywords in the lowercased description, and
+the first matching rule in table order wins:
+
+    ('Check', ('check',), ('#',))     # 'check' and '#'
+    ('Deposit', ('deposit', 'cashout'))  # either keyword
+
+All keywords of a table are compiled into one Aho-Corasick automaton, so a
+description is scanned once no matter how many rules there are, and rule
+priority is resolved from the keywords found in that scan.
+
+Descriptions repeat month after month, so lookup() memoizes results in a
+bounded LRU keyed by normalize_description(): dates and long digit runs
+(transaction, confirmation and ACH ids) are masked, card numbers are kept.
+
+Usage (recategorize a consolidated year):
+    python categorizer.py "accounts/Chase 1873/2025/consolidated/2025 - Chase 1873.csv"
+"""
+
+import re
+import sys
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Chase checking transaction types, in priority order
+CHASE_RULES = [
+    ('Interest', ('interest payment',)),
+    ('Check', ('check',), ('#',)),
+    ('Debit', ('card purchase',)),
+    ('Payment', ('online payment',)),
+    ('Transfer', ('online transfer to',)),
+    ('Deposit', ('online transfer from',)),
+    ('Deposit', ('deposit',)),
+    ('Fee', ('fee',)),
+    ('Withdrawal', ('venmo',)),
+    ('Payment', ('environmental',)),
+    ('Withdrawal', ('atm',)),
+]
+
+# Descriptions of transactions that add money to a Chase checking account
+CHASE_CREDIT_RULES = [
+    ('Credit', ('deposit', 'interest payment', 'online transfer from', 'cashout', 'from chk',
+                'credit', 'environmental', 'refund', 'reversal', 'adjustment credit')),
+]
+
+Rule = Tuple  # (category, keyword group, keyword group, ...)
+
+# Distinct normalized descriptions remembered per categorizer
+MEMO_SIZE = 4096
+
+# Dates (01/09, 1/9/2025) and digit runs of 6+ (transaction and ACH ids)
+VOLATILE_DIGITS_RE = re.compile(r'(?a)\d{1,2}/\d{1,2}(?:/\d{2,4})?|\d{6,}')
+
+
+def normalize_description(description: str) -> str:
+    """Memo key for a description: dates and long ids masked as '0'.
+
+    Card and check numbers (up to 5 digits) are kept. Besides the masked
+    digits and date slashes, only a trailing "-" (the sign column some
+    extractions leave behind) is dropped, so a keyword without digits, "/"
+    or a trailing "-" matches the key exactly when it matches the
+    description.
+    """
+    description = description.rstrip()
+    if description.endswith('-'):
+        description = description[:-1].rstrip()
+    return VOLATILE_DIGITS_RE.sub('0', description)
+
+
+class KeywordCategorizer:
+    """Categorize descriptions against a rule table with one automaton scan."""
+
+    def __init__(self, rules: Sequence[Rule], default: Optional[str] = None, memo_size: int = MEMO_SIZE):
+        self.default = default
+        self._memo = lru_cache(maxsize=memo_size)(self.categorize)
+        self.categories = [rule[0] for rule in rules]
+        # Bitmask with one bit per keyword group of each rule
+        self.full_masks = [(1 << (len(rule) - 1)) - 1 for rule in rules]
+
+        # keyword -> (rule index, group index) pairs it satisfies
+        targets: Dict[str, List[Tuple[int, int]]] = {}
+        for rule_index, (_, *groups) in enumerate(rules):
+            for group_index, group in enumerate(groups):
+                for keyword in group:
+                    targets.setdefault(keyword.lower(), []).append((rule_index, group_index))
+        self.keywords = list(targets)
+        self.targets = [targets[keyword] for keyword in self.keywords]
+        self._build_automaton()
+
+    def _build_automaton(self):
+        """Build the Aho-Corasick trie, failure links and full transition table."""
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+        for keyword_id, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                if ch not in goto[state]:
+                    goto.append({})
+                    out.append([])
+                    goto[state][ch] = len(goto) - 1
+                state = goto[state][ch]
+            out[state].append(keyword_id)
+
+        # Breadth-first: failure links, inherited outputs, and transitions
+        # completed from the failure state so scanning never backtracks
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        queue = list(goto[0].values())
+        for state in queue:
+            delta[state] = dict(delta[fail[state]])
+            delta[state].update(goto[state])
+            out[state] = out[state] + out[fail[state]]
+            for ch, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(ch, 0)
+                queue.append(child)
+
+        self._delta = delta
+        self._out = [tuple(keyword_ids) for keyword_ids in out]
+
+    def keywords_in(self, description: str) -> set:
+        """Ids of every keyword that occurs in the description."""
+        delta, out = self._delta, self._out
+        found = set()
+        state = 0
+        for ch in description.lower():
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+    def categorize(self, description: str) -> Optional[str]:
+        """Category of the first rule the description satisfies, else the default."""
+        masks: Dict[int, int] = {}
+        for keyword_id in self.keywords_in(description):
+            for rule_index, group_index in self.targets[keyword_id]:
+                masks[rule_index] = masks.get(rule_index, 0) | (1 << group_index)
+
+        for rule_index in sorted(masks):
+            if masks[rule_index] == self.full_masks[rule_index]:
+                return self.categories[rule_index]
+        return self.default
+
+    def lookup(self, description: str) -> Optional[str]:
+        """Memoized categorize(), keyed by the normalized description."""
+        return self._memo(normalize_description(description))
+
+    def memo_info(self):
+        """Hit/miss counters of the lookup() memo (functools cache_info)."""
+        return self._memo.cache_info()
+
+    def categorize_many(self, descriptions: Iterable[str]) -> List[Optional[str]]:
+        """Categorize a batch, scanning each distinct description once."""
+        descriptions = list(descriptions)
+        categories = {description: self.categorize(description) for description in set(descriptions)}
+        return [categories[description] for description in descriptions]
+
+
+CHASE_CATEGORIES = KeywordCategorizer(CHASE_RULES, default='Withdrawal')
+CHASE_CREDITS = KeywordCategorizer(CHASE_CREDIT_RULES)
+
+
+def categorize_transaction(description: str) -> str:
+    """Chase transaction type for a description."""
+    return CHASE_CATEGORIES.lookup(description)
+
+
+def is_credit(description: str) -> bool:
+    """Whether a Chase description is a credit (positive amount)."""
+    return CHASE_CREDITS.lookup(description) is not None
+
+
+def main():
+    """Recategorize every row of a consolidated CSV and report the differences."""
+    from transaction import read_transactions
+
+    if len(sys.argv) < 2:
+        print("Usage: python categorizer.py <consolidated.csv> [more.csv ...]")
+        sys.exit(1)
+
+    for path in sys.argv[1:]:
+        transactions = read_transactions(Path(path))
+        categories = [categorize_transaction(tx.description) for tx in transactions]
+
+        print(f"\n{Path(path).name}: {len(transactions)} transactions")
+        for category, count in Counter(categories).most_common():
+            print(f"  {category:<12} {count:>5}")
+
+        changed = [(tx, category) for tx, category in zip(transactions, categories) if tx.type != category]
+        print(f"  {len(changed)} rows differ from the stored Transaction Type")
+        for tx, category in changed[:20]:
+            print(f"    {tx.date} {tx.type:<10} -> {category:<10} {tx.description[:60]}")
+
+    info = CHASE_CATEGORIES.memo_info()
+    print(f"\nMemo: {info.hits} hits, {info.misses} misses ({info.currsize} distinct descriptions)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+One-pass anchor index for the pages of a Chase multi-account statement.
+
+A single combined regex is run over a page with finditer and records the
+character offset (and captured value) of every anchor the section logic
+needs:
+
+- summary      CHECKING SUMMARY (an account section starts here)
+- detail       TRANSACTION DETAIL
+- total        CHASE TOTAL CHECKING (the 8619 section)
+- beginning    Beginning Balance, with the $ amount when printed
+- ending       Ending Balance, with the $ amount when printed
+- account      full account number or "Account ending in ...NNNN"
+- continued    (continued)
+- fee          Monthly Service Fee amount
+- dated        a line starting with MM/DD
+
+Section boundaries and shared-page splits then become offset lookups
+instead of repeated substring searches and slicing of the page text.
+"""
+
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+# Full account numbers printed in the CHECKING SUMMARY, by last 4 digits
+ACCOUNT_NUMBERS = {
+    '2084': '000000837532084',
+    '1873': '000000526021873',
+    '8619': '000001248068619',
+}
+
+# Each alternative is one named group, so match.lastgroup is the anchor kind.
+# "CHECKING" after CHASE TOTAL is only looked ahead at, so a glued
+# "CHASE TOTAL CHECKING SUMMARY" still yields a summary anchor.
+ANCHOR_RE = re.compile(
+    r'(?P<summary>CHECKING SUMMARY)'
+    r'|(?P<detail>TRANSACTION DETAIL)'
+    r'|(?P<total>CHASE TOTAL (?=CHECKING))'
+    r'|(?P<beginning>Beginning Balance(?:\s*\$(?P<beginning_amount>[0-9,]+\.\d{2}))?)'
+    r'|(?P<ending>Ending Balance(?:\s*\$(?P<ending_amount>[0-9,]+\.\d{2}))?)'
+    r'|(?P<account>' + '|'.join(ACCOUNT_NUMBERS.values())
+    + r'|Account ending in \.\.\.(?:' + '|'.join(ACCOUNT_NUMBERS) + r'))'
+    r'|(?P<continued>\(continued\))'
+    r'|(?P<fee>Monthly Service Fee(?:\s*-\s*(?P<fee_amount>\d+\.\d{2}))?)'
+    r'|(?P<dated>^[ \t]*\d{2}/\d{2}\s)',
+    re.MULTILINE
+)
+
+# Anchor kinds whose value is a captured amount
+AMOUNT_GROUPS = {'beginning': 'beginning_amount', 'ending': 'ending_amount', 'fee': 'fee_amount'}
+
+
+class PageAnchors:
+    """Offsets and values of every anchor on one page, from a single scan."""
+
+    def __init__(self, text: str):
+        self.length = len(text)
+        self.anchors: Dict[str, List[Tuple[int, Optional[str]]]] = {}
+        for match in ANCHOR_RE.finditer(text):
+            kind = match.lastgroup
+            if kind in AMOUNT_GROUPS:
+                value = match.group(AMOUNT_GROUPS[kind])
+            elif kind == 'account':
+                value = match.group()[-4:]
+            else:
+                value = None
+            self.anchors.setdefault(kind, []).append((match.start(), value))
+
+    def has(self, kind: str) -> bool:
+        """Whether the page contains an anchor of this kind."""
+        return kind in self.anchors
+
+    def first(self, kind: str) -> Optional[int]:
+        """Offset of the first anchor of this kind, or None."""
+        found = self.anchors.get(kind)
+        return found[0][0] if found else None
+
+    def value(self, kind: str, after: int = 0) -> Optional[str]:
+        """First captured value of this kind at or after an offset, or None."""
+        for offset, value in self.anchors.get(kind, ()):
+            if offset >= after and value is not None:
+                return value
+        return None
+
+    def accounts_between(self, start: int, end: int) -> Set[str]:
+        """Last 4 digits of the account numbers printed in [start, end)."""
+        return {value for offset, value in self.anchors.get('account', ()) if start <= offset < end}
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Single-pass line lexer and transaction state machine for Chase statement text.
+
+Each line is classified exactly once with precompiled patterns:
+
+- BLANK        empty line
+- DATED        "MM/DD description [amount [balance]]" - starts a transaction
+- DATE_PREFIX  starts with MM/DD but cannot start a transaction (or is a
+               dated header line); ends any pending multi-line transaction
+- TAIL         line ending in an amount (optionally followed by the running
+               balance) - completes a pending multi-line transaction
+- NOISE        concatenated date/amount debris such as "1/17/202556831.91"
+- TEXT         anything else - description continuation
+
+parse_tokens() then builds transactions from the token stream without ever
+rescanning a line.
+
+For a whole account section, strip_page_furniture() first turns the pages
+into one continuous stream: repeated page headers and footers are dropped
+and boilerplate glued onto the last line of a page is cut off, so a
+transaction split across a page break parses like any other.
+"""
+
+import re
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+BLANK, DATED, DATE_PREFIX, TAIL, NOISE, TEXT = range(6)
+
+# MM/DD at line start, optionally followed by the rest of the line
+DATE_RE = re.compile(r'^(\d{2}/\d{2})(?:\s+(.+))?')
+# A second date repeated at the start of the description
+LEADING_DATE_RE = re.compile(r'^\d{2}/\d{2}\s+')
+# Amount (with optional "- " sign) and optional running balance at line end
+AMOUNT_RE = re.compile(r'(-?\s*[0-9,]+\.\d{2})(?:\s+([0-9,]+\.\d{2}))?\s*$')
+# Page and section headers that never start a transaction
+HEADER_RE = re.compile(r'TRANSACTION DETAIL|CHECKING SUMMARY|DATE DESCRIPTION|AMOUNT BALANCE')
+# Concatenated date/amount debris from the PDF text layer
+NOISE_RE = re.compile(r'^\d{1,2}/\d{1,2}/\d{4}\d+')
+TRAILING_DASH_RE = re.compile(r'\s*-\s*$')
+# Page boilerplate PyPDF2 glues onto the end of the last line of a page
+GLUED_FURNITURE_RE = re.compile(
+    r'TRANSACTION DETAIL|CHECKING SUMMARY|CHASE PREMIER PLUS CHECKING|CHASE TOTAL CHECKING|\*start\*|\*end\*'
+)
+# Lines that only repeat page headers/footers
+PAGE_FURNITURE_RE = re.compile(
+    r'^(?:\*start\*|\*end\*|\(continued\)|\d+\s+\d+\s+Pageof|DATE DESCRIPTION|AMOUNT\b|Primary Account:'
+    r'|\d{12,}$|[A-Z][a-z]+ \d{2}, \d{4}\s*through)'
+)
+
+# (kind, date, text, amount, balance)
+Token = Tuple[int, Optional[str], str, Optional[str], Optional[str]]
+# (date, description, amount, balance, multiline)
+ParsedTransaction = Tuple[str, str, str, Optional[str], bool]
+
+
+def classify_line(raw_line: str) -> Token:
+    """Classify one line of statement text."""
+    line = raw_line.strip()
+    if not line:
+        return (BLANK, None, line, None, None)
+
+    # Cheap character checks keep the regexes off most non-transaction lines
+    date_match = DATE_RE.match(line) if line[0].isdigit() else None
+    if date_match:
+        rest = date_match.group(2)
+        if rest is None or HEADER_RE.search(line):
+            return (DATE_PREFIX, None, line, None, None)
+
+        rest = rest.strip()
+        if LEADING_DATE_RE.match(rest):
+            rest = LEADING_DATE_RE.sub('', rest)
+
+        amount_match = AMOUNT_RE.search(rest)
+        if amount_match:
+            return (DATED, date_match.group(1), rest[:amount_match.start()],
+                    amount_match.group(1), amount_match.group(2))
+        return (DATED, date_match.group(1), rest, None, None)
+
+    # Stripped lines ending in an amount always end in a digit
+    amount_match = AMOUNT_RE.search(line) if line[-1].isdigit() else None
+    if amount_match:
+        return (TAIL, None, line[:amount_match.start()].strip(),
+                amount_match.group(1), amount_match.group(2))
+
+    if line[0].isdigit() and NOISE_RE.match(line):
+        return (NOISE, None, line, None, None)
+    return (TEXT, None, line, None, None)
+
+
+def strip_page_furniture(lines: Iterable[str]) -> Iterator[str]:
+    """Drop page headers/footers so an account section reads as one stream."""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        # "... - 44.96 12,300.46 CHASE PREMIER PLUS CHECKING" -> keep the transaction
+        glued = GLUED_FURNITURE_RE.search(line)
+        if glued:
+            line = line[:glued.start()].rstrip()
+            if not line:
+                continue
+
+        if PAGE_FURNITURE_RE.match(line):
+            continue
+        yield line
+
+
+def tokenize(lines: Iterable[str]) -> Iterator[Token]:
+    """Classify every line exactly once."""
+    for line in lines:
+        yield classify_line(line)
+
+
+def _clean_amount(amount: str) -> str:
+    return amount.replace(' ', '').replace(',', '')
+
+
+def _clean_balance(balance: Optional[str]) -> Optional[str]:
+    return balance.replace(',', '') if balance is not None else None
+
+
+def parse_tokens(tokens: Iterable[Token]) -> Iterator[ParsedTransaction]:
+    """Build transactions from a token stream.
+
+    Yields (MM/DD date, description, amount, balance, multiline). Amounts are
+    cleaned numeric strings ("-35.00"); balance is None when not printed.
+    A multi-line transaction still pending when the next dated line (or the
+    end of the stream) arrives is dropped, matching the original parser.
+    """
+    pending_date = None
+    pending_parts: List[str] = []
+
+    for kind, date, text, amount, balance in tokens:
+        if pending_date is not None:
+            if kind == TAIL:
+                if text and text != '-':
+                    pending_parts.append(text)
+                description = TRAILING_DASH_RE.sub('', ' '.join(pending_parts).strip())
+                yield (pending_date, description, _clean_amount(amount),
+                       _clean_balance(balance), True)
+                pending_date = None
+                continue
+            elif kind == TEXT:
+                if text != '-':
+                    pending_parts.append(text)
+                continue
+            elif kind in (BLANK, NOISE):
+                continue
+            # A new dated line ends the pending transaction without an amount
+            pending_date = None
+
+        if kind != DATED:
+            continue
+
+        if amount is not None:
+            description = TRAILING_DASH_RE.sub('', text.strip())
+            yield (date, description, _clean_amount(amount), _clean_balance(balance), False)
+        else:
+            pending_date = date
+            pending_parts = [text]
+
+
+def parse_lines(lines: Iterable[str]) -> Iterator[ParsedTransaction]:
+    """Tokenize and parse lines of statement text in one pass."""
+    return parse_tokens(tokenize(lines))
+
+
+def parse_section(lines: Iterable[str]) -> Iterator[ParsedTransaction]:
+    """Parse the concatenated lines of every page of an account section."""
+    return parse_tokens(tokenize(strip_page_furniture(lines)))
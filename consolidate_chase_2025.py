@@ -1,21 +1,30 @@
 #!/usr/bin/env python3
 """
 Consolidate all 2025 Chase monthly files into annual consolidated files.
+
+The monthly files are merged by date as lazy streams (monthly_merge) and
+the annual file is written row by row, so memory does not grow with the
+year.
 """
 
-import pandas as pd
+import csv
 from pathlib import Path
 
+from money import format_dollars
+from monthly_files import CSV_FIELDNAMES
+from monthly_manifest import MonthlyManifest
+from monthly_merge import merge_by_date, month_rows
+
 def consolidate_account(account: str, year: int = 2025):
-    """Consolidate monthly files for a specific account."""
+    """Consolidate monthly files for a specific account; return the row count."""
     
     # Paths
     monthly_dir = Path(f"accounts/Chase {account}/{year}/monthly")
     consolidated_dir = Path(f"accounts/Chase {account}/{year}/consolidated")
     consolidated_dir.mkdir(parents=True, exist_ok=True)
     
-    # Find all monthly files
-    monthly_files = sorted(monthly_dir.glob(f"chase_{account}_{year}-*.csv"))
+    # One authoritative file per month ([VALIDATED] > highest [vN] > unversioned)
+    monthly_files = MonthlyManifest.load(monthly_dir).authoritative_files()
     
     if not monthly_files:
         print(f"No monthly files found for Chase {account}")
@@ -24,38 +33,40 @@ def consolidate_account(account: str, year: int = 2025):
     print(f"\nConsolidating Chase {account}:")
     print(f"Found {len(monthly_files)} monthly files")
     
-    # Read and combine all files
-    all_transactions = []
-    
+    # Open every month as a date-ordered stream
+    streams = []
     for file in monthly_files:
-        print(f"  Reading {file.name}")
-        df = pd.read_csv(file)
-        all_transactions.append(df)
-    
-    # Combine all dataframes
-    consolidated_df = pd.concat(all_transactions, ignore_index=True)
-    
-    # Sort by transaction date
-    consolidated_df['Transaction Date'] = pd.to_datetime(consolidated_df['Transaction Date'])
-    consolidated_df = consolidated_df.sort_values('Transaction Date')
+        rows, was_sorted = month_rows(file)
+        print(f"  Reading {file.name}" + ("" if was_sorted else " (not in date order; sorted in memory)"))
+        streams.append(rows)
     
     # Output file
     output_file = consolidated_dir / f"{year} - Chase {account}.csv"
-    consolidated_df.to_csv(output_file, index=False)
     
-    print(f"  Consolidated {len(consolidated_df)} transactions")
+    # Merge by transaction date (ties keep statement order) and write row by row
+    total_credits = total_debits = count = 0
+    with open(output_file, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_FIELDNAMES)
+        for tx in merge_by_date(streams):
+            writer.writerow(tx.to_row())
+            count += 1
+            if tx.amount_cents > 0:
+                total_credits += tx.amount_cents
+            else:
+                total_debits += tx.amount_cents
+    
+    print(f"  Consolidated {count} transactions")
     print(f"  Saved to: {output_file}")
     
-    # Summary statistics
-    total_credits = consolidated_df[consolidated_df['Amount'] > 0]['Amount'].sum()
-    total_debits = consolidated_df[consolidated_df['Amount'] < 0]['Amount'].sum()
+    # Summary statistics (summed exactly in cents)
     net_change = total_credits + total_debits
     
-    print(f"  Total credits: ${total_credits:,.2f}")
-    print(f"  Total debits: ${total_debits:,.2f}")
-    print(f"  Net change: ${net_change:,.2f}")
+    print(f"  Total credits: {format_dollars(total_credits)}")
+    print(f"  Total debits: {format_dollars(total_debits)}")
+    print(f"  Net change: {format_dollars(net_change)}")
     
-    return consolidated_df
+    return count
 
 def main():
     """Consolidate all Chase accounts."""
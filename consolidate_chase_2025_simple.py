@@ -5,74 +5,195 @@ Uses standard library only.
 """
 
 import csv
+import json
+import os
+import shutil
+import sys
 from pathlib import Path
 from datetime import datetime
 
-def consolidate_account(account: str, year: int = 2025):
-    """Consolidate monthly files for a specific account."""
+from money import format_dollars
+from monthly_files import CSV_FIELDNAMES
+from monthly_manifest import MonthlyManifest
+from monthly_merge import merge_by_date, month_rows
+from pdf_text import file_sha256
+from statement_overlap import OverlapFilter
+from transaction import iter_transactions
+from transfer_pairing import pair_transfers, print_transfer_report, transfer_leg
+
+# Per-account record of what the consolidated file was built from
+STATE_NAME = 'consolidation_state.json'
+
+
+def consolidate_account(account: str, year: int = 2025, incremental: bool = True):
+    """Consolidate monthly files for a specific account; return its transfer rows.
+    
+    Returns None when the account has no monthly files to consolidate.
+    
+    The monthly files are merged by date as streams and the annual file is
+    written row by row. Incrementally, the content hash of every month's
+    file is compared with the last run: nothing is re-read when no month
+    changed, and otherwise rows of the months before the first changed one
+    are streamed from the previous consolidated file and only the later
+    months are re-read. The output matches a full rebuild, and files whose
+    bytes would not change are not rewritten.
+    """
     
     # Paths
     monthly_dir = Path(f"accounts/Chase {account}/{year}/monthly")
     consolidated_dir = Path(f"accounts/Chase {account}/{year}/consolidated")
     consolidated_dir.mkdir(parents=True, exist_ok=True)
     
-    # Find all monthly files
-    monthly_files = sorted(monthly_dir.glob(f"chase_{account}_{year}-*.csv"))
+    # One authoritative file per month ([VALIDATED] > highest [vN] > unversioned)
+    manifest = MonthlyManifest.load(monthly_dir)
+    months = sorted(manifest.months)
     
-    if not monthly_files:
+    if not months:
         print(f"No monthly files found for Chase {account}")
-        return
+        return None
         
     print(f"\nConsolidating Chase {account}:")
-    print(f"Found {len(monthly_files)} monthly files")
+    print(f"Found {len(months)} monthly files")
     
-    # Read all transactions
-    all_transactions = []
-    fieldnames = None
+    # Output files
+    output_file = consolidated_dir / f"{year} - Chase {account}.csv"
+    precompiled_file = Path(f"accounts/Chase {account}/extracted_precompiled/{year} - Chase {account}.csv")
+    state_file = consolidated_dir / STATE_NAME
     
-    for file in monthly_files:
-        print(f"  Reading {file.name}")
-        with open(file, 'r', newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            if fieldnames is None:
-                fieldnames = reader.fieldnames
-            for row in reader:
-                all_transactions.append(row)
+    month_hashes = {month: file_sha256(manifest.authoritative(month)) for month in months}
+    output_sha256 = file_sha256(output_file) if output_file.exists() else None
+    state = {}
+    if incremental and state_file.exists() and output_sha256:
+        state = json.loads(state_file.read_text())
+        if state.get('output_sha256') != output_sha256 or 'statement_months' not in state:
+            state = {}  # The consolidated file was edited since; rebuild it
     
-    # Sort by transaction date
-    all_transactions.sort(key=lambda x: x['Transaction Date'])
+    previous = state.get('months', {})
+    first_changed = next((month for month in sorted(set(months) | set(previous))
+                          if previous.get(month) != month_hashes.get(month)), None)
     
-    # Output file
-    output_file = consolidated_dir / f"{year} - Chase {account}.csv"
+    totals = {'credits': 0, 'debits': 0, 'count': 0}
+    transfers = []
     
-    # Write consolidated file
-    with open(output_file, 'w', newline='') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(all_transactions)
+    if state and first_changed is None:
+        print(f"  No monthly file changed; {output_file} is up to date")
+        for tx in iter_transactions(output_file):
+            _tally(tx, totals, transfers)
+    else:
+        # Rows of unchanged months before the first change are already merged.
+        # A statement id found in several monthly files moves the boundary
+        # back to the earliest of them, so none of its rows is half reused;
+        # that can catch another statement, so repeat until it holds still.
+        previous_statements = state.get('statement_months', {})
+        boundary = first_changed if state else months[0]
+        moved = True
+        while moved:
+            moved = False
+            for id_months in previous_statements.values():
+                if max(id_months) >= boundary > min(id_months):
+                    boundary = min(id_months)
+                    moved = True
+        reuse = [month for month in months if month < boundary]
+        reused = {statement_id for statement_id, id_months in previous_statements.items()
+                  if max(id_months) < boundary}
+        
+        # Statement id -> months whose files hold it, for the next run
+        statement_months = {statement_id: list(previous_statements[statement_id]) for statement_id in reused}
+        streams = []
+        if reuse:
+            print(f"  Reusing rows of {len(reuse)} unchanged months")
+            streams.append(tx for tx in iter_transactions(output_file) if tx.statement_id in reused)
+        
+        # Read the remaining months, each as a date-ordered stream
+        for month in months:
+            if month in reuse:
+                continue
+            file = manifest.authoritative(month)
+            rows, was_sorted = month_rows(file)
+            print(f"  Reading {file.name}" + ("" if was_sorted else " (not in date order; sorted in memory)"))
+            streams.append(_note_statement_ids(rows, month, statement_months))
+        
+        # Merge by date and write row by row; rows that reached two monthly
+        # files through overlapping statement periods are dropped
+        overlap = OverlapFilter(date_ordered=True)
+        duplicates = 0
+        tmp_file = output_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(CSV_FIELDNAMES)
+            for tx in merge_by_date(streams):
+                if tx.statement_id in reused:
+                    overlap.add_kept(tx)
+                elif not overlap.keep(tx):
+                    duplicates += 1
+                    continue
+                writer.writerow(tx.to_row())
+                _tally(tx, totals, transfers)
+        if duplicates:
+            print(f"  Dropped {duplicates} rows already supplied by another statement")
+        
+        # Keep files whose bytes would not change
+        new_sha256 = file_sha256(tmp_file)
+        if new_sha256 == output_sha256:
+            os.remove(tmp_file)
+            print(f"  Unchanged: {output_file}")
+        else:
+            os.replace(tmp_file, output_file)
+            print(f"  Saved to: {output_file}")
+        state_file.write_text(json.dumps({'months': month_hashes, 'statement_months': statement_months,
+                                          'output_sha256': new_sha256}, indent=2, sort_keys=True))
     
-    print(f"  Consolidated {len(all_transactions)} transactions")
-    print(f"  Saved to: {output_file}")
+    if not precompiled_file.exists() or file_sha256(precompiled_file) != file_sha256(output_file):
+        precompiled_file.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(output_file, precompiled_file)
+        print(f"  Copied to: {precompiled_file}")
     
-    # Summary statistics
-    total_credits = sum(float(tx['Amount']) for tx in all_transactions if float(tx['Amount']) > 0)
-    total_debits = sum(float(tx['Amount']) for tx in all_transactions if float(tx['Amount']) < 0)
-    net_change = total_credits + total_debits
+    print(f"  Consolidated {totals['count']} transactions")
     
-    print(f"  Total credits: ${total_credits:,.2f}")
-    print(f"  Total debits: ${total_debits:,.2f}")
-    print(f"  Net change: ${net_change:,.2f}")
+    # Summary statistics (summed exactly in cents)
+    print(f"  Total credits: {format_dollars(totals['credits'])}")
+    print(f"  Total debits: {format_dollars(totals['debits'])}")
+    print(f"  Net change: {format_dollars(totals['credits'] + totals['debits'])}")
+    
+    return transfers
+
+
+def _note_statement_ids(rows, month, statement_months):
+    """Pass rows through, recording which month's file each statement id came from."""
+    for tx in rows:
+        id_months = statement_months.setdefault(tx.statement_id, [])
+        if month not in id_months:
+            id_months.append(month)
+        yield tx
+
+
+def _tally(tx, totals, transfers):
+    """Add a written row to the running totals; keep it if it is a transfer."""
+    totals['credits' if tx.amount_cents > 0 else 'debits'] += tx.amount_cents
+    totals['count'] += 1
+    if transfer_leg(tx) is not None:
+        transfers.append(tx)
 
 def main():
-    """Consolidate all Chase accounts."""
+    """Consolidate all Chase accounts (--full rebuilds every month)."""
+    incremental = '--full' not in sys.argv
     
     print("Consolidating Chase 2025 statements")
     print("=" * 50)
     
     accounts = ['2084', '1873', '8619']
     
+    transfers = []
+    consolidated = []
     for account in accounts:
-        consolidate_account(account)
+        rows = consolidate_account(account, incremental=incremental)
+        if rows is not None:
+            consolidated.append(account)
+            transfers.extend(rows)
+    
+    # Both legs of every transfer between the consolidated accounts, including
+    # those that had no transfer rows of their own
+    print_transfer_report(pair_transfers(transfers, consolidated))
     
     print("\nConsolidation complete!")
 
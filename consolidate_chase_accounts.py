@@ -5,6 +5,8 @@ import csv
 import os
 from pathlib import Path
 
+from monthly_manifest import MonthlyManifest
+
 def consolidate_account(account_number, year=2025):
     """Consolidate monthly CSV files for a Chase account into an annual file."""
     
@@ -21,11 +23,12 @@ def consolidate_account(account_number, year=2025):
     all_transactions = []
     months_found = []
     
-    # Read all monthly files
+    # Read the authoritative file of each month
+    manifest = MonthlyManifest.load(monthly_dir)
     for month in range(1, 13):  # 1-12
-        monthly_file = monthly_dir / f"chase_{account_number}_{year}-{month:02d}_transactions.csv"
+        monthly_file = manifest.authoritative(f"{year}-{month:02d}")
         
-        if monthly_file.exists():
+        if monthly_file is not None:
             months_found.append(month)
             with open(monthly_file, 'r') as f:
                 reader = csv.DictReader(f)
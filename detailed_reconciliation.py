@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 import re
-import csv
-from datetime import datetime
+from pathlib import Path
+
+from money import format_dollars, parse_cents
+from transaction import Transaction, read_transactions
+from transaction_matcher import match_transactions
 
 def extract_all_pdf_transactions(pdf_text):
     """Extract all transactions from PDF text with improved parsing"""
@@ -80,90 +83,72 @@ def extract_all_pdf_transactions(pdf_text):
     return pdf_transactions_raw
 
 def load_csv_transactions(csv_path):
-    """Load and normalize CSV transactions"""
-    transactions = []
-    with open(csv_path, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row['Amount']:
-                # Convert date from YYYY-MM-DD to MM/DD
-                date = datetime.strptime(row['Transaction Date'], '%Y-%m-%d')
-                transactions.append({
-                    'date': date.strftime('%m/%d'),
-                    'description': row['Description'].strip(),
-                    'amount': float(row['Amount'])
-                })
-    return transactions
+    """Load CSV transactions"""
+    return read_transactions(Path(csv_path))
+
+def statement_transactions(pdf_transactions_raw, year=2025):
+    """Turn (MM/DD, description, amount) tuples into Transactions"""
+    return [
+        Transaction(f"{year}-{date.replace('/', '-')}", desc, parse_cents(amount), '')
+        for date, desc, amount in pdf_transactions_raw
+    ]
 
 # Load data
 csv_path = '/Users/rodolfoalvarez/Documents/Better Systems AI/Nancy Bennet  - Bank Staments Automation/bank-statement-analyzer/accounts/Chase 1873/2025/monthly/chase_1873_2025-02_transactions.csv'
 csv_transactions = load_csv_transactions(csv_path)
-pdf_transactions = extract_all_pdf_transactions("")
+pdf_transactions = statement_transactions(extract_all_pdf_transactions(""))
 
 print("DETAILED RECONCILIATION ANALYSIS")
 print("=" * 80)
 
-# Compare transactions
-missing_transactions = []
-total_missing = 0
-
-for pdf_date, pdf_desc, pdf_amount in pdf_transactions:
-    # Try to find matching transaction in CSV
-    found = False
-    
-    for csv_trans in csv_transactions:
-        # Check if dates match and amounts are close
-        if csv_trans['date'] == pdf_date and abs(csv_trans['amount'] - pdf_amount) < 0.01:
-            # Check if description has some common words
-            pdf_words = set(pdf_desc.lower().split())
-            csv_words = set(csv_trans['description'].lower().split())
-            
-            # If there's significant overlap in description, consider it a match
-            if len(pdf_words & csv_words) >= 2:
-                found = True
-                break
-    
-    if not found:
-        missing_transactions.append((pdf_date, pdf_desc, pdf_amount))
-        total_missing += pdf_amount
+# Compare transactions: same amount, dates within a few days, shared description words
+result = match_transactions(pdf_transactions, csv_transactions)
+missing_transactions = result['missing']
+total_missing = sum(tx.amount_cents for tx in missing_transactions)
 
 print(f"Total PDF transactions: {len(pdf_transactions)}")
 print(f"Total CSV transactions: {len(csv_transactions)}")
+print(f"Matched transactions: {len(result['matched'])}")
 print(f"Missing transactions: {len(missing_transactions)}")
 print(f"\nMISSING TRANSACTIONS:")
 print("-" * 80)
 
-for date, desc, amount in missing_transactions:
-    print(f"{date} | {desc[:60]:<60} | ${amount:>10,.2f}")
+for tx in missing_transactions:
+    print(f"{tx.date[5:]} | {tx.description[:60]:<60} | {format_dollars(tx.amount_cents):>11}")
 
 print("-" * 80)
-print(f"Total missing amount: ${total_missing:,.2f}")
+print(f"Total missing amount: {format_dollars(total_missing)}")
+
+if result['extra']:
+    print(f"\nCSV TRANSACTIONS NOT ON THE STATEMENT ({len(result['extra'])}):")
+    for tx in result['extra']:
+        print(f"{tx.date[5:]} | {tx.description[:60]:<60} | {format_dollars(tx.amount_cents):>11}")
 
 # Verify reconciliation
-beginning_balance = 16087.31
-ending_balance = 528.22
+beginning_balance = 1608731
+ending_balance = 52822
 expected_change = ending_balance - beginning_balance
 
-csv_total = sum(t['amount'] for t in csv_transactions)
+csv_total = sum(tx.amount_cents for tx in csv_transactions)
 
 print(f"\nRECONCILIATION SUMMARY:")
-print(f"Beginning Balance: ${beginning_balance:,.2f}")
-print(f"Expected Ending Balance: ${ending_balance:,.2f}")
-print(f"Expected Change: ${expected_change:,.2f}")
-print(f"\nCSV Total: ${csv_total:,.2f}")
-print(f"Missing Transactions Total: ${total_missing:,.2f}")
-print(f"CSV + Missing: ${csv_total + total_missing:,.2f}")
-print(f"\nDifference from expected: ${(csv_total + total_missing) - expected_change:,.2f}")
+print(f"Beginning Balance: {format_dollars(beginning_balance)}")
+print(f"Expected Ending Balance: {format_dollars(ending_balance)}")
+print(f"Expected Change: {format_dollars(expected_change)}")
+print(f"\nCSV Total: {format_dollars(csv_total)}")
+print(f"Missing Transactions Total: {format_dollars(total_missing)}")
+print(f"CSV + Missing: {format_dollars(csv_total + total_missing)}")
+print(f"\nDifference from expected: {format_dollars((csv_total + total_missing) - expected_change)}")
 
 # Group missing by type
 print(f"\nMISSING TRANSACTIONS BY TYPE:")
-feb_missing = [(d, desc, amt) for d, desc, amt in missing_transactions if d.startswith('02/')]
-jan_missing = [(d, desc, amt) for d, desc, amt in missing_transactions if d.startswith('01/')]
+feb_missing = [tx for tx in missing_transactions if tx.date[5:7] == '02']
+jan_missing = [tx for tx in missing_transactions if tx.date[5:7] == '01']
 
-print(f"\nJanuary missing ({len(jan_missing)} transactions): ${sum(amt for _, _, amt in jan_missing):,.2f}")
-for date, desc, amt in jan_missing:
-    print(f"  {date} {desc[:50]:<50} ${amt:>10,.2f}")
+print(f"\nJanuary missing ({len(jan_missing)} transactions): {format_dollars(sum(tx.amount_cents for tx in jan_missing))}")
+for tx in jan_missing:
+    print(f"  {tx.date[5:]} {tx.description[:50]:<50} {format_dollars(tx.amount_cents):>11}")
 
-print(f"\nFebruary missing ({len(feb_missing)} transactions): ${sum(amt for _, _, amt in feb_missing):,.2f}")
-for date, desc, amt in feb_missing:
-    print(f"  {date} {desc[:50]:<50} ${amt:>10,.2f}")
\ No newline at end of file
+print(f"\nFebruary missing ({len(feb_missing)} transactions): {format_dollars(sum(tx.amount_cents for tx in feb_missing))}")
+for tx in feb_missing:
+    print(f"  {tx.date[5:]} {tx.description[:50]:<50} {format_dollars(tx.amount_cents):>11}")
@@ -4,10 +4,12 @@ Extract Chase 1873 February 2025 with ALL transactions including those on page 5
 """
 
 import PyPDF2
-import re
 import csv
 from pathlib import Path
 
+from categorizer import categorize_transaction, is_credit
+from chase_lexer import parse_section
+
 def extract_february_1873():
     """Extract all transactions for account 1873 in February 2025."""
     
@@ -16,42 +18,19 @@ def extract_february_1873():
     with open(pdf_path, 'rb') as file:
         pdf_reader = PyPDF2.PdfReader(file)
         
-        all_transactions = []
-        
-        # Page 3 - Start of account 1873
-        page3_text = pdf_reader.pages[2].extract_text()
-        page3_transactions = extract_transactions_from_text(page3_text, stop_at="TRANSACTION DETAIL")
-        all_transactions.extend(page3_transactions)
-        print(f"Page 3: Found {len(page3_transactions)} transactions")
-        
-        # Page 4 - Continuation of account 1873
-        page4_text = pdf_reader.pages[3].extract_text()
-        page4_transactions = extract_transactions_from_text(page4_text, stop_at=None)
-        all_transactions.extend(page4_transactions)
-        print(f"Page 4: Found {len(page4_transactions)} transactions")
+        # Pages 3-5 hold account 1873; page 5 ends where CHASE TOTAL CHECKING (8619) starts
+        section_pages = []
+        for page_index in (2, 3, 4):
+            page_text = pdf_reader.pages[page_index].extract_text()
+            if 'CHASE TOTAL CHECKING' in page_text:
+                page_text = page_text[:page_text.find('CHASE TOTAL CHECKING')]
+            section_pages.append(page_text)
         
-        # Page 5 - End of account 1873 (stop at CHASE TOTAL CHECKING)
-        page5_text = pdf_reader.pages[4].extract_text()
-        # Extract only the part before CHASE TOTAL CHECKING
-        if 'CHASE TOTAL CHECKING' in page5_text:
-            split_index = page5_text.find('CHASE TOTAL CHECKING')
-            page5_text = page5_text[:split_index]
-        page5_transactions = extract_transactions_from_text(page5_text, stop_at=None)
-        all_transactions.extend(page5_transactions)
-        print(f"Page 5: Found {len(page5_transactions)} transactions")
-        
-        # Also check for the missing Buttercup transaction
-        if not any('Buttercup' in t['description'] for t in all_transactions):
-            # It might be at a page boundary - check end of page 3
-            buttercup_match = re.search(r'01/17.*Buttercup.*?([0-9,]+\.\d{2})', page3_text)
-            if buttercup_match:
-                all_transactions.insert(13, {  # Insert after 01/16 transactions
-                    'date': '2025-01-17',
-                    'description': 'Card Purchase           01/15 Buttercup Concord Concord CA Card 0665',
-                    'amount': -44.96,
-                    'type': 'Debit'
-                })
-                print("Added missing Buttercup transaction from page boundary")
+        # Parse the section as one continuous stream so transactions at page
+        # boundaries (e.g. Buttercup on 01/17) are picked up like any other
+        section_lines = '\n'.join(section_pages).split('\n')
+        all_transactions = extract_transactions_from_lines(section_lines)
+        print(f"Pages 3-5: Found {len(all_transactions)} transactions")
         
         # Sort by date
         all_transactions.sort(key=lambda x: x['date'])
@@ -73,132 +52,30 @@ def extract_february_1873():
         
         return all_transactions
 
-def extract_transactions_from_text(text, stop_at=None):
-    """Extract transactions from text with improved parsing."""
+def extract_transactions_from_lines(lines):
+    """Extract transactions from the continuous line stream of an account section."""
     transactions = []
-    lines = text.split('\n')
     
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        # Skip headers and empty lines
-        if not line or 'TRANSACTION DETAIL' in line or 'DATE DESCRIPTION' in line:
-            i += 1
+    for date_str, description, amount_str, balance_str, multiline in parse_section(lines):
+        if balance_str is None:
+            # Only lines carrying a running balance are transaction detail rows
             continue
             
-        # Stop if we hit the stop marker
-        if stop_at and stop_at in line:
-            break
-            
-        # Look for transaction lines starting with MM/DD
-        date_match = re.match(r'^(\d{2}/\d{2})\s+(.+)', line)
-        if date_match:
-            date_str = date_match.group(1)
-            rest_of_line = date_match.group(2)
-            
-            # Special handling for online transfer with duplicate date
-            if re.match(r'^\d{2}/\d{2}\s+Online Transfer', rest_of_line):
-                rest_of_line = re.sub(r'^\d{2}/\d{2}\s+', '', rest_of_line)
+        amount = float(amount_str)
+        
+        # Adjust sign - amounts are positive in PDF but need to be negative for debits
+        if amount > 0 and not is_credit(description):
+            amount = -amount
             
-            # Look for amount at end (might have negative sign with space)
-            amount_match = re.search(r'(-?\s*[0-9,]+\.\d{2})\s+[0-9,]+\.\d{2}\s*$', rest_of_line)
-            if amount_match:
-                amount_str = amount_match.group(1).replace(' ', '').replace(',', '')
-                description = rest_of_line[:amount_match.start()].strip()
-                amount = float(amount_str)
-                
-                # Determine transaction type
-                tx_type = categorize_transaction(description)
-                
-                # Adjust sign - amounts are positive in PDF but need to be negative for debits
-                if amount > 0 and not is_credit(description):
-                    amount = -amount
-                    
-                transactions.append({
-                    'date': f"2025-{date_str.replace('/', '-')}",
-                    'description': description,
-                    'amount': amount,
-                    'type': tx_type
-                })
-            else:
-                # Multi-line transaction - collect description
-                description = rest_of_line
-                i += 1
-                
-                while i < len(lines):
-                    next_line = lines[i].strip()
-                    
-                    # Stop if we hit another date
-                    if re.match(r'^\d{2}/\d{2}', next_line):
-                        i -= 1
-                        break
-                        
-                    # Look for amount in this line
-                    amount_match = re.search(r'(-?\s*[0-9,]+\.\d{2})\s+[0-9,]+\.\d{2}\s*$', next_line)
-                    if amount_match:
-                        amount_str = amount_match.group(1).replace(' ', '').replace(',', '')
-                        
-                        # Add any description part before amount
-                        desc_part = next_line[:amount_match.start()].strip()
-                        if desc_part and desc_part != '-':
-                            description += ' ' + desc_part
-                            
-                        amount = float(amount_str)
-                        
-                        # Adjust sign
-                        if amount > 0 and not is_credit(description):
-                            amount = -amount
-                            
-                        transactions.append({
-                            'date': f"2025-{date_str.replace('/', '-')}",
-                            'description': description.strip(),
-                            'amount': amount,
-                            'type': categorize_transaction(description)
-                        })
-                        break
-                    else:
-                        if next_line and next_line != '-':
-                            description += ' ' + next_line
-                    i += 1
-                    
-        i += 1
+        transactions.append({
+            'date': f"2025-{date_str.replace('/', '-')}",
+            'description': description,
+            'amount': amount,
+            'type': categorize_transaction(description)
+        })
         
     return transactions
 
-def is_credit(description):
-    """Check if transaction is a credit."""
-    desc_lower = description.lower()
-    return any(keyword in desc_lower for keyword in [
-        'deposit', 'interest payment', 'online transfer from',
-        'cashout', 'from chk', 'credit'
-    ])
-
-def categorize_transaction(desc):
-    """Categorize transaction type."""
-    desc_lower = desc.lower()
-    
-    if 'interest payment' in desc_lower:
-        return 'Interest'
-    elif 'check' in desc_lower and '#' in desc:
-        return 'Check'
-    elif 'card purchase' in desc_lower:
-        return 'Debit'
-    elif 'online payment' in desc_lower:
-        return 'Payment'
-    elif 'online transfer to' in desc_lower:
-        return 'Transfer'
-    elif 'online transfer from' in desc_lower:
-        return 'Deposit'
-    elif 'deposit' in desc_lower:
-        return 'Deposit'
-    elif 'fee' in desc_lower:
-        return 'Fee'
-    elif 'venmo' in desc_lower:
-        return 'Withdrawal'
-    else:
-        return 'Withdrawal'
-
 def save_transactions(transactions):
     """Save transactions to CSV."""
     output_dir = Path("accounts/Chase 1873/2025/monthly")
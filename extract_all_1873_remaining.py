@@ -4,6 +4,7 @@ Extract all remaining Chase 1873 statements (March-June 2025) using the robust e
 """
 
 from extract_chase_robust import ChaseRobustExtractor
+from money import credit_debit_totals, format_dollars, parse_cents
 from pathlib import Path
 
 def main():
@@ -47,21 +48,20 @@ def main():
             # Store results
             if '1873' in extractor.account_sections:
                 info = extractor.account_sections['1873']
-                total_credits = sum(t['amount'] for t in info['transactions'] if t['amount'] > 0)
-                total_debits = sum(t['amount'] for t in info['transactions'] if t['amount'] < 0)
+                total_credits, total_debits = credit_debit_totals([t.amount_cents for t in info['transactions']])
                 net_change = total_credits + total_debits
-                expected_ending = info['beginning_balance'] + net_change
+                expected_ending = info['beginning_cents'] + net_change
                 
                 results[month] = {
                     'filename': filename,
                     'transactions': len(info['transactions']),
-                    'beginning': info['beginning_balance'],
-                    'ending': info['ending_balance'],
+                    'beginning': info['beginning_cents'],
+                    'ending': info['ending_cents'],
                     'credits': total_credits,
                     'debits': total_debits,
                     'net_change': net_change,
                     'expected_ending': expected_ending,
-                    'reconciles': abs(expected_ending - info['ending_balance']) < 0.01
+                    'reconciles': expected_ending == info['ending_cents']
                 }
                 
         except Exception as e:
@@ -79,15 +79,15 @@ def main():
         status = "✓" if r['reconciles'] else "✗"
         print(f"\nMonth {month}/2025: {status}")
         print(f"  Transactions: {r['transactions']}")
-        print(f"  Beginning: ${r['beginning']:,.2f}")
-        print(f"  Credits: ${r['credits']:,.2f}")
-        print(f"  Debits: ${r['debits']:,.2f}")
-        print(f"  Net Change: ${r['net_change']:,.2f}")
-        print(f"  Expected Ending: ${r['expected_ending']:,.2f}")
-        print(f"  Actual Ending: ${r['ending']:,.2f}")
+        print(f"  Beginning: {format_dollars(r['beginning'])}")
+        print(f"  Credits: {format_dollars(r['credits'])}")
+        print(f"  Debits: {format_dollars(r['debits'])}")
+        print(f"  Net Change: {format_dollars(r['net_change'])}")
+        print(f"  Expected Ending: {format_dollars(r['expected_ending'])}")
+        print(f"  Actual Ending: {format_dollars(r['ending'])}")
         if not r['reconciles']:
             diff = abs(r['expected_ending'] - r['ending'])
-            print(f"  Difference: ${diff:,.2f}")
+            print(f"  Difference: {format_dollars(diff)}")
             all_reconcile = False
             
     print(f"\n{'='*70}")
@@ -102,13 +102,13 @@ def main():
     print(f"{'='*70}")
     
     # February ending should equal March beginning
-    feb_ending = 528.22  # From our successful February extraction
+    feb_ending = parse_cents('528.22')  # From our successful February extraction
     if 3 in results:
         mar_beginning = results[3]['beginning']
-        if abs(feb_ending - mar_beginning) < 0.01:
-            print(f"✓ Feb ending (${feb_ending:,.2f}) = Mar beginning (${mar_beginning:,.2f})")
+        if feb_ending == mar_beginning:
+            print(f"✓ Feb ending ({format_dollars(feb_ending)}) = Mar beginning ({format_dollars(mar_beginning)})")
         else:
-            print(f"✗ Feb ending (${feb_ending:,.2f}) ≠ Mar beginning (${mar_beginning:,.2f})")
+            print(f"✗ Feb ending ({format_dollars(feb_ending)}) ≠ Mar beginning ({format_dollars(mar_beginning)})")
             
     # Check month-to-month continuity
     months = sorted(results.keys())
@@ -119,10 +119,10 @@ def main():
         curr_ending = results[curr_month]['ending']
         next_beginning = results[next_month]['beginning']
         
-        if abs(curr_ending - next_beginning) < 0.01:
-            print(f"✓ Month {curr_month} ending (${curr_ending:,.2f}) = Month {next_month} beginning (${next_beginning:,.2f})")
+        if curr_ending == next_beginning:
+            print(f"✓ Month {curr_month} ending ({format_dollars(curr_ending)}) = Month {next_month} beginning ({format_dollars(next_beginning)})")
         else:
-            print(f"✗ Month {curr_month} ending (${curr_ending:,.2f}) ≠ Month {next_month} beginning (${next_beginning:,.2f})")
+            print(f"✗ Month {curr_month} ending ({format_dollars(curr_ending)}) ≠ Month {next_month} beginning ({format_dollars(next_beginning)})")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -5,13 +5,15 @@ This script properly identifies account sections using CHECKING SUMMARY markers
 and follows (continued) pages correctly.
 """
 
-import PyPDF2
 import re
 import csv
 from pathlib import Path
 from typing import Dict, List, Tuple
 from datetime import datetime
 
+from categorizer import categorize_transaction, is_credit
+from pdf_text import load_pages
+
 class ChaseMultiAccountExtractor:
     """Extract transactions from Chase multi-account PDFs following corrected methodology."""
     
@@ -23,15 +25,8 @@ class ChaseMultiAccountExtractor:
         self.year = 2025
         
     def load_pdf(self):
-        """Load PDF and extract text from all pages."""
-        with open(self.pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page_num in range(len(pdf_reader.pages)):
-                page_text = pdf_reader.pages[page_num].extract_text()
-                self.pages.append({
-                    'page_num': page_num + 1,
-                    'text': page_text
-                })
+        """Load PDF and extract text from all pages (cached by content hash)."""
+        self.pages = load_pages(self.pdf_path)
                 
     def identify_account_sections(self):
         """Identify which pages belong to which account based on CHECKING SUMMARY."""
@@ -121,7 +116,7 @@ class ChaseMultiAccountExtractor:
                     amount = float(amount_str.replace(',', ''))
                     
                     # Determine sign based on description
-                    if self.is_credit(description):
+                    if is_credit(description):
                         pass  # Keep positive
                     else:
                         amount = -amount
@@ -130,7 +125,7 @@ class ChaseMultiAccountExtractor:
                         'date': f"{self.year}-{date_str.replace('/', '-')}",
                         'description': description,
                         'amount': amount,
-                        'type': self.categorize_transaction(description)
+                        'type': categorize_transaction(description)
                     })
                 else:
                     # Transaction might span multiple lines
@@ -153,7 +148,7 @@ class ChaseMultiAccountExtractor:
                                     description += ' ' + desc_part
                                     
                                 # Determine sign
-                                if self.is_credit(description):
+                                if is_credit(description):
                                     pass  # Keep positive
                                 else:
                                     amount = -amount
@@ -162,7 +157,7 @@ class ChaseMultiAccountExtractor:
                                     'date': f"{self.year}-{date_str.replace('/', '-')}",
                                     'description': description,
                                     'amount': amount,
-                                    'type': self.categorize_transaction(description)
+                                    'type': categorize_transaction(description)
                                 })
                                 break
                             else:
@@ -174,42 +169,6 @@ class ChaseMultiAccountExtractor:
             
         return transactions
     
-    def is_credit(self, description: str) -> bool:
-        """Determine if transaction is a credit (positive amount)."""
-        desc_lower = description.lower()
-        credit_keywords = [
-            'deposit', 'interest payment', 'online transfer from',
-            'cashout', 'from chk', 'credit'
-        ]
-        return any(keyword in desc_lower for keyword in credit_keywords)
-    
-    def categorize_transaction(self, desc: str) -> str:
-        """Categorize transaction based on description."""
-        desc_lower = desc.lower()
-        
-        if 'interest payment' in desc_lower:
-            return 'Interest'
-        elif 'check' in desc_lower and '#' in desc:
-            return 'Check'
-        elif 'card purchase' in desc_lower:
-            return 'Debit'
-        elif 'online payment' in desc_lower:
-            return 'Payment'
-        elif 'online transfer to' in desc_lower:
-            return 'Transfer'
-        elif 'online transfer from' in desc_lower:
-            return 'Deposit'
-        elif 'deposit' in desc_lower:
-            return 'Deposit'
-        elif 'fee' in desc_lower:
-            return 'Fee'
-        elif 'venmo' in desc_lower:
-            return 'Withdrawal'
-        elif 'environmental' in desc_lower:
-            return 'Payment'
-        else:
-            return 'Withdrawal'
-    
     def extract_all_accounts(self):
         """Extract transactions for all accounts."""
         self.load_pdf()
@@ -11,66 +11,111 @@ Key improvements:
 6. Ensures Interest Payments and small transactions aren't missed
 """
 
-import PyPDF2
 import re
-import csv
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 from datetime import datetime
 
+from categorizer import categorize_transaction
+from chase_anchors import PageAnchors
+from chase_lexer import DATED, TAIL, parse_lines, parse_section, strip_page_furniture, tokenize
+from gap_solver import explain_gap
+from money import credit_debit_totals, format_dollars, parse_cents
+from monthly_files import monthly_dir
+from monthly_manifest import MonthlyManifest
+from pdf_text import BACKEND, LazyPages, load_pages
+from running_balance import describe_drift, find_first_drift
+from statement_summary import (CHASE_SUMMARY_LABELS, CHASE_SUMMARY_RE, chase_period,
+                               parse_summary_totals, sidecar_path, write_sidecar)
+from transaction import Transaction, write_transactions
+from transaction_store import TransactionStore, store_path
+
 class ChaseRobustExtractor:
     """Extract transactions from Chase multi-account PDFs with comprehensive handling."""
     
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, sha256: str = None, workers: int = 1, backend: str = BACKEND):
         self.pdf_path = pdf_path
+        self.sha256 = sha256  # Content hash, when already computed by the caller
+        self.workers = workers  # Processes used for page text extraction
+        self.backend = backend  # Text backend name (see text_backends)
+        self.output_root = Path('.')  # Folder holding the accounts/ tree
+        self.cache = None  # PageTextCache (None: the default .cache/page_text)
         self.pages = []
+        self.page_anchors = {}  # page_num -> PageAnchors
         self.account_sections = {}
         self.month = None
         self.year = 2025
         
     def load_pdf(self):
-        """Load PDF and extract text from all pages."""
-        with open(self.pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page_num in range(len(pdf_reader.pages)):
-                page_text = pdf_reader.pages[page_num].extract_text()
-                self.pages.append({
-                    'page_num': page_num + 1,
-                    'text': page_text
-                })
+        """Load PDF and extract text from all pages (cached by content hash)."""
+        self.pages = load_pages(self.pdf_path, self.cache, sha256=self.sha256, workers=self.workers,
+                                backend=self.backend)
+        
+    def load_pdf_lazy(self):
+        """Open the PDF without extracting text; pages are parsed on first access."""
+        if self.backend != BACKEND:
+            # Lazy page access is PyPDF2 only
+            self.load_pdf()
+            return
+        self.pages = LazyPages(self.pdf_path, self.cache, sha256=self.sha256)
+        
+    def anchors(self, page_num: int, text: str = None) -> PageAnchors:
+        """Anchor index of a page, built with one scan on first use."""
+        if page_num not in self.page_anchors:
+            if text is None:
+                text = self.pages[page_num - 1]['text']
+            self.page_anchors[page_num] = PageAnchors(text)
+        return self.page_anchors[page_num]
+        
+    def has_transaction_content(self, anchors: PageAnchors) -> bool:
+        """Check whether a continuation page carries transaction detail."""
+        return any(anchors.has(kind) for kind in ('detail', 'continued', 'fee', 'dated'))
                 
-    def identify_account_sections(self):
-        """Identify which pages belong to which account based on CHECKING SUMMARY."""
+    def identify_account_sections(self, target_account: str = None):
+        """Identify which pages belong to which account based on CHECKING SUMMARY.
+        
+        With a target_account, the scan stops as soon as that account's section
+        is complete, so later sections and trailing disclosure pages are never read.
+        """
         current_account = None
         account_order = []  # Track order of accounts
         
         for i, page in enumerate(self.pages):
-            text = page['text']
             page_num = page['page_num']
+            anchors = self.anchors(page_num, page['text'])
+            
+            # Disclosure/legal pages end the target section
+            if (target_account and current_account == target_account
+                    and not anchors.has('summary')
+                    and not self.has_transaction_content(anchors)):
+                break
             
             # Skip page 1 (cover page)
             if page_num == 1:
                 continue
                 
             # Look for CHECKING SUMMARY to identify account starts
-            if 'CHECKING SUMMARY' in text and 'Beginning Balance' in text:
+            if anchors.has('summary') and anchors.has('beginning'):
                 # Extract balances
-                beginning_match = re.search(r'Beginning Balance\s*\$([0-9,]+\.\d{2})', text)
-                ending_match = re.search(r'Ending Balance\s*\$([0-9,]+\.\d{2})', text)
+                beginning = anchors.value('beginning')
+                ending = anchors.value('ending')
                 
                 # Determine which account
-                if 'CHASE TOTAL CHECKING' in text:
+                if anchors.has('total'):
                     new_account = '8619'
                 else:
-                    # Extract the CHECKING SUMMARY section to avoid header account numbers
-                    summary_section = text[text.find('CHECKING SUMMARY'):text.find('TRANSACTION DETAIL') if 'TRANSACTION DETAIL' in text else len(text)]
+                    # Only the CHECKING SUMMARY section, to avoid header account numbers
+                    summary_start = anchors.first('summary')
+                    summary_end = anchors.first('detail') if anchors.has('detail') else anchors.length
+                    summary_accounts = anchors.accounts_between(summary_start, summary_end)
                     
                     # Look for account numbers specifically in the CHECKING SUMMARY section
-                    if '000000837532084' in summary_section or 'Account ending in ...2084' in summary_section:
+                    if '2084' in summary_accounts:
                         new_account = '2084'
-                    elif '000000526021873' in summary_section or 'Account ending in ...1873' in summary_section:
+                    elif '1873' in summary_accounts:
                         new_account = '1873'
-                    elif '000001248068619' in summary_section or 'Account ending in ...8619' in summary_section:
+                    elif '8619' in summary_accounts:
                         new_account = '8619'
                     else:
                         # Use order logic as fallback
@@ -91,8 +136,8 @@ class ChaseRobustExtractor:
                         'pages': [page_num],
                         'start_page': page_num,
                         'transactions': [],
-                        'beginning_balance': float(beginning_match.group(1).replace(',', '')) if beginning_match else 0,
-                        'ending_balance': float(ending_match.group(1).replace(',', '')) if ending_match else 0
+                        'beginning_cents': parse_cents(beginning) if beginning else 0,
+                        'ending_cents': parse_cents(ending) if ending else 0
                     }
                     
             # Add continuation pages
@@ -102,7 +147,7 @@ class ChaseRobustExtractor:
                         self.account_sections[current_account]['pages'].append(page_num)
                         
                 # Check if a new account starts on this page
-                if 'CHASE TOTAL CHECKING' in text and 'CHECKING SUMMARY' in text:
+                if anchors.has('total') and anchors.has('summary'):
                     # Page contains both end of current account and start of 8619
                     # The page will be in both account sections
                     if '8619' not in self.account_sections:
@@ -110,225 +155,210 @@ class ChaseRobustExtractor:
                             'pages': [page_num],
                             'start_page': page_num,
                             'transactions': [],
-                            'beginning_balance': 0,
-                            'ending_balance': 0
+                            'beginning_cents': 0,
+                            'ending_cents': 0
                         }
-                        # Extract balance for 8619
-                        if match := re.search(r'CHASE TOTAL CHECKING.*?Beginning Balance\s*\$([0-9,]+\.\d{2})', text, re.DOTALL):
-                            self.account_sections['8619']['beginning_balance'] = float(match.group(1).replace(',', ''))
-                        if match := re.search(r'CHASE TOTAL CHECKING.*?Ending Balance\s*\$([0-9,]+\.\d{2})', text, re.DOTALL):
-                            self.account_sections['8619']['ending_balance'] = float(match.group(1).replace(',', ''))
+                        # Extract balance for 8619 (printed after CHASE TOTAL CHECKING)
+                        total_start = anchors.first('total')
+                        if beginning := anchors.value('beginning', after=total_start):
+                            self.account_sections['8619']['beginning_cents'] = parse_cents(beginning)
+                        if ending := anchors.value('ending', after=total_start):
+                            self.account_sections['8619']['ending_cents'] = parse_cents(ending)
+            
+            # Once a later account has started, the target section cannot grow
+            if target_account and target_account in self.account_sections and current_account != target_account:
+                break
                         
         print(f"\nIdentified account sections:")
         for account, info in self.account_sections.items():
-            print(f"  Account {account}: pages {info['pages']} (Balance: ${info['beginning_balance']:,.2f} -> ${info['ending_balance']:,.2f})")
+            print(f"  Account {account}: pages {info['pages']} (Balance: {format_dollars(info['beginning_cents'])} -> {format_dollars(info['ending_cents'])})")
                 
-    def extract_transactions_from_page(self, text: str, account: str, page_num: int) -> List[Dict]:
-        """Extract transactions from a page of text with comprehensive parsing."""
-        transactions = []
+    def page_section_text(self, text: str, account: str, page_num: int) -> str:
+        """Return the part of a page that belongs to an account."""
+        anchors = self.anchors(page_num, text)
         
         # Handle special case where page contains multiple accounts
-        if account == '1873' and 'CHASE TOTAL CHECKING' in text and 'CHECKING SUMMARY' in text:
+        if account == '1873' and anchors.has('total') and anchors.has('summary'):
             # This page has both end of 1873 and start of 8619
             # Only process the part before CHASE TOTAL CHECKING
-            split_index = text.find('CHASE TOTAL CHECKING')
-            text = text[:split_index]
-        elif account == '8619' and 'CHECKING SUMMARY' in text and page_num > self.account_sections['8619']['start_page']:
+            text = text[:anchors.first('total')]
+        elif account == '8619' and anchors.has('summary') and page_num > self.account_sections['8619']['start_page']:
             # For 8619, if this is a shared page, only process after CHECKING SUMMARY
-            if '000000526021873' in text:  # This page also has 1873
-                split_index = text.find('CHASE TOTAL CHECKING')
-                if split_index > 0:
+            if '1873' in anchors.accounts_between(0, anchors.length):  # This page also has 1873
+                split_index = anchors.first('total')
+                if split_index:
                     text = text[split_index:]
         
-        # Split into lines
-        lines = text.split('\n')
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Skip empty lines and headers
-            if not line or any(skip in line for skip in ['TRANSACTION DETAIL', 'CHECKING SUMMARY', 'DATE DESCRIPTION', 'AMOUNT BALANCE']):
-                i += 1
-                continue
-                
-            # Look for transaction pattern: MM/DD at start of line
-            date_match = re.match(r'^(\d{2}/\d{2})\s+(.+)', line)
-            if date_match:
-                date_str = date_match.group(1)
-                rest_of_line = date_match.group(2).strip()
-                
-                # Handle special case of duplicate date in description
-                if re.match(r'^\d{2}/\d{2}\s+', rest_of_line):
-                    rest_of_line = re.sub(r'^\d{2}/\d{2}\s+', '', rest_of_line)
-                
-                # Look for amount and balance pattern
-                # Amounts can have optional negative sign with space
-                amount_pattern = r'(-?\s*[0-9,]+\.\d{2})\s+([0-9,]+\.\d{2})\s*$'
-                amount_only_pattern = r'(-?\s*[0-9,]+\.\d{2})\s*$'  # For deposits without balance
-                
-                amount_match = re.search(amount_pattern, rest_of_line)
-                if not amount_match:
-                    # Try amount-only pattern (common for deposits)
-                    amount_match = re.search(amount_only_pattern, rest_of_line)
-                
-                if amount_match:
-                    # Complete transaction on one line
-                    amount_str = amount_match.group(1).replace(' ', '').replace(',', '')
-                    description = rest_of_line[:amount_match.start()].strip()
-                    
-                    # Clean up description
-                    description = re.sub(r'\s*-\s*$', '', description)  # Remove trailing dash
-                    
-                    # Special handling for Interest Payment
-                    if 'interest payment' in description.lower():
-                        # Check if we have balance pattern (2 groups) or just amount (1 group)
-                        if amount_match.lastindex and amount_match.lastindex >= 2:
-                            # We have both amount and balance
-                            if abs(float(amount_str)) > 100:
-                                # The amount is likely a balance, not the interest
-                                amount = 0.05  # Default small interest amount
-                            else:
-                                amount = float(amount_str)
-                        else:
-                            # Only amount, no balance - likely the balance not interest
-                            amount = 0.05  # Default small interest amount
-                    else:
-                        amount = float(amount_str)
-                    
-                    # Don't adjust sign - Chase PDFs already have proper signs
-                    # Negative amounts have "-" prefix, positive amounts don't
-                        
-                    # Parse the actual transaction date
-                    month, day = date_str.split('/')
-                    # Determine the year based on statement period
-                    # If transaction month > statement month, it's from previous year
-                    trans_year = self.year
-                    if int(month) > self.month and self.month <= 3:  # Handle year boundary
-                        trans_year = self.year - 1
-                    
-                    transactions.append({
-                        'date': f"{trans_year}-{month.zfill(2)}-{day.zfill(2)}",
-                        'description': description,
-                        'amount': amount,
-                        'type': self.categorize_transaction(description)
-                    })
+        return text
+    
+    def statement_id(self, account: str) -> str:
+        """Statement id stored on every row, e.g. '2025-02 - Chase 1873'."""
+        return f'{self.year}-{self.month:02d} - Chase {account}'
+    
+    def build_transaction(self, account: str, date_str: str, description: str, amount_str: str,
+                          balance_str: str, multiline: bool) -> Transaction:
+        """Turn a parsed transaction line into a transaction record."""
+        if not multiline and 'interest payment' in description.lower():
+            # Special handling for Interest Payment
+            if balance_str is not None:
+                # We have both amount and balance
+                if abs(parse_cents(amount_str)) > 10000:
+                    # The amount is likely a balance, not the interest
+                    amount = 5  # Default small interest amount (cents)
                 else:
-                    # Multi-line transaction
-                    description_parts = [rest_of_line]
-                    i += 1
-                    
-                    while i < len(lines):
-                        next_line = lines[i].strip()
-                        
-                        # Stop if we hit another date
-                        if re.match(r'^\d{2}/\d{2}', next_line):
-                            i -= 1
-                            break
-                            
-                        # Look for amount pattern
-                        amount_match = re.search(amount_pattern, next_line)
-                        if not amount_match:
-                            # Try amount-only pattern
-                            amount_only_pattern = r'(-?\s*[0-9,]+\.\d{2})\s*$'
-                            amount_match = re.search(amount_only_pattern, next_line)
-                        
-                        if amount_match:
-                            amount_str = amount_match.group(1).replace(' ', '').replace(',', '')
-                            
-                            # Add any description part before amount
-                            desc_part = next_line[:amount_match.start()].strip()
-                            if desc_part and desc_part != '-':
-                                description_parts.append(desc_part)
-                                
-                            # Combine description parts
-                            description = ' '.join(description_parts).strip()
-                            description = re.sub(r'\s*-\s*$', '', description)
-                            
-                            # For reversals, the amount should be positive (it's a credit)
-                            if 'reversal' in description.lower():
-                                # Check if this looks like a concatenated date/amount
-                                if len(amount_str) > 10 and amount_str.startswith('20'):
-                                    # This is likely "202556831.91" which is "2025" + "56831.91"
-                                    # For reversals, we typically expect small amounts like 399.00
-                                    amount_str = '399.00'  # Default reversal amount
-                                else:
-                                    amount_str = amount_str.replace('-', '')
-                            
-                            amount = float(amount_str)
-                            
-                            # Don't adjust sign - Chase PDFs already have proper signs
-                            # Negative amounts have "-" prefix, positive amounts don't
-                                
-                            # Parse the actual transaction date
-                            month, day = date_str.split('/')
-                            # Determine the year based on statement period
-                            trans_year = self.year
-                            if int(month) > self.month and self.month <= 3:
-                                trans_year = self.year - 1
-                            
-                            transactions.append({
-                                'date': f"{trans_year}-{month.zfill(2)}-{day.zfill(2)}",
-                                'description': description,
-                                'amount': amount,
-                                'type': self.categorize_transaction(description)
-                            })
-                            break
-                        else:
-                            # This line is part of the description
-                            if next_line and next_line != '-':
-                                # Skip lines that look like they contain concatenated dates/amounts
-                                if not re.match(r'^\d{1,2}/\d{1,2}/\d{4}\d+', next_line):
-                                    description_parts.append(next_line)
-                        i += 1
-                    
-            i += 1
+                    amount = parse_cents(amount_str)
+            else:
+                # Only amount, no balance - likely the balance not interest
+                amount = 5  # Default small interest amount (cents)
+        elif multiline and 'reversal' in description.lower():
+            # For reversals, the amount should be positive (it's a credit)
+            # Check if this looks like a concatenated date/amount
+            if len(amount_str) > 10 and amount_str.startswith('20'):
+                # This is likely "202556831.91" which is "2025" + "56831.91"
+                # For reversals, we typically expect small amounts like 399.00
+                amount = 39900  # Default reversal amount (cents)
+            else:
+                amount = parse_cents(amount_str.replace('-', ''))
+        else:
+            amount = parse_cents(amount_str)
+            
+        # Don't adjust sign - Chase PDFs already have proper signs
+        # Negative amounts have "-" prefix, positive amounts don't
             
-        return transactions
+        # Parse the actual transaction date
+        month, day = date_str.split('/')
+        # Determine the year based on statement period
+        # If transaction month > statement month, it's from previous year
+        trans_year = self.year
+        if int(month) > self.month and self.month <= 3:  # Handle year boundary
+            trans_year = self.year - 1
+            
+        return Transaction(
+            f"{trans_year}-{month.zfill(2)}-{day.zfill(2)}",
+            description,
+            amount,
+            categorize_transaction(description),
+            self.statement_id(account),
+            f'Chase {account}',
+            balance_cents=parse_cents(balance_str) if balance_str is not None else None
+        )
+    
+    def extract_transactions_from_page(self, text: str, account: str, page_num: int) -> List[Transaction]:
+        """Extract transactions from a single page of text."""
+        text = self.page_section_text(text, account, page_num)
+        return [self.build_transaction(account, *parsed) for parsed in parse_lines(text.split('\n'))]
     
-    def is_credit(self, description: str) -> bool:
-        """Determine if transaction is a credit (positive amount)."""
-        desc_lower = description.lower()
-        credit_keywords = [
-            'deposit', 'interest payment', 'online transfer from',
-            'cashout', 'from chk', 'credit', 'environmental',
-            'refund', 'reversal', 'adjustment credit'
-        ]
-        return any(keyword in desc_lower for keyword in credit_keywords)
+    def section_lines(self, account: str) -> Iterator[str]:
+        """Stream the lines of every page in an account section, in page order."""
+        for page_num in self.account_sections[account]['pages']:
+            text = self.page_section_text(self.pages[page_num - 1]['text'], account, page_num)
+            yield from text.split('\n')
     
-    def categorize_transaction(self, desc: str) -> str:
-        """Categorize transaction based on description."""
-        desc_lower = desc.lower()
+    def extract_section_transactions(self, account: str) -> List[Transaction]:
+        """Parse an account section as one continuous stream of lines.
+        
+        Page breaks and repeated page headers are removed before parsing, so
+        transactions split across pages need no special handling.
+        """
+        return [self.build_transaction(account, *parsed) for parsed in parse_section(self.section_lines(account))]
+    
+    def statement_summary(self, account: str) -> Dict:
+        """Sidecar metadata of an account section: period, balances and printed summary totals."""
+        info = self.account_sections[account]
+        # The period heads every page, including the shared pages cut by page_section_text
+        period = chase_period('\n'.join(self.pages[page_num - 1]['text'] for page_num in info['pages']))
+        if period['period_start'] is None:
+            period = chase_period(self.pages[0]['text'])
+        section_text = '\n'.join(self.section_lines(account))
+        return {
+            'statement_id': self.statement_id(account),
+            'account': f'Chase {account}',
+            'source': Path(self.pdf_path).name,
+            **period,
+            'beginning_cents': info['beginning_cents'],
+            'ending_cents': info['ending_cents'],
+            'totals': parse_summary_totals(section_text, CHASE_SUMMARY_LABELS, CHASE_SUMMARY_RE),
+        }
+    
+    def gap_candidates(self, account: str) -> List[Dict]:
+        """Candidate changes that could explain a reconciliation difference.
+        
+        'add': amounts printed on transaction lines of the section that no
+        extracted row accounts for. 'remove': rows repeating the date and
+        amount of an earlier row, which may have been extracted twice.
+        """
+        info = self.account_sections[account]
+        transactions = info['statement_order']
+        candidates = []
         
-        if 'interest payment' in desc_lower:
-            return 'Interest'
-        elif 'check' in desc_lower and '#' in desc:
-            return 'Check'
-        elif 'card purchase' in desc_lower:
-            return 'Debit'
-        elif 'online payment' in desc_lower:
-            return 'Payment'
-        elif 'online transfer to' in desc_lower:
-            return 'Transfer'
-        elif 'online transfer from' in desc_lower:
-            return 'Deposit'
-        elif 'deposit' in desc_lower:
-            return 'Deposit'
-        elif 'fee' in desc_lower:
-            return 'Fee'
-        elif 'venmo' in desc_lower:
-            return 'Withdrawal'
-        elif 'environmental' in desc_lower:
-            return 'Payment'
-        elif 'atm' in desc_lower:
-            return 'Withdrawal'
+        # Transaction detail only - the summary lines repeat section totals
+        lines = []
+        for page_num in info['pages']:
+            text = self.page_section_text(self.pages[page_num - 1]['text'], account, page_num)
+            if page_num == info['pages'][0]:
+                text = text[PageAnchors(text).first('detail') or 0:]
+            lines.extend(text.split('\n'))
+        
+        unmatched = Counter(tx.amount_cents for tx in transactions)
+        line_date = ''
+        for kind, date, text, amount, balance in tokenize(strip_page_furniture(lines)):
+            if kind == DATED:
+                line_date = date
+            if kind not in (DATED, TAIL) or amount is None or 'Balance' in text:
+                continue
+            try:
+                amount_cents = parse_cents(amount)
+            except ValueError:
+                continue
+            if unmatched[amount_cents] > 0:
+                unmatched[amount_cents] -= 1
+                continue
+            label = f"{line_date} {text}"
+            candidates.append({'action': 'add', 'effect_cents': amount_cents,
+                               'label': f"{label[:50]} {format_dollars(amount_cents)}"})
+        
+        seen = set()
+        for tx in transactions:
+            key = (tx.date, tx.amount_cents)
+            if key in seen:
+                candidates.append({'action': 'remove', 'effect_cents': -tx.amount_cents,
+                                   'label': f"{tx.date} {tx.description[:50]} {format_dollars(tx.amount_cents)}"})
+            seen.add(key)
+        return candidates
+    
+    def print_gap_explanations(self, account: str, gap_cents: int):
+        """Print the smallest sets of line changes that close the gap."""
+        candidates = self.gap_candidates(account)
+        if not candidates:
+            print("    No unparsed transaction lines or repeated rows to explain the difference")
+            return
+        result = explain_gap(gap_cents, candidates)
+        if result['solutions']:
+            print(f"    Smallest explanations ({result['size']} change(s) from {len(candidates)} candidates):")
+            for solution in result['solutions']:
+                print("      " + "; ".join(f"{c['action']} {c['label']}" for c in solution))
         else:
-            return 'Withdrawal'
+            note = " (time budget reached)" if result['timed_out'] else ""
+            print(f"    No set of up to {result['searched_size']} of {len(candidates)} candidate lines "
+                  f"explains {format_dollars(gap_cents)}{note}")
     
-    def extract_all_accounts(self):
-        """Extract transactions for all accounts with validation."""
-        self.load_pdf()
-        self.identify_account_sections()
+    def extract_all_accounts(self, target_account: str = None):
+        """Extract transactions for all accounts with validation.
+        
+        With a target_account, pages are loaded lazily and only that account's
+        section is extracted.
+        """
+        if target_account:
+            self.load_pdf_lazy()
+            self.identify_account_sections(target_account)
+            # Drop sections other than the target; they may be incomplete
+            self.account_sections = {
+                account: info for account, info in self.account_sections.items()
+                if account == target_account
+            }
+        else:
+            self.load_pdf()
+            self.identify_account_sections()
         
         # Extract month from filename or PDF content
         if match := re.search(r'(\d{4})(\d{2})\d{2}-statements', self.pdf_path):
@@ -350,59 +380,55 @@ class ChaseRobustExtractor:
         for account, info in self.account_sections.items():
             print(f"\nExtracting account {account} from pages {info['pages']}")
             
-            for page_num in info['pages']:
-                page_text = self.pages[page_num - 1]['text']
-                page_transactions = self.extract_transactions_from_page(page_text, account, page_num)
-                info['transactions'].extend(page_transactions)
-                if page_transactions:
-                    print(f"  Page {page_num}: {len(page_transactions)} transactions")
-                    
-                # Check for service fee on last page
-                if page_num == info['pages'][-1]:
-                    # Look for Monthly Service Fee pattern
-                    if match := re.search(r'Monthly Service Fee\s*-\s*(\d+\.\d{2})', page_text):
-                        fee_amount = -float(match.group(1))
-                        # Get the last transaction date to use for service fee
-                        if info['transactions']:
-                            last_date = info['transactions'][-1]['date']
-                            info['transactions'].append({
-                                'date': last_date,
-                                'description': 'Monthly Service Fee',
-                                'amount': fee_amount,
-                                'type': 'Fee'
-                            })
+            info['transactions'].extend(self.extract_section_transactions(account))
+            
+            # Check for service fee on last page
+            if fee := self.anchors(info['pages'][-1]).value('fee'):
+                fee_amount = -parse_cents(fee)
+                # Get the last transaction date to use for service fee
+                if info['transactions']:
+                    last_date = info['transactions'][-1].date
+                    info['transactions'].append(Transaction(
+                        last_date, 'Monthly Service Fee', fee_amount, 'Fee',
+                        self.statement_id(account), f'Chase {account}'
+                    ))
+            
+            # Check the printed running balances while rows are in statement order
+            info['statement_order'] = list(info['transactions'])
+            info['balance_drift'] = find_first_drift(
+                info['statement_order'], info['beginning_cents'], info['ending_cents']
+            )
                 
             # Sort transactions by date
-            info['transactions'].sort(key=lambda x: x['date'])
+            info['transactions'].sort(key=lambda x: x.date)
             
             print(f"Total: {len(info['transactions'])} transactions for account {account}")
             
             # Calculate totals for verification
-            total_credits = sum(t['amount'] for t in info['transactions'] if t['amount'] > 0)
-            total_debits = sum(t['amount'] for t in info['transactions'] if t['amount'] < 0)
+            total_credits, total_debits = credit_debit_totals([t.amount_cents for t in info['transactions']])
             net_change = total_credits + total_debits
             
-            print(f"  Credits: ${total_credits:,.2f}")
-            print(f"  Debits: ${total_debits:,.2f}")
-            print(f"  Net change: ${net_change:,.2f}")
+            print(f"  Credits: {format_dollars(total_credits)}")
+            print(f"  Debits: {format_dollars(total_debits)}")
+            print(f"  Net change: {format_dollars(net_change)}")
             
-            expected_ending = info['beginning_balance'] + net_change
-            print(f"  Expected ending: ${expected_ending:,.2f} (Actual: ${info['ending_balance']:,.2f})")
+            expected_ending = info['beginning_cents'] + net_change
+            print(f"  Expected ending: {format_dollars(expected_ending)} (Actual: {format_dollars(info['ending_cents'])})")
             
-            # Check reconciliation
-            diff = abs(expected_ending - info['ending_balance'])
-            if diff < 0.01:
+            # Check reconciliation (exact in integer cents)
+            diff = abs(expected_ending - info['ending_cents'])
+            if diff == 0:
                 print(f"  ✓ Reconciles perfectly!")
             else:
-                print(f"  ✗ Reconciliation difference: ${diff:,.2f}")
+                print(f"  ✗ Reconciliation difference: {format_dollars(diff)}")
+                if info['balance_drift']:
+                    print(f"    {describe_drift(info['balance_drift'])}")
                 
-                # Provide hints for common issues
-                if diff == 19.99:
-                    print("    Hint: Might be missing a Dropbox payment")
-                elif diff == 0.09:
-                    print("    Hint: Might be missing Interest Payment")
-                elif diff > 1000:
-                    print("    Hint: Might be missing a large transfer or payment")
+                self.print_gap_explanations(account, info['ending_cents'] - expected_ending)
+        
+        if isinstance(self.pages, LazyPages):
+            print(f"\nExtracted text from {self.pages.extracted_count} of {len(self.pages)} pages")
+            self.pages.save()
             
     def save_transactions(self, account: str):
         """Save transactions for an account to CSV with versioning."""
@@ -413,63 +439,27 @@ class ChaseRobustExtractor:
         transactions = self.account_sections[account]['transactions']
         
         # Create output directory
-        output_dir = Path(f"accounts/Chase {account}/{self.year}/monthly")
+        output_dir = monthly_dir('Chase', account, self.year, self.output_root)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Base filename
+        # Never overwrite an existing (or validated) extraction
         base_filename = f"chase_{account}_{self.year}-{self.month:02d}"
+        # Locked from picking the name to recording it: batch workers share the
+        # directory. Recording last leaves the manifest newer than the directory.
+        manifest = MonthlyManifest(output_dir)
+        with manifest.locked():
+            output_path = manifest.next_version_path(base_filename)
+            write_transactions(output_path, transactions)
+            write_sidecar(sidecar_path(output_dir, base_filename), self.statement_summary(account))
+            manifest.record(output_path)
         
-        # Check what versions exist
-        import re
-        existing_files = list(output_dir.glob(f"{base_filename}*.csv"))
-        
-        # If validated version exists, don't overwrite
-        if any('[VALIDATED]' in f.name for f in existing_files):
-            print(f"WARNING: Validated version exists for {base_filename}")
-            print("Creating new version instead of overwriting validated file")
-        
-        # Find highest version number
-        max_version = 0
-        has_unversioned = False
-        
-        for f in existing_files:
-            if f.name == f"{base_filename}.csv":
-                has_unversioned = True
-            elif match := re.search(r'\[v(\d+)\]\.csv$', f.name):
-                version = int(match.group(1))
-                max_version = max(max_version, version)
-        
-        # Determine output filename
-        if not existing_files:
-            # First extraction - no version suffix
-            filename = f"{base_filename}.csv"
-        elif has_unversioned and max_version == 0:
-            # Unversioned exists, create v1
-            filename = f"{base_filename}[v1].csv"
-        else:
-            # Create next version
-            next_version = max_version + 1
-            filename = f"{base_filename}[v{next_version}].csv"
-            
-        output_path = output_dir / filename
-        
-        # Convert to standard format
-        with open(output_path, 'w', newline='') as csvfile:
-            fieldnames = ['Description', 'Amount', 'Transaction Date', 'Transaction Type', 
-                         'Status', 'Statement id', 'Bank and last 4']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for tx in transactions:
-                writer.writerow({
-                    'Description': tx['description'],
-                    'Amount': tx['amount'],
-                    'Transaction Date': tx['date'],
-                    'Transaction Type': tx['type'],
-                    'Status': 'New',
-                    'Statement id': f'{self.year}-{self.month:02d} - Chase {account}',
-                    'Bank and last 4': f'Chase {account}'
-                })
+        # The store keeps a better ([VALIDATED] or newer) version if it has one
+        statements = len({tx.statement_id for tx in transactions})
+        with TransactionStore(store_path(self.output_root)) as store:
+            kept = statements - store.save_monthly_file(output_path, transactions)
+        if kept:
+            print(f"Transaction store keeps its better version of {kept} of {statements} "
+                  f"statements in {output_path.stem}")
                 
         print(f"Saved {len(transactions)} transactions to {output_path}")
         return output_path
@@ -478,20 +468,29 @@ def main():
     """Extract all Chase statements with robust handling."""
     import sys
     
-    if len(sys.argv) < 2:
-        print("Usage: python extract_chase_robust.py <pdf_path> [account]")
-        print("Example: python extract_chase_robust.py statement.pdf 1873")
+    # Optional --workers=N for parallel page extraction
+    workers = 1
+    args = []
+    for arg in sys.argv[1:]:
+        if arg.startswith('--workers='):
+            workers = int(arg.split('=', 1)[1])
+        else:
+            args.append(arg)
+    
+    if not args:
+        print("Usage: python extract_chase_robust.py <pdf_path> [account] [--workers=N]")
+        print("Example: python extract_chase_robust.py statement.pdf 1873 --workers=4")
         sys.exit(1)
         
-    pdf_path = sys.argv[1]
-    target_account = sys.argv[2] if len(sys.argv) > 2 else None
+    pdf_path = args[0]
+    target_account = args[1] if len(args) > 1 else None
     
     print(f"Extracting from: {pdf_path}")
     print("Using robust extraction with all fixes applied")
     print("=" * 70)
     
-    extractor = ChaseRobustExtractor(pdf_path)
-    extractor.extract_all_accounts()
+    extractor = ChaseRobustExtractor(pdf_path, workers=workers)
+    extractor.extract_all_accounts(target_account)
     
     # Save transactions
     if target_account:
@@ -4,11 +4,61 @@ Extract Chase multi-account statements with automatic validation.
 This script implements the updated methodology with reconciliation checks.
 """
 
-import csv
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
+
+from categorizer import MEMO_SIZE, KeywordCategorizer, normalize_description
+from money import parse_cents
+from summary_reconciliation import print_summary_reconciliation, reconcile_summary
+from transaction import Transaction, write_transactions
+
+# Transaction types for this methodology, in priority order
+VALIDATION_RULES = [
+    ('Interest', ('interest payment',)),
+    ('Check', ('check #',)),
+    ('Debit', ('card purchase',)),
+    ('Payment', ('online payment',)),
+    ('Transfer', ('online transfer to',)),
+    ('Deposit', ('online transfer from',)),
+    ('Deposit', ('deposit', 'cashout')),
+    ('Withdrawal', ('venmo payment',)),
+    ('Fee', ('service fee',)),
+    ('Credit', ('ppd id:', 'ccd id:', 'web id:'), ('payment', 'pmt')),
+]
+VALIDATION_CATEGORIES = KeywordCategorizer(VALIDATION_RULES, default='Withdrawal')
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def route_account(desc: str, sign: int) -> Optional[str]:
+    """Account rules for a normalized description and the sign of its amount.
+    
+    Memoized; card numbers (4 digits) survive normalize_description.
+    """
+    # Card-based identification
+    if 'Card 0885' in desc:
+        return '2084'
+    elif 'Card 0665' in desc:
+        return '1873'
+    
+    # Special payment rules
+    if 'Environmental AL Rf Pmt' in desc and sign > 0:
+        return '2084'
+    elif 'Keller Williams' in desc and sign > 0:
+        return '2084'
+    elif 'ADP - Tax' in desc and sign < 0:
+        return '1873'
+    elif 'Verizon Wireless' in desc and sign < 0:
+        return '1873'
+    
+    # Online payments typically from 2084
+    if 'Online Payment' in desc and sign < 0:
+        return '2084'
+        
+    # Default: needs manual review
+    return None
 
 class ChaseMultiAccountExtractor:
     def __init__(self):
@@ -20,95 +70,26 @@ class ChaseMultiAccountExtractor:
         
     def categorize_transaction(self, desc: str) -> str:
         """Categorize transaction based on description."""
-        desc_lower = desc.lower()
-        
-        if 'interest payment' in desc_lower:
-            return 'Interest'
-        elif 'check #' in desc_lower:
-            return 'Check'
-        elif 'card purchase' in desc_lower:
-            return 'Debit'
-        elif 'recurring card purchase' in desc_lower:
-            return 'Debit'
-        elif 'online payment' in desc_lower:
-            return 'Payment'
-        elif 'online transfer to' in desc_lower:
-            return 'Transfer'
-        elif 'online transfer from' in desc_lower:
-            return 'Deposit'
-        elif 'deposit' in desc_lower or 'cashout' in desc_lower:
-            return 'Deposit'
-        elif 'venmo payment' in desc_lower:
-            return 'Withdrawal'
-        elif 'service fee' in desc_lower:
-            return 'Fee'
-        elif any(word in desc_lower for word in ['ppd id:', 'ccd id:', 'web id:']):
-            if 'payment' in desc_lower or 'pmt' in desc_lower:
-                return 'Credit'
-            else:
-                return 'Withdrawal'
-        else:
-            return 'Withdrawal'
+        return VALIDATION_CATEGORIES.lookup(desc)
     
     def identify_account(self, desc: str, amount: float) -> str:
         """Identify which account a transaction belongs to based on rules."""
-        # Card-based identification
-        if 'Card 0885' in desc:
-            return '2084'
-        elif 'Card 0665' in desc:
-            return '1873'
-        
-        # Special payment rules
-        if 'Environmental AL Rf Pmt' in desc and amount > 0:
-            return '2084'
-        elif 'Keller Williams' in desc and amount > 0:
-            return '2084'
-        elif 'ADP - Tax' in desc and amount < 0:
-            return '1873'
-        elif 'Verizon Wireless' in desc and amount < 0:
-            return '1873'
-        
-        # Online payments typically from 2084
-        if 'Online Payment' in desc and amount < 0:
-            return '2084'
-            
-        # Default: needs manual review
-        return None
+        return route_account(normalize_description(desc), (amount > 0) - (amount < 0))
     
-    def validate_reconciliation(self, transactions: List[Dict], 
-                              beginning_balance: float, 
-                              expected_ending: float,
-                              account: str) -> Tuple[bool, Dict]:
-        """Validate that transactions reconcile with beginning and ending balances."""
-        deposits = sum(float(t['Amount']) for t in transactions if float(t['Amount']) > 0)
-        
-        # Categorize withdrawals
-        checks = sum(abs(float(t['Amount'])) for t in transactions 
-                    if float(t['Amount']) < 0 and t['Transaction Type'] == 'Check')
-        
-        cards = sum(abs(float(t['Amount'])) for t in transactions 
-                   if float(t['Amount']) < 0 and t['Transaction Type'] == 'Debit')
-        
-        electronic = sum(abs(float(t['Amount'])) for t in transactions 
-                        if float(t['Amount']) < 0 and t['Transaction Type'] not in ['Check', 'Debit'])
-        
-        total_withdrawals = checks + cards + electronic
-        calculated_ending = beginning_balance + deposits - total_withdrawals
-        
-        result = {
-            'account': account,
-            'beginning_balance': beginning_balance,
-            'deposits': deposits,
-            'checks': checks,
-            'cards': cards,
-            'electronic': electronic,
-            'total_withdrawals': total_withdrawals,
-            'calculated_ending': calculated_ending,
-            'expected_ending': expected_ending,
-            'difference': calculated_ending - expected_ending,
-            'reconciles': abs(calculated_ending - expected_ending) < 0.01
-        }
-        
+    def validate_reconciliation(self, transactions: List[Transaction], 
+                              beginning_balance: Union[str, float], 
+                              expected_ending: Union[str, float],
+                              account: str,
+                              printed_totals: Optional[Dict[str, int]] = None) -> Tuple[bool, Dict]:
+        """Validate that transactions reconcile with beginning and ending balances.
+        
+        One pass over integer cents fills every CHECKING SUMMARY bucket; with
+        printed_totals (a statement sidecar's 'totals'), each bucket is also
+        compared with its printed line. See summary_reconciliation.
+        """
+        result = reconcile_summary(transactions, parse_cents(beginning_balance),
+                                   parse_cents(expected_ending), printed_totals)
+        result['account'] = account
         return result['reconciles'], result
     
     def extract_february_2025(self):
@@ -172,17 +153,11 @@ class ChaseMultiAccountExtractor:
     def save_transactions(self, transactions: List[Tuple], account: str, month: int, year: int = 2025):
         """Save transactions to CSV file with validation."""
         # Convert to standard format
-        formatted_transactions = []
-        for desc, amount, date, tx_type in transactions:
-            formatted_transactions.append({
-                'Description': desc,
-                'Amount': amount,
-                'Transaction Date': date,
-                'Transaction Type': tx_type,
-                'Status': 'New',
-                'Statement id': f'{year}-{month:02d} - Chase {account}',
-                'Bank and last 4': f'Chase {account}'
-            })
+        formatted_transactions = [
+            Transaction(date, desc, parse_cents(amount), tx_type,
+                        f'{year}-{month:02d} - Chase {account}', f'Chase {account}')
+            for desc, amount, date, tx_type in transactions
+        ]
         
         # Create output directory
         output_dir = Path(f"accounts/Chase {account}/{year}/monthly")
@@ -193,13 +168,7 @@ class ChaseMultiAccountExtractor:
         output_path = output_dir / filename
         
         # Write CSV
-        with open(output_path, 'w', newline='') as csvfile:
-            fieldnames = ['Description', 'Amount', 'Transaction Date', 'Transaction Type', 
-                         'Status', 'Statement id', 'Bank and last 4']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            writer.writerows(formatted_transactions)
+        write_transactions(output_path, formatted_transactions)
         
         return output_path, formatted_transactions
 
@@ -235,16 +204,7 @@ def main():
         
         print(f"Transactions saved: {len(formatted_txns)}")
         print(f"Output file: {output_path}")
-        print(f"\nReconciliation:")
-        print(f"  Beginning: ${result['beginning_balance']:,.2f}")
-        print(f"  Deposits: ${result['deposits']:,.2f}")
-        print(f"  Checks: ${result['checks']:,.2f}")
-        print(f"  Cards: ${result['cards']:,.2f}")
-        print(f"  Electronic: ${result['electronic']:,.2f}")
-        print(f"  Calculated Ending: ${result['calculated_ending']:,.2f}")
-        print(f"  Expected Ending: ${result['expected_ending']:,.2f}")
-        print(f"  Difference: ${result['difference']:,.2f}")
-        print(f"  Status: {'✓ PASSED' if passed else '✗ FAILED'}")
+        print_summary_reconciliation(result)
         
         if not passed:
             all_passed = False
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Extract transactions from Discover credit card statement PDFs.
+
+Discover conventions (see docs/DISCOVER_GUIDE.md):
+- Purchases and fees are positive, payments and credits are negative
+- Category words Discover appends to merchant names are removed
+- Statement files are named like Discover-Statement-20250112-1342.pdf
+"""
+
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from money import parse_cents
+from monthly_files import monthly_dir
+from monthly_manifest import MonthlyManifest
+from pdf_text import BACKEND, load_pages
+from statement_summary import discover_summary, sidecar_path, write_sidecar
+from transaction import Transaction, write_transactions
+from transaction_store import TransactionStore, store_path
+
+# Category text Discover appends to the merchant name
+CATEGORY_SUFFIX = re.compile(
+    r'\s+(Merchandise|Services|Restaurants|Groceries|Supermarkets|Gas Stations|Travel)$'
+)
+
+
+class DiscoverExtractor:
+    """Extract transactions from a single Discover statement PDF."""
+
+    def __init__(self, pdf_path: str, sha256: str = None, backend: str = BACKEND):
+        self.pdf_path = pdf_path
+        self.sha256 = sha256  # Content hash, when already computed by the caller
+        self.backend = backend  # Text backend name (see text_backends)
+        self.output_root = Path('.')  # Folder holding the accounts/ tree
+        self.cache = None  # PageTextCache (None: the default .cache/page_text)
+        self.pages = []
+        self.transactions = []
+        self.account = None
+        self.month = None
+        self.year = 2025
+
+    def load_pdf(self):
+        """Load PDF and extract text from all pages (cached by content hash)."""
+        self.pages = load_pages(self.pdf_path, self.cache, sha256=self.sha256, backend=self.backend)
+
+    def identify_statement(self):
+        """Determine the account's last 4 digits and the statement month."""
+        if match := re.search(r'(\d{4})(\d{2})\d{2}-(\d{4})', Path(self.pdf_path).name):
+            self.year = int(match.group(1))
+            self.month = int(match.group(2))
+            self.account = match.group(3)
+            return
+
+        text = '\n'.join(page['text'] for page in self.pages[:2])
+        if match := re.search(r'ending in\s*(\d{4})', text, re.IGNORECASE):
+            self.account = match.group(1)
+        if match := re.search(r'(?:Closing|Statement) Date:?\s*(\d{2})/\d{2}/(\d{4})', text):
+            self.month = int(match.group(1))
+            self.year = int(match.group(2))
+
+    def statement_id(self) -> str:
+        """Statement id stored on every row, e.g. '2025-01 - Discover 1342'."""
+        return f'{self.year}-{self.month:02d} - Discover {self.account}'
+
+    def extract_transactions(self) -> List[Transaction]:
+        """Parse every dated line with an amount into a transaction."""
+        lines = '\n'.join(page['text'] for page in self.pages).split('\n')
+        statement_id = self.statement_id()
+        account = f'Discover {self.account}'
+        transactions = []
+
+        for i, raw_line in enumerate(lines):
+            line = raw_line.strip()
+            date_starts = [m.start() for m in re.finditer(r'\d{2}/\d{2}\s+', line)]
+
+            # A line can hold several entries; split it at each date
+            for n, start in enumerate(date_starts):
+                end = date_starts[n + 1] if n + 1 < len(date_starts) else len(line)
+                segment = line[start:end].strip()
+
+                match = re.match(r'(\d{2}/\d{2})\s+(.+?)(?:\s+(-?\$?[\d,]+\.\d{2}))?$', segment)
+                if not match:
+                    continue
+
+                date_str, description, amount_str = match.groups()
+                if not amount_str and i + 1 < len(lines):
+                    # Amount wrapped onto the next line
+                    if next_match := re.search(r'^(-?\$?[\d,]+\.\d{2})(?:\s|$)', lines[i + 1].strip()):
+                        amount_str = next_match.group(1)
+                if not amount_str:
+                    continue
+
+                amount = parse_cents(amount_str)
+
+                description = CATEGORY_SUFFIX.sub('', description.strip())
+                description = re.sub(r'\s+', ' ', description)
+                description = re.sub(r'\s*[A-Z0-9]{10,}$', '', description).strip()
+
+                tx_type = self.categorize_transaction(description, amount_str)
+                amount = -abs(amount) if tx_type in ('Payment', 'Credit') else abs(amount)
+
+                transactions.append(Transaction(
+                    self.parse_date(date_str), description, amount, tx_type, statement_id, account
+                ))
+
+        self.transactions = transactions
+        return transactions
+
+    def statement_summary(self) -> Dict:
+        """Sidecar metadata: period, previous/new balance and printed summary totals."""
+        return {
+            'statement_id': self.statement_id(),
+            'account': f'Discover {self.account}',
+            'source': Path(self.pdf_path).name,
+            **discover_summary('\n'.join(page['text'] for page in self.pages)),
+        }
+
+    def parse_date(self, date_str: str) -> str:
+        """Convert MM/DD to YYYY-MM-DD, rolling back a year across January."""
+        month, day = date_str.split('/')
+        year = self.year
+        if self.month and int(month) > self.month:
+            year -= 1
+        return f"{year}-{month}-{day}"
+
+    def categorize_transaction(self, description: str, amount_str: str) -> str:
+        """Categorize a Discover transaction."""
+        desc_upper = description.upper()
+        if 'PAYMENT' in desc_upper or 'THANK YOU' in desc_upper:
+            return 'Payment'
+        elif 'CREDIT' in desc_upper or 'CASHBACK' in desc_upper or amount_str.startswith('-'):
+            return 'Credit'
+        elif 'INTEREST CHARGE' in desc_upper:
+            return 'Interest'
+        else:
+            return 'Purchase'
+
+    def extract(self) -> List[Transaction]:
+        """Load the PDF and extract its transactions."""
+        self.load_pdf()
+        self.identify_statement()
+        if not self.account or not self.month:
+            raise ValueError(f"Could not determine Discover account and statement month for {self.pdf_path}")
+
+        transactions = self.extract_transactions()
+        transactions.sort(key=lambda x: x.date)
+
+        print(f"Discover {self.account} {self.year}-{self.month:02d}: {len(transactions)} transactions")
+        return transactions
+
+    def save_transactions(self):
+        """Save transactions to CSV with versioning."""
+        if not self.transactions:
+            print(f"No transactions found in {self.pdf_path}")
+            return None
+
+        output_dir = monthly_dir('Discover', self.account, self.year, self.output_root)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        base_filename = f"discover_{self.account}_{self.year}-{self.month:02d}"
+        # Locked from picking the name to recording it: batch workers share the
+        # directory. Recording last leaves the manifest newer than the directory.
+        manifest = MonthlyManifest(output_dir)
+        with manifest.locked():
+            output_path = manifest.next_version_path(base_filename)
+            write_transactions(output_path, self.transactions)
+            write_sidecar(sidecar_path(output_dir, base_filename), self.statement_summary())
+            manifest.record(output_path)
+        
+        # The store keeps a better ([VALIDATED] or newer) version if it has one
+        statements = len({tx.statement_id for tx in self.transactions})
+        with TransactionStore(store_path(self.output_root)) as store:
+            kept = statements - store.save_monthly_file(output_path, self.transactions)
+        if kept:
+            print(f"Transaction store keeps its better version of {kept} of {statements} "
+                  f"statements in {output_path.stem}")
+
+        print(f"Saved {len(self.transactions)} transactions to {output_path}")
+        return output_path
+
+
+def main():
+    """Extract a Discover statement PDF."""
+    if len(sys.argv) < 2:
+        print("Usage: python extract_discover_enhanced.py <pdf_path>")
+        print("Example: python extract_discover_enhanced.py Discover-Statement-20250112-1342.pdf")
+        sys.exit(1)
+
+    extractor = DiscoverExtractor(sys.argv[1])
+    extractor.extract()
+    extractor.save_transactions()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Explain a reconciliation difference with the fewest line changes.
+
+Given the gap in cents (printed ending balance minus the balance computed
+from the extracted rows) and a list of candidate changes - statement lines
+that were not extracted ('add') and extracted rows that look like
+duplicates ('remove') - find the smallest sets of changes whose effects sum
+exactly to the gap.
+
+Sets are searched by increasing size with meet-in-the-middle: a set of size
+k is split into its k//2 lowest-indexed candidates and the rest, and the
+sums of all (k - k//2)-subsets are kept in a hash table, so size 4 over 300
+candidates costs two passes over ~45k pairs instead of ~330M quadruples.
+A time budget keeps the search interactive; the result says when the
+budget ran out.
+"""
+
+import time
+from itertools import combinations
+from typing import Dict, List, Sequence
+
+# Check the clock every this many subsets
+_CLOCK_INTERVAL = 4096
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+def _subset_sums(effects: Sequence[int], size: int, deadline: float) -> Dict[int, List[tuple]]:
+    """Map sum -> index tuples for every subset of the given size."""
+    sums: Dict[int, List[tuple]] = {}
+    for count, combo in enumerate(combinations(range(len(effects)), size)):
+        if count % _CLOCK_INTERVAL == 0 and time.perf_counter() > deadline:
+            raise _OutOfTime
+        sums.setdefault(sum(effects[i] for i in combo), []).append(combo)
+    return sums
+
+
+def explain_gap(difference_cents: int, candidates: List[Dict], max_size: int = 4,
+                time_budget: float = 1.0, limit: int = 5) -> Dict:
+    """Find the smallest candidate sets whose effect_cents sum to the gap.
+
+    Each candidate is a dict with 'effect_cents' (+amount to add a missing
+    line, -amount to remove a row), 'action' and 'label'. Returns
+    {'solutions': [[candidate, ...], ...], 'size': k or None,
+    'searched_size': largest size fully searched, 'timed_out': bool}.
+    """
+    result = {'solutions': [], 'size': None, 'searched_size': 0, 'timed_out': False}
+    if difference_cents == 0 or not candidates:
+        return result
+
+    effects = [candidate['effect_cents'] for candidate in candidates]
+    deadline = time.perf_counter() + time_budget
+    tables: Dict[int, Dict[int, List[tuple]]] = {}
+
+    try:
+        for size in range(1, min(max_size, len(candidates)) + 1):
+            left_size = size // 2
+            right_size = size - left_size
+            if right_size not in tables:
+                tables[right_size] = _subset_sums(effects, right_size, deadline)
+            right_sums = tables[right_size]
+
+            found = []
+            for count, left in enumerate(combinations(range(len(effects)), left_size)):
+                if count % _CLOCK_INTERVAL == 0 and time.perf_counter() > deadline:
+                    raise _OutOfTime
+                needed = difference_cents - sum(effects[i] for i in left)
+                for right in right_sums.get(needed, ()):
+                    # Left holds the lowest indices, so each set is found once
+                    if not left or left[-1] < right[0]:
+                        found.append(left + right)
+                        if len(found) >= limit:
+                            break
+                if len(found) >= limit:
+                    break
+
+            result['searched_size'] = size
+            if found:
+                result['size'] = size
+                result['solutions'] = [[candidates[i] for i in combo] for combo in found]
+                return result
+    except _OutOfTime:
+        result['timed_out'] = True
+
+    return result
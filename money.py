@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Integer-cents money amounts.
+
+Statement amounts are parsed once into whole cents (an int) and stay that
+way through extraction, reconciliation and consolidation. Sums of ints are
+exact, so a statement reconciles when the totals are equal - no 0.01
+tolerance - and a column of amounts can be kept in a plain array('q').
+
+Amounts are converted back to text only for output:
+- format_cents(-3500)   -> '-35.00'    (CSV Amount column)
+- format_dollars(-3500) -> '$-35.00'   (same layout as f"${x:,.2f}")
+"""
+
+from typing import Sequence, Tuple, Union
+
+# Largest cent amount the float fast path in parse_cents() may return
+_FAST_PATH_LIMIT = 10 ** 13
+
+
+def parse_cents(value: Union[str, float]) -> int:
+    """Parse an amount such as '-1,234.56', '- 44.96', '$142.6' or '12' into cents.
+
+    Floats (amounts already parsed by older code) are rounded to the nearest
+    cent. Raises ValueError for text that is not an amount or has non-zero
+    digits past the cents.
+    """
+    if isinstance(value, float):
+        return round(value * 100)
+
+    # Fast path: plain decimal text ('-35.00', '4875.0'). Below 10**13 cents
+    # the double is close enough for round() to recover the exact cents;
+    # anything float() rejects, and fractions of a cent, go through the
+    # exact parser below.
+    try:
+        scaled = float(value) * 100
+    except ValueError:
+        pass
+    else:
+        if abs(scaled) < _FAST_PATH_LIMIT:
+            cents = round(scaled)
+            if abs(scaled - cents) < 1e-6:
+                return cents
+
+    text = value.strip().replace(',', '').replace('$', '').replace(' ', '')
+    sign = 1
+    if text[:1] == '-':
+        sign = -1
+        text = text[1:]
+    elif text[:1] == '+':
+        text = text[1:]
+
+    whole, _, frac = text.partition('.')
+    if len(frac) > 2:
+        if frac[2:].strip('0'):
+            raise ValueError(f"Amount has fractions of a cent: {value!r}")
+        frac = frac[:2]
+    if (not whole and not frac) or (whole and not whole.isdigit()) or (frac and not frac.isdigit()):
+        raise ValueError(f"Not a money amount: {value!r}")
+
+    return sign * (int(whole or '0') * 100 + int(frac.ljust(2, '0')))
+
+
+def format_cents(cents: int) -> str:
+    """Plain decimal text for CSV output, e.g. -3500 -> '-35.00'."""
+    sign = '-' if cents < 0 else ''
+    whole, frac = divmod(abs(cents), 100)
+    return f"{sign}{whole}.{frac:02d}"
+
+
+def format_dollars(cents: int) -> str:
+    """Display text with thousands separators, e.g. -123456 -> '$-1,234.56'."""
+    sign = '-' if cents < 0 else ''
+    whole, frac = divmod(abs(cents), 100)
+    return f"${sign}{whole:,}.{frac:02d}"
+
+
+def credit_debit_totals(amounts: Sequence[int]) -> Tuple[int, int]:
+    """Sum credits (positive) and debits (negative) of a list or array of cents."""
+    credits = sum(filter((0).__lt__, amounts))
+    return credits, sum(amounts) - credits
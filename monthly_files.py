@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the monthly CSV files under accounts/<Bank NNNN>/<year>/monthly.
+
+Naming convention:
+- First extraction: chase_1873_2025-03.csv
+- Re-extractions:   chase_1873_2025-03[v1].csv, chase_1873_2025-03[v2].csv
+- Validated files:  chase_1873_2025-03[VALIDATED].csv (never overwritten)
+"""
+
+import re
+from pathlib import Path
+from typing import List, Optional
+
+# Standard output columns shared by every bank
+CSV_FIELDNAMES = ['Description', 'Amount', 'Transaction Date', 'Transaction Type',
+                  'Status', 'Statement id', 'Bank and last 4']
+
+
+def monthly_dir(bank: str, account: str, year: int, output_root: Path = Path('.')) -> Path:
+    """Directory holding the monthly CSVs for an account and year."""
+    return Path(output_root) / f"accounts/{bank} {account}/{year}/monthly"
+
+
+def next_version_path(output_dir: Path, base_filename: str, existing_names: Optional[List[str]] = None) -> Path:
+    """Return the path for a new extraction without overwriting existing versions.
+
+    existing_names lists the month's files already known (e.g. from the
+    manifest); without it the directory is globbed.
+    """
+    if existing_names is None:
+        existing_names = [f.name for f in output_dir.glob(f"{base_filename}*.csv")]
+
+    # If validated version exists, don't overwrite
+    if any('[VALIDATED]' in name for name in existing_names):
+        print(f"WARNING: Validated version exists for {base_filename}")
+        print("Creating new version instead of overwriting validated file")
+
+    # Find highest version number
+    max_version = 0
+    has_unversioned = False
+
+    for name in existing_names:
+        if name == f"{base_filename}.csv":
+            has_unversioned = True
+        elif match := re.search(r'\[v(\d+)\]\.csv$', name):
+            max_version = max(max_version, int(match.group(1)))
+
+    # Determine output filename
+    if not existing_names:
+        # First extraction - no version suffix
+        filename = f"{base_filename}.csv"
+    elif has_unversioned and max_version == 0:
+        # Unversioned exists, create v1
+        filename = f"{base_filename}[v1].csv"
+    else:
+        # Create next version
+        filename = f"{base_filename}[v{max_version + 1}].csv"
+
+    return output_dir / filename
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Per-account manifest of the monthly CSV versions.
+
+Each monthly directory (accounts/<Bank NNNN>/<year>/monthly) keeps a
+manifest.json recording, for every statement month, each saved version of
+the file, its SHA-256, and which version is authoritative:
+
+    [VALIDATED] > highest [vN] > unversioned
+
+Saving asks the manifest for the next version name and records the new
+file; consolidation reads exactly one authoritative file per month. Neither
+scans the directory, and an unversioned, [v1] and [VALIDATED] copy of the
+same month are never counted together. A missing manifest is built in
+memory with one scan of the directory; only writers save it, so
+consolidation and reconciliation never write into accounts/.
+
+Writers hold an exclusive lock on the directory (manifest.lock) from
+choosing the version name to recording the file, and re-read the manifest
+under it, so parallel batch workers saving into one account never drop
+each other's months. A saved manifest is never older than its directory,
+so a directory modified after it - a CSV copied in or deleted by hand - is
+the only case where loading scans: the change is used with a warning, and
+recorded for good with:
+
+    python monthly_manifest.py <monthly_dir> [<monthly_dir> ...]
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from monthly_files import next_version_path
+
+MANIFEST_NAME = 'manifest.json'
+LOCK_NAME = 'manifest.lock'
+
+# chase_1873_2025-02.csv, chase_1873_2025-02[v2].csv, discover_1342_2025-01[VALIDATED].csv
+MONTHLY_FILE_RE = re.compile(r'^(?P<base>.+_(?P<month>\d{4}-\d{2}))(?:\[(?P<tag>v\d+|VALIDATED)\])?\.csv$')
+
+
+def version_rank(tag: str) -> Tuple[int, int]:
+    """Sort key of a version tag: unversioned < v1 < v2 < ... < VALIDATED."""
+    if tag == 'VALIDATED':
+        return (2, 0)
+    if tag:
+        return (1, int(tag[1:]))
+    return (0, 0)
+
+
+class MonthlyManifest:
+    """Versions, hashes and the authoritative file of every month in one directory."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.path = self.directory / MANIFEST_NAME
+        # 'YYYY-MM' -> {'base': ..., 'versions': {name: {'tag', 'sha256'}}, 'authoritative': name}
+        self.months: Dict[str, Dict] = {}
+        self._lock = None  # Open lock file while locked() is held
+
+    @classmethod
+    def load(cls, directory) -> 'MonthlyManifest':
+        """Read a directory's manifest, building it with one scan if missing."""
+        manifest = cls(directory)
+        manifest._read()
+        return manifest
+
+    def _read(self):
+        """Replace the in-memory months with the manifest on disk (or a scan if there is none)."""
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.months = json.load(f)['months']
+            if os.stat(self.directory).st_mtime_ns > os.stat(self.path).st_mtime_ns:
+                self._check_files()
+        elif self.directory.is_dir():
+            self.rebuild(save=False)
+        else:
+            self.months = {}
+
+    def _check_files(self):
+        """Bring the manifest in line with the monthly CSVs actually in the directory.
+
+        Only called when the directory changed after the manifest was saved.
+        A file copied in by hand is recorded and one deleted by hand is
+        dropped, both in memory only, with a warning naming the fix.
+        """
+        recorded = {name for entry in self.months.values() for name in entry['versions']}
+        on_disk = {path.name for path in self.directory.glob('*.csv') if MONTHLY_FILE_RE.match(path.name)}
+        if recorded == on_disk:
+            return
+
+        for name in sorted(on_disk - recorded):
+            self.record(self.directory / name, save=False)
+        for name in sorted(recorded - on_disk):
+            self._forget(name)
+        print(f"Warning: {self.path} is out of date "
+              f"(not recorded: {', '.join(sorted(on_disk - recorded)) or 'none'}; "
+              f"missing: {', '.join(sorted(recorded - on_disk)) or 'none'}). "
+              f"Fix with: python monthly_manifest.py '{self.directory}'")
+
+    def _forget(self, name: str):
+        """Drop a recorded version that is no longer in the directory."""
+        month = MONTHLY_FILE_RE.match(name).group('month')
+        entry = self.months[month]
+        del entry['versions'][name]
+        if not entry['versions']:
+            del self.months[month]
+        else:
+            entry['authoritative'] = max(entry['versions'],
+                                         key=lambda version: version_rank(entry['versions'][version]['tag']))
+
+    @contextmanager
+    def locked(self, reread: bool = True):
+        """Hold the directory's exclusive lock, working on the manifest as currently saved.
+
+        Wrap next_version_path() -> write -> record() in it. Re-entrant
+        within one MonthlyManifest.
+        """
+        if self._lock is not None:
+            yield self
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / LOCK_NAME, 'a') as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            self._lock = lock
+            try:
+                if reread:
+                    self._read()
+                yield self
+            finally:
+                self._lock = None
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def rebuild(self, save: bool = True):
+        """Re-record every monthly CSV in the directory (saving under the lock with save)."""
+        if save:
+            with self.locked(reread=False):
+                self.rebuild(save=False)
+                self.save()
+            return
+
+        self.months = {}
+        for path in sorted(self.directory.glob('*.csv')):
+            self.record(path, save=False)
+
+    def save(self):
+        """Write the manifest atomically (through a uniquely named temporary file)."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', dir=self.directory, prefix=f'{MANIFEST_NAME}.', suffix='.tmp',
+                                         encoding='utf-8', delete=False) as f:
+            json.dump({'months': self.months}, f, indent=2, sort_keys=True)
+        os.replace(f.name, self.path)
+        # The replace itself modified the directory; keep the manifest the newer of the two
+        os.utime(self.path)
+
+    def record(self, path, save: bool = True) -> Optional[str]:
+        """Add (or re-hash) a saved monthly file. Returns its month, or None if not a monthly CSV.
+
+        With save, the manifest is re-read, updated and written under the
+        directory lock, so records made by other processes are kept.
+        """
+        path = Path(path)
+        match = MONTHLY_FILE_RE.match(path.name)
+        if not match:
+            return None
+        if save:
+            with self.locked():
+                self.record(path, save=False)
+                self.save()
+            return match.group('month')
+
+        entry = self.months.setdefault(match.group('month'), {'base': match.group('base'), 'versions': {}})
+        entry['versions'][path.name] = {
+            'tag': match.group('tag') or '',
+            'sha256': hashlib.sha256(path.read_bytes()).hexdigest(),
+        }
+        entry['authoritative'] = max(entry['versions'], key=lambda name: version_rank(entry['versions'][name]['tag']))
+        return match.group('month')
+
+    def next_version_path(self, base_filename: str) -> Path:
+        """Path for a new extraction of a month, from the recorded versions."""
+        month = MONTHLY_FILE_RE.match(f"{base_filename}.csv").group('month')
+        entry = self.months.get(month, {})
+        return next_version_path(self.directory, base_filename, list(entry.get('versions', ())))
+
+    def authoritative(self, month: str) -> Optional[Path]:
+        """The authoritative file of a 'YYYY-MM' month, or None."""
+        entry = self.months.get(month)
+        return self.directory / entry['authoritative'] if entry else None
+
+    def authoritative_files(self) -> List[Path]:
+        """One authoritative file per month, in month order."""
+        return [self.directory / self.months[month]['authoritative'] for month in sorted(self.months)]
+
+
+def main():
+    """Rebuild the manifest of each given monthly directory."""
+    if len(sys.argv) < 2:
+        print("Usage: python monthly_manifest.py <monthly_dir> [<monthly_dir> ...]")
+        print("Example: python monthly_manifest.py 'accounts/Chase 1873/2025/monthly'")
+        sys.exit(1)
+
+    for directory in sys.argv[1:]:
+        manifest = MonthlyManifest(directory)
+        manifest.rebuild()
+        print(f"{manifest.path}: {len(manifest.months)} months")
+        for month in sorted(manifest.months):
+            entry = manifest.months[month]
+            print(f"  {month}: {entry['authoritative']} ({len(entry['versions'])} versions)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Streaming k-way merge of monthly CSVs into one date-ordered stream.
+
+Each monthly file is read lazily and the files are merged with heapq.merge
+on the transaction date, so an annual file is written row by row without
+holding the year in memory. heapq.merge keeps equal dates in input order,
+so ties keep statement order, exactly like a stable sort of the rows in
+file order.
+
+Most extractions are already date-ordered. A month that is not (some
+validated files list rows in posting order) is detected with a streaming
+pass over its date column and sorted in memory on its own.
+"""
+
+import csv
+import heapq
+from operator import attrgetter
+from pathlib import Path
+from typing import Iterable, Iterator, List, Tuple
+
+from transaction import Transaction, iter_transactions, read_transactions
+
+DATE_COLUMN = 'Transaction Date'
+
+
+def month_is_sorted(path: Path) -> bool:
+    """Whether a CSV's rows are in date order, reading only the date column."""
+    with open(path, 'r', newline='') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if header is None:
+            return True
+        column = header.index(DATE_COLUMN)
+        previous = ''
+        for row in reader:
+            if not row:
+                continue
+            if row[column] < previous:
+                return False
+            previous = row[column]
+    return True
+
+
+def month_rows(path: Path) -> Tuple[Iterable[Transaction], bool]:
+    """(date-ordered rows of a month, whether the file was already sorted).
+
+    Sorted files are streamed; an unsorted month is loaded and sorted
+    (stably, so same-day rows keep their order).
+    """
+    if month_is_sorted(path):
+        return iter_transactions(path), True
+    return sorted(read_transactions(path), key=attrgetter('date')), False
+
+
+def merge_by_date(streams: List[Iterable]) -> Iterator:
+    """Merge date-ordered streams of Transactions; ties keep stream order."""
+    return heapq.merge(*streams, key=attrgetter('date'))
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Page text loading for statement PDFs with a persistent on-disk cache.
+
+PyPDF2 text extraction is the slowest step of every extraction run, and the
+same statement PDFs are re-run many times while debugging reconciliations.
+Page text is cached on disk keyed by the PDF's SHA-256 plus the extraction
+backend and its version, so a re-run never re-parses an unchanged PDF and an
+upgraded backend never serves stale text. Backends are looked up by name in
+text_backends; PyPDF2 is the default.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import PyPDF2
+
+from text_backends import get_backend
+
+BACKEND = 'PyPDF2'
+BACKEND_VERSION = getattr(PyPDF2, '__version__', 'unknown')
+
+# Cache location (relative to the project root, like the accounts/ tree)
+CACHE_DIR = Path('.cache/page_text')
+# Upper bound on the cache size before least recently used entries are evicted
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+# Below this many pages, process start-up costs more than parallelism saves
+PARALLEL_MIN_PAGES = 8
+
+
+def file_sha256(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PageTextCache:
+    """Size-bounded LRU cache of per-page text stored as one JSON file per PDF."""
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, sha256: str, backend: str, version: str) -> Path:
+        """Path of the cache entry for a document/backend/version combination."""
+        safe_version = version.replace('/', '_')
+        return self.cache_dir / f"{sha256}-{backend}-{safe_version}.json"
+
+    def get(self, sha256: str, backend: str = BACKEND,
+            version: str = BACKEND_VERSION) -> Optional[List[str]]:
+        """Return cached page texts, or None on a miss."""
+        entry = self._entry_path(sha256, backend, version)
+        try:
+            with open(entry, 'r', encoding='utf-8') as f:
+                pages = json.load(f)['pages']
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # Touch the entry so eviction sees it as recently used
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        return pages
+
+    def put(self, sha256: str, pages: List[str], backend: str = BACKEND,
+            version: str = BACKEND_VERSION):
+        """Store page texts and evict old entries if the cache is over budget."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = self._entry_path(sha256, backend, version)
+
+        # Write to a uniquely named temporary file first, so neither a crash
+        # nor another process writing the same entry leaves a torn one
+        with tempfile.NamedTemporaryFile('w', dir=self.cache_dir, prefix=f'{entry.stem}.', suffix='.tmp',
+                                         encoding='utf-8', delete=False) as f:
+            json.dump({'backend': backend, 'version': version, 'pages': pages}, f)
+        os.replace(f.name, entry)
+
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits max_bytes."""
+        entries = []
+        total = 0
+        for entry in self.cache_dir.glob('*.json'):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+                total -= size
+            except OSError:
+                pass
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int, backend: str = BACKEND) -> List[str]:
+    """Extract text for pages [start, stop). Runs in a worker process."""
+    return get_backend(backend).extract_pages(pdf_path, start, stop)
+
+
+def extract_page_texts(pdf_path: str, workers: int = 1,
+                       min_pages: int = PARALLEL_MIN_PAGES, backend: str = BACKEND) -> List[str]:
+    """Extract text from every page of a PDF (no caching).
+
+    With workers > 1, contiguous page ranges are extracted in a process pool
+    and reassembled in page order. PDFs shorter than min_pages, and backends
+    that only read whole documents, are always extracted serially.
+    """
+    text_backend = get_backend(backend)
+    if workers <= 1 or not text_backend.paged:
+        return text_backend.extract_pages(pdf_path)
+
+    page_count = text_backend.page_count(pdf_path)
+    if page_count < min_pages:
+        return text_backend.extract_pages(pdf_path, 0, page_count)
+
+    workers = min(workers, page_count)
+    chunk = -(-page_count // workers)  # Ceiling division
+    ranges = [(start, min(start + chunk, page_count))
+              for start in range(0, page_count, chunk)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_extract_page_range, pdf_path, start, stop, backend)
+                   for start, stop in ranges]
+        # Collect in submission order so pages stay in document order
+        texts = []
+        for future in futures:
+            texts.extend(future.result())
+    return texts
+
+
+def load_page_texts(pdf_path: str, cache: Optional[PageTextCache] = None,
+                    sha256: Optional[str] = None, workers: int = 1,
+                    backend: str = BACKEND) -> List[str]:
+    """Return the text of every page, served from the cache when possible.
+
+    Pass sha256 when the caller has already fingerprinted the file. On a
+    cache miss, workers > 1 extracts pages in parallel.
+    """
+    if cache is None:
+        cache = PageTextCache()
+
+    if sha256 is None:
+        sha256 = file_sha256(pdf_path)
+    version = get_backend(backend).version
+    pages = cache.get(sha256, backend, version)
+    if pages is None:
+        pages = extract_page_texts(pdf_path, workers=workers, backend=backend)
+        cache.put(sha256, pages, backend, version)
+    elif None in pages:
+        # Partial entry left by a lazy run - fill in the pages it skipped
+        # with one backend call over the span they cover
+        missing = [i for i, text in enumerate(pages) if text is None]
+        texts = _extract_page_range(pdf_path, missing[0], missing[-1] + 1, backend)
+        for i in missing:
+            pages[i] = texts[i - missing[0]]
+        cache.put(sha256, pages, backend, version)
+    return pages
+
+
+def load_pages(pdf_path: str, cache: Optional[PageTextCache] = None,
+               sha256: Optional[str] = None, workers: int = 1,
+               backend: str = BACKEND) -> List[Dict]:
+    """Return pages in the extractor format: [{'page_num': 1, 'text': ...}, ...]."""
+    return [
+        {'page_num': page_num + 1, 'text': text}
+        for page_num, text in enumerate(load_page_texts(pdf_path, cache, sha256, workers, backend))
+    ]
+
+
+class LazyPages:
+    """Page list whose text is only extracted when a page is first accessed.
+
+    Behaves like the list returned by load_pages, so extractors can use it
+    as self.pages unchanged. Pages never touched are never parsed. Call
+    save() afterwards to store what was extracted; skipped pages are cached
+    as None and filled in by a later full load. Uses the default PyPDF2
+    backend.
+    """
+
+    def __init__(self, pdf_path: str, cache: Optional[PageTextCache] = None,
+                 sha256: Optional[str] = None):
+        self.pdf_path = pdf_path
+        self.cache = cache if cache is not None else PageTextCache()
+        self.sha256 = sha256 if sha256 is not None else file_sha256(pdf_path)
+        self._reader = None
+        self._dirty = False
+
+        texts = self.cache.get(self.sha256)
+        if texts is None:
+            texts = [None] * len(self._get_reader().pages)
+        self._texts = texts
+
+    def _get_reader(self):
+        """Open the PDF on first use; fully cached documents never open it."""
+        if self._reader is None:
+            self._reader = PyPDF2.PdfReader(self.pdf_path)
+        return self._reader
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+
+        text = self._texts[index]
+        if text is None:
+            text = self._get_reader().pages[index].extract_text()
+            self._texts[index] = text
+            self._dirty = True
+        return {'page_num': index + 1, 'text': text}
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def extracted_count(self) -> int:
+        """Number of pages whose text is available."""
+        return sum(1 for text in self._texts if text is not None)
+
+    def save(self):
+        """Write newly extracted pages back to the cache."""
+        if self._dirty:
+            self.cache.put(self.sha256, self._texts)
+            self._dirty = False
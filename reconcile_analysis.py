@@ -3,64 +3,30 @@ import re
 from decimal import Decimal
 import csv
 
+from chase_lexer import parse_section
+from money import format_dollars, parse_cents
+from transaction import Transaction
+from transaction_matcher import match_transactions
+
 def parse_pdf_transactions(pdf_text):
-    """Parse transactions from PDF text"""
+    """Parse transactions from PDF text with the shared Chase lexer"""
     transactions = []
+    previous_balance = None
     
-    # Pattern to match transaction lines in the PDF
-    # Date (MM/DD) followed by description and amount
-    lines = pdf_text.split('\n')
-    
-    for i, line in enumerate(lines):
-        # Look for lines that start with a date pattern
-        if re.match(r'^\d{2}/\d{2}\s', line):
-            # Extract date
-            date_match = re.match(r'^(\d{2}/\d{2})\s+(.+)', line)
-            if date_match:
-                date = date_match.group(1)
-                rest = date_match.group(2).strip()
-                
-                # Look for amount at the end of line or on next line
-                # Check if amount is on the same line
-                amount_match = re.search(r'[\s-]+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})$', rest)
-                if amount_match:
-                    amount = amount_match.group(1).replace(',', '')
-                    balance = amount_match.group(2).replace(',', '')
-                    description = rest[:amount_match.start()].strip()
-                else:
-                    # Check next line for amount
-                    if i + 1 < len(lines):
-                        next_line = lines[i + 1]
-                        amount_match = re.match(r'^[\s\d-]*([\d,]+\.\d{2})\s+([\d,]+\.\d{2})', next_line)
-                        if amount_match:
-                            amount = amount_match.group(1).replace(',', '')
-                            balance = amount_match.group(2).replace(',', '')
-                            description = rest.strip()
-                        else:
-                            continue
-                    else:
-                        continue
-                
-                # Add a negative sign for debits (all transactions in this statement appear to be debits)
-                amount = '-' + amount if not amount.startswith('-') else amount
-                
-                transactions.append({
-                    'date': date,
-                    'description': description,
-                    'amount': float(amount),
-                    'balance': float(balance)
-                })
-    
-    # Also look for special transactions like interest payment
-    if "Interest Payment" in pdf_text:
-        match = re.search(r'(\d{2}/\d{2})\s+Interest Payment\s+([\d,]+\.\d{2})', pdf_text)
-        if match:
-            transactions.append({
-                'date': match.group(1),
-                'description': 'Interest Payment',
-                'amount': float(match.group(2).replace(',', '')),
-                'balance': float(match.group(2).replace(',', ''))
-            })
+    for date, description, amount, balance, multiline in parse_section(pdf_text.split('\n')):
+        if description == 'Interest Payment' and balance is None and previous_balance is not None:
+            # Only the new balance is printed; the interest is the change from the previous line
+            balance = amount
+            amount = f"{float(balance) - previous_balance:.2f}"
+        
+        transactions.append({
+            'date': date,
+            'description': description,
+            'amount': float(amount),
+            'balance': float(balance) if balance is not None else None
+        })
+        if balance is not None:
+            previous_balance = float(balance)
     
     return transactions
 
@@ -140,59 +106,29 @@ print(f"  Difference: ${difference:,.2f}")
 print(f"\nMISSING TRANSACTIONS FROM CSV:")
 print("=" * 80)
 
-# Look for specific missing transactions mentioned in PDF
-missing_transactions = []
-
-# 1. Interest Payment on 02/07
-if "Interest Payment" in pdf_text:
-    interest_found = any('Interest Payment' in t['description'] for t in csv_transactions)
-    if not interest_found:
-        missing_transactions.append("02/07 Interest Payment: $0.09")
-
-# 2. Buttercup Concord transaction
-buttercup_found = any('Buttercup' in t['description'] for t in csv_transactions)
-if not buttercup_found:
-    missing_transactions.append("01/15 Buttercup Concord: -$44.96")
-
-# 3. Online Transfer on 02/06
-transfer_found = any('Online Transfer' in t['description'] for t in csv_transactions)
-if not transfer_found:
-    missing_transactions.append("02/06 Online Transfer To Chk ...8619: -$4,570.00")
-
-# 4. Additional February transactions from PDF
-feb_transactions_in_pdf = [
-    ("02/02 Dropbox*Gq4Yk3Hbdkkt", -19.99),
-    ("02/03 Lucky #705.Concord", -92.24),
-    ("02/03 Google *Nest", -8.00),
-    ("02/04 Best Little Donut Hous", -14.50),
-    ("02/04 Paypal *Pypl Paymthly", -42.18),
-    ("02/04 House of Sake Inc", -83.55),
-    ("02/06 Treat Blvd 76", -30.86),
-    ("02/05 Jersey Mikes 20367", -13.15),
-    ("02/06 Fast & Easy Liquors", -13.73),
-    ("02/06 Huckleberry's - Concord", -32.23),
-    ("02/07 Fashion Cleaners", -174.80),
-    ("02/07 Wholefds Yvr#105 2941", -94.61),
-    ("02/07 Petroleum & Amenities", -90.20)
-]
-
-for desc, amount in feb_transactions_in_pdf:
-    # Check if transaction exists in CSV
-    found = False
-    for csv_t in csv_transactions:
-        if any(key in csv_t['description'] for key in desc.split()[1:]):
-            found = True
-            break
-    if not found:
-        missing_transactions.append(f"{desc}: ${amount:,.2f}")
+def as_transactions(transactions, year=2025):
+    """Transactions for the matcher from parsed rows with MM/DD or MM-DD dates"""
+    return [
+        Transaction(f"{year}-{t['date'].replace('/', '-')}", t['description'], parse_cents(t['amount']), t.get('type', ''))
+        for t in transactions
+    ]
+
+# Match statement rows to CSV rows by amount, date window and shared words
+result = match_transactions(as_transactions(pdf_transactions), as_transactions(csv_transactions))
+missing_transactions = result['missing']
 
 print(f"\nFound {len(missing_transactions)} missing transactions:")
-for trans in missing_transactions:
-    print(f"  - {trans}")
+for tx in missing_transactions:
+    print(f"  - {tx.date[5:].replace('-', '/')} {tx.description[:50]}: {format_dollars(tx.amount_cents)}")
+
+if result['extra']:
+    print(f"\nCSV transactions not found in the PDF text ({len(result['extra'])}):")
+    for tx in result['extra']:
+        print(f"  - {tx.date[5:].replace('-', '/')} {tx.description[:50]}: {format_dollars(tx.amount_cents)}")
 
 # Calculate total of missing transactions
-missing_total = -44.96 + 0.09 - 4570.00 - 19.99 - 92.24 - 8.00 - 14.50 - 42.18 - 83.55 - 30.86 - 13.15 - 13.73 - 32.23 - 174.80 - 94.61 - 90.20
+missing_total = sum(tx.amount_cents for tx in missing_transactions) / 100
 
 print(f"\nTotal of identified missing transactions: ${missing_total:,.2f}")
 print(f"This accounts for ${missing_total:,.2f} of the ${difference:,.2f} difference")
-print(f"Remaining unexplained difference: ${difference - missing_total:,.2f}")
\ No newline at end of file
+print(f"Remaining unexplained difference: ${difference - missing_total:,.2f}")
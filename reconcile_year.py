@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Reconcile a full year from the statement sidecars and monthly CSVs alone.
+
+For every account and month the authoritative monthly CSV (from the
+manifest) is streamed once and checked against the month's sidecar:
+
+- beginning balance + sum of the rows == ending balance
+- rows dated outside the statement period are counted
+- each month's beginning balance equals the previous month's ending
+
+No PDF is opened, so a year reconciles in well under a second.
+
+Usage:
+    python reconcile_year.py [year]
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from money import format_dollars
+from monthly_manifest import MonthlyManifest
+from statement_summary import SIDECAR_SUFFIX, read_sidecar, sidecar_month
+from transaction import iter_transactions
+
+
+def reconcile_month(summary: Dict, csv_path: Path) -> Dict:
+    """Check one month's CSV against its sidecar. Amounts in cents."""
+    start, end = summary.get('period_start'), summary.get('period_end')
+    rows = net = outside_period = 0
+    for tx in iter_transactions(csv_path):
+        rows += 1
+        net += tx.amount_cents
+        if start and end and not start <= tx.date <= end:
+            outside_period += 1
+
+    beginning, ending = summary.get('beginning_cents'), summary.get('ending_cents')
+    expected = ending - beginning if beginning is not None and ending is not None else None
+    return {
+        'statement_id': summary.get('statement_id'),
+        'csv': csv_path,
+        'rows': rows,
+        'net': net,
+        'expected': expected,
+        'difference': net - expected if expected is not None else None,
+        'outside_period': outside_period,
+        'reconciles': expected is not None and net == expected and outside_period == 0,
+    }
+
+
+def reconcile_directory(directory: Path) -> List[Dict]:
+    """Reconcile every month of one account's monthly directory, in month order.
+
+    Months with a CSV but no sidecar are returned with reconciles=False and
+    no sidecar; they predate sidecars and need a re-extraction.
+    """
+    manifest = MonthlyManifest.load(directory)
+    sidecars = {sidecar_month(path): path for path in directory.glob(f'*{SIDECAR_SUFFIX}')}
+
+    results = []
+    previous_ending: Optional[int] = None
+    for month in sorted(set(manifest.months) | set(sidecars)):
+        csv_path = manifest.authoritative(month)
+        if month not in sidecars or csv_path is None:
+            results.append({'month': month, 'csv': csv_path, 'sidecar': sidecars.get(month), 'reconciles': False})
+            previous_ending = None
+            continue
+
+        summary = read_sidecar(sidecars[month])
+        result = reconcile_month(summary, csv_path)
+        result['month'] = month
+        result['sidecar'] = sidecars[month]
+        beginning = summary.get('beginning_cents')
+        result['chain_break'] = (previous_ending is not None and beginning is not None
+                                 and beginning != previous_ending)
+        if result['chain_break']:
+            result['reconciles'] = False
+        previous_ending = summary.get('ending_cents')
+        results.append(result)
+    return results
+
+
+def print_directory_report(directory: Path, results: List[Dict]):
+    """One line per month."""
+    print(f"\n{directory.parent.parent.name} {directory.parent.name}")
+    for result in results:
+        month = result['month']
+        if result.get('sidecar') is None:
+            print(f"  {month}: ✗ no sidecar (re-run extraction for {result['csv'].name if result['csv'] else month})")
+            continue
+        if result['csv'] is None:
+            print(f"  {month}: ✗ sidecar without a monthly CSV")
+            continue
+
+        status = '✓' if result['reconciles'] else '✗'
+        line = f"  {month}: {status} {result['rows']:>4} rows, net {format_dollars(result['net']):>12}"
+        if result['expected'] is None:
+            line += ", balances not printed"
+        elif result['difference']:
+            line += f", expected {format_dollars(result['expected'])} (off by {format_dollars(result['difference'])})"
+        if result['outside_period']:
+            line += f", {result['outside_period']} rows outside the period"
+        if result['chain_break']:
+            line += ", beginning balance differs from the previous ending"
+        print(line)
+
+
+def main():
+    """Reconcile every account of a year."""
+    year = int(sys.argv[1]) if len(sys.argv) > 1 else 2025
+
+    start_time = time.perf_counter()
+    reconciled = total = 0
+    for directory in sorted(Path('accounts').glob(f'*/{year}/monthly')):
+        results = reconcile_directory(directory)
+        print_directory_report(directory, results)
+        total += len(results)
+        reconciled += sum(1 for result in results if result['reconciles'])
+    elapsed = (time.perf_counter() - start_time) * 1000
+
+    print(f"\n{reconciled} of {total} statement months reconcile ({elapsed:.0f} ms)")
+    sys.exit(0 if reconciled == total else 1)
+
+
+if __name__ == "__main__":
+    main()
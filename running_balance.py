@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Single-pass running-balance check for extracted Chase transactions.
+
+Chase prints the account balance after each transaction line. Walking the
+rows in statement order, every printed balance must equal the previous
+balance plus the amounts in between, so the first row where that fails is
+where the extraction drifted. Either that row's amount is wrong or a
+transaction is missing just before it. This replaces diffing a statement
+against the CSV by hand (detailed_reconciliation.py).
+
+Usage:
+    python running_balance.py <statement.pdf> [account]
+"""
+
+import sys
+from typing import Dict, List, Optional
+
+from money import format_dollars
+from transaction import Transaction
+
+
+def find_first_drift(transactions: List[Transaction], beginning_cents: int,
+                     ending_cents: Optional[int] = None) -> Optional[Dict]:
+    """Return the first row whose printed balance disagrees, or None.
+
+    Rows without a printed balance are carried forward and checked at the
+    next row that has one. With ending_cents, the final balance is checked
+    too (index == len(transactions) when only that check fails). Amounts
+    are integer cents.
+    """
+    balance = beginning_cents
+    last_verified = -1  # Index of the last row whose printed balance matched
+
+    for index, tx in enumerate(transactions):
+        balance += tx.amount_cents
+        if tx.balance_cents is None:
+            continue
+        if balance != tx.balance_cents:
+            return {
+                'index': index,
+                'transaction': tx,
+                'after_index': last_verified,
+                'expected_cents': balance,
+                'printed_cents': tx.balance_cents,
+                'difference_cents': tx.balance_cents - balance,
+            }
+        last_verified = index
+
+    if ending_cents is not None and balance != ending_cents:
+        return {
+            'index': len(transactions),
+            'transaction': None,
+            'after_index': last_verified,
+            'expected_cents': balance,
+            'printed_cents': ending_cents,
+            'difference_cents': ending_cents - balance,
+        }
+    return None
+
+
+def describe_drift(drift: Dict) -> str:
+    """One-line description of a drift found by find_first_drift."""
+    tx = drift['transaction']
+    where = (f"row {drift['index'] + 1} ({tx.date} {tx.description[:50]} {format_dollars(tx.amount_cents)})"
+             if tx is not None else "the ending balance")
+    return (f"Running balance breaks at {where}: expected {format_dollars(drift['expected_cents'])}, "
+            f"statement shows {format_dollars(drift['printed_cents'])} "
+            f"(off by {format_dollars(drift['difference_cents'])})")
+
+
+def main():
+    """Check the running balance of every account section in a statement."""
+    from extract_chase_robust import ChaseRobustExtractor
+
+    if len(sys.argv) < 2:
+        print("Usage: python running_balance.py <statement.pdf> [account]")
+        sys.exit(1)
+
+    extractor = ChaseRobustExtractor(sys.argv[1])
+    extractor.extract_all_accounts(sys.argv[2] if len(sys.argv) > 2 else None)
+
+    print("\nRunning balance check")
+    print("=" * 70)
+    for account, info in extractor.account_sections.items():
+        transactions = info['statement_order']
+        drift = info['balance_drift']
+        if drift is None:
+            print(f"Account {account}: ✓ every printed balance matches ({len(transactions)} rows)")
+            continue
+
+        print(f"Account {account}: ✗ {describe_drift(drift)}")
+        # Rows since the last verified balance, where the problem must be
+        for index in range(drift['after_index'] + 1, min(drift['index'] + 1, len(transactions))):
+            tx = transactions[index]
+            printed = format_dollars(tx.balance_cents) if tx.balance_cents is not None else '-'
+            print(f"    {index + 1:>4} {tx.date} {format_dollars(tx.amount_cents):>12} {printed:>14}  {tx.description[:50]}")
+
+
+if __name__ == "__main__":
+    main()
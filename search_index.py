@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Full-text search over extracted descriptions and raw statement text.
+
+Two SQLite FTS5 indexes live next to the transaction store in
+accounts/transactions.db:
+
+- description_index mirrors the description of every stored transaction.
+  It is an external-content index kept in sync by triggers, so rows the
+  extractors write after the first build are searchable immediately.
+- line_index holds every raw text line of the statement PDFs (through the
+  page text cache) and of the text dumps (pdf_extract.txt,
+  archive/*.txt), keyed to file, page and line. Files are re-indexed only
+  when their SHA-256 changes.
+
+Search terms are matched as word prefixes, case-insensitively, and every
+term must appear: "Transaction#: 2354" finds Transaction#: 23541234567.
+
+Usage:
+    python search_index.py build [file_or_dir ...]
+    python search_index.py <terms ...>
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from money import format_dollars
+from monthly_manifest import MONTHLY_FILE_RE
+from pdf_text import file_sha256, load_page_texts
+from transaction_store import TransactionStore
+
+SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS description_index
+    USING fts5(description, content='transactions', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS description_index_insert AFTER INSERT ON transactions BEGIN
+    INSERT INTO description_index (rowid, description) VALUES (new.id, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS description_index_delete AFTER DELETE ON transactions BEGIN
+    INSERT INTO description_index (description_index, rowid, description)
+        VALUES ('delete', old.id, old.description);
+END;
+CREATE VIRTUAL TABLE IF NOT EXISTS line_index USING fts5(text, path UNINDEXED, page UNINDEXED, line UNINDEXED);
+CREATE TABLE IF NOT EXISTS indexed_files (path TEXT PRIMARY KEY, sha256 TEXT NOT NULL);
+"""
+
+# Raw text indexed when build is given no paths
+DEFAULT_SOURCES = [Path('pdf_extract.txt'), Path('archive'), Path('accounts')]
+
+# PyPDF2 prints the Chase page footer at the top of each page: "3  6 Pageof..."
+PAGE_MARKER_RE = re.compile(r'^\s*(\d+)\s+\d+\s*Page\s*of')
+
+TERM_RE = re.compile(r'\w+')
+
+
+def fts_query(text: str) -> Optional[str]:
+    """FTS5 query requiring every word of text as a prefix, or None if text has no words."""
+    terms = TERM_RE.findall(text)
+    if not terms:
+        return None
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def _is_text(line: str) -> bool:
+    """Whether a line is worth indexing (skips blank lines and binary noise in raw PDF dumps)."""
+    return line.isprintable() and '\ufffd' not in line and any(c.isalnum() for c in line)
+
+
+def dump_lines(path: Path) -> Iterator[Tuple[Optional[int], int, str]]:
+    """(page, line number, text) of a text dump.
+
+    Pages follow form feeds, or the Chase page footer in PyPDF2 output;
+    a raw PDF byte dump has no pages.
+    """
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        first = f.readline()
+        f.seek(0)
+        page = None if first.startswith('%PDF') else 1
+        for line_num, line in enumerate(f, 1):
+            if page is not None:
+                page += line.count('\f')
+                marker = PAGE_MARKER_RE.match(line)
+                if marker:
+                    page = int(marker.group(1))
+            line = line.replace('\f', '').strip()
+            if _is_text(line):
+                yield page, line_num, line
+
+
+def pdf_lines(path: Path, sha256: str) -> Iterator[Tuple[Optional[int], int, str]]:
+    """(page, line number within the page, text) of a statement PDF."""
+    for page_num, text in enumerate(load_page_texts(str(path), sha256=sha256), 1):
+        for line_num, line in enumerate((text or '').splitlines(), 1):
+            line = line.strip()
+            if _is_text(line):
+                yield page_num, line_num, line
+
+
+def source_files(paths: List[Path]) -> List[Path]:
+    """Text dumps and PDFs named directly or found under directories."""
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(p for p in path.rglob('*') if p.suffix.lower() in ('.txt', '.pdf')))
+        elif path.exists():
+            files.append(path)
+    return files
+
+
+
+def source_path(account: str, statement_id: str, source: str) -> Optional[str]:
+    """Path of the monthly CSV a stored row came from.
+
+    The year is the file's own: a January file also holds rows of the
+    December statement.
+    """
+    if not source:
+        return None
+    match = MONTHLY_FILE_RE.match(source)
+    year = match.group('month')[:4] if match else statement_id[:4]
+    return str(Path('accounts') / account / year / 'monthly' / source)
+
+class SearchIndex:
+    """FTS5 indexes inside the transaction store database."""
+
+    def __init__(self, store: TransactionStore):
+        self.conn = store.conn
+        self.conn.executescript(SCHEMA)
+
+    def rebuild_descriptions(self):
+        """Re-read every stored description (transactions written before the triggers existed)."""
+        with self.conn:
+            self.conn.execute("INSERT INTO description_index (description_index) VALUES ('rebuild')")
+
+    def index_file(self, path: Path) -> Optional[int]:
+        """Index the lines of one dump or PDF. Returns the line count, or None if unchanged."""
+        key = str(path)
+        sha256 = file_sha256(key)
+        stored = self.conn.execute('SELECT sha256 FROM indexed_files WHERE path = ?', (key,)).fetchone()
+        if stored is not None and stored[0] == sha256:
+            return None
+
+        lines = pdf_lines(path, sha256) if path.suffix.lower() == '.pdf' else dump_lines(path)
+        rows = [(text, key, page, line_num) for page, line_num, text in lines]
+        with self.conn:
+            self.conn.execute('DELETE FROM line_index WHERE path = ?', (key,))
+            self.conn.executemany('INSERT INTO line_index (text, path, page, line) VALUES (?, ?, ?, ?)', rows)
+            self.conn.execute('INSERT OR REPLACE INTO indexed_files VALUES (?, ?)', (key, sha256))
+        return len(rows)
+
+    def search_descriptions(self, text: str, limit: int = 50) -> List[Dict]:
+        """Stored transactions whose description matches, in date order."""
+        query = fts_query(text)
+        if query is None:
+            return []
+        rows = self.conn.execute(
+            'SELECT t.date, t.account, t.amount_cents, t.description, t.statement_id, t.seq, s.source '
+            'FROM description_index JOIN transactions t ON t.id = description_index.rowid '
+            'LEFT JOIN statements s ON s.statement_id = t.statement_id '
+            'WHERE description_index MATCH ? ORDER BY t.date, t.statement_id, t.seq LIMIT ?',
+            (query, limit)
+        )
+        return [
+            {'date': date, 'account': account, 'amount_cents': amount_cents, 'description': description,
+             'statement_id': statement_id,
+             # Monthly CSV the row was stored from (seq is its row there); line 1 is the header
+             'path': source_path(account, statement_id, source),
+             'line': seq + 2}
+            for date, account, amount_cents, description, statement_id, seq, source in rows
+        ]
+
+    def search_lines(self, text: str, limit: int = 50) -> List[Dict]:
+        """Raw statement lines that match, by file, page and line."""
+        query = fts_query(text)
+        if query is None:
+            return []
+        rows = self.conn.execute(
+            'SELECT path, page, line, text FROM line_index WHERE line_index MATCH ? ORDER BY path, page, line LIMIT ?',
+            (query, limit)
+        )
+        return [{'path': path, 'page': page, 'line': line, 'text': text} for path, page, line, text in rows]
+
+
+def main():
+    """Build the indexes or search them."""
+    if len(sys.argv) < 2:
+        print(__doc__.split('Usage:')[1].rstrip())
+        sys.exit(1)
+
+    with TransactionStore() as store:
+        index = SearchIndex(store)
+
+        if sys.argv[1] == 'build':
+            index.rebuild_descriptions()
+            paths = [Path(arg) for arg in sys.argv[2:]] or DEFAULT_SOURCES
+            for path in source_files(paths):
+                try:
+                    count = index.index_file(path)
+                except Exception as e:
+                    print(f"  ✗ {path}: {e}")
+                    continue
+                if count is not None:
+                    print(f"  Indexed {count} lines of {path}")
+            print(f"Search index built in {store.path}")
+            return
+
+        text = ' '.join(sys.argv[1:])
+        start_time = time.perf_counter()
+        descriptions = index.search_descriptions(text)
+        lines = index.search_lines(text)
+        elapsed = (time.perf_counter() - start_time) * 1000
+
+        print(f"\nTransactions ({len(descriptions)}):")
+        for hit in descriptions:
+            print(f"  {hit['date']} {hit['account']:<14} {format_dollars(hit['amount_cents']):>13}  "
+                  f"{hit['description'][:70]}")
+            print(f"      {hit['path']}:{hit['line']}")
+
+        print(f"\nStatement lines ({len(lines)}):")
+        for hit in lines:
+            page = f" p.{hit['page']}" if hit['page'] is not None else ''
+            print(f"  {hit['path']}{page}:{hit['line']}: {hit['text'][:100]}")
+
+        print(f"\n{len(descriptions) + len(lines)} hits ({elapsed:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
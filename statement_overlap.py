@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Drop rows that two statements both contain when consolidating a year.
+
+Chase statement periods straddle calendar months (Jan 9 - Feb 7), and an
+extraction sometimes keeps rows from the neighbouring period, so the same
+transaction can reach the consolidated file from two monthly files.
+
+Each row is fingerprinted as (date, cents, description with only layout
+differences removed; transaction ids are kept). Within one statement a
+fingerprint may legitimately repeat - two identical "Cowell Hoa" charges
+on the same day - so occurrences are counted per statement id: the k-th
+occurrence of a fingerprint in a statement is kept only when no earlier
+statement already supplied k of them. One hashed pass, in file order.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+from chase_lexer import LEADING_DATE_RE
+from transaction import Transaction
+
+Fingerprint = Tuple[str, int, str]
+
+
+def overlap_description(description: str) -> str:
+    """Description with the layout differences between extractions removed.
+
+    Only a leading MM/DD and the trailing sign column are dropped, and case
+    and repeated spaces folded. Transaction numbers and Zelle/Venmo ids are
+    kept: they are what tells two same-day, same-amount transfers apart.
+    """
+    description = LEADING_DATE_RE.sub('', description).rstrip()
+    if description.endswith('-'):
+        description = description[:-1]
+    return ' '.join(description.lower().split())
+
+
+def fingerprint(tx: Transaction) -> Fingerprint:
+    """(date, cents, overlap_description()) of a row."""
+    return (tx.date, tx.amount_cents, overlap_description(tx.description))
+
+
+class OverlapFilter:
+    """Streaming form of the check: feed rows one at a time in statement order.
+
+    Rows sharing a fingerprint share a date, so a stream merged by date
+    (ties in statement order) is filtered exactly like the rows in file
+    order. With date_ordered, counts are forgotten once the stream moves
+    past their date, so memory is bounded by the busiest day.
+    """
+
+    def __init__(self, date_ordered: bool = False):
+        self.date_ordered = date_ordered
+        self.current_date = None
+        self.kept_counts: Dict[Fingerprint, int] = {}
+        self.occurrences: Dict[Tuple[str, Fingerprint], int] = {}
+
+    def _advance(self, date: str):
+        if self.date_ordered and date != self.current_date:
+            self.current_date = date
+            self.kept_counts.clear()
+            self.occurrences.clear()
+
+    def add_kept(self, tx: Transaction):
+        """Count a row kept by an earlier run (an incremental re-merge)."""
+        self._advance(tx.date)
+        key = fingerprint(tx)
+        self.kept_counts[key] = self.kept_counts.get(key, 0) + 1
+
+    def keep(self, tx: Transaction) -> bool:
+        """Whether a row is new rather than a copy from an earlier statement."""
+        self._advance(tx.date)
+        key = fingerprint(tx)
+        scoped = (tx.statement_id, key)
+        occurrence = self.occurrences[scoped] = self.occurrences.get(scoped, 0) + 1
+        if occurrence > self.kept_counts.get(key, 0):
+            self.kept_counts[key] = occurrence
+            return True
+        return False
+
+
+def drop_overlap_duplicates(transactions: List[Transaction],
+                            already_kept: Iterable[Transaction] = ()) -> Tuple[List[Transaction], List[Transaction]]:
+    """Split rows (in statement order) into (kept, dropped cross-statement duplicates).
+
+    already_kept holds rows kept earlier from preceding statements (an
+    incremental re-merge); they count against the new rows but are not
+    returned.
+    """
+    overlap = OverlapFilter()
+    for tx in already_kept:
+        overlap.add_kept(tx)
+
+    kept = []
+    dropped = []
+    for tx in transactions:
+        (kept if overlap.keep(tx) else dropped).append(tx)
+    return kept, dropped
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Extract each shared Chase multi-account statement exactly once.
+
+Chase sends a single PDF holding 2084, 1873 and 8619, and a copy of it is
+filed under each account's folder. The registry fingerprints every PDF by
+content hash so identical copies collapse to one document, runs
+extract_all_accounts once per unique document, and saves every account
+section found in it.
+"""
+
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from extract_chase_robust import ChaseRobustExtractor
+from pdf_text import file_sha256
+
+
+class StatementRegistry:
+    """Registry of statement PDFs grouped by content hash."""
+
+    def __init__(self):
+        self.documents: Dict[str, List[Path]] = {}
+
+    def add(self, pdf_path) -> str:
+        """Register a PDF and return its content hash."""
+        pdf_path = Path(pdf_path)
+        sha256 = file_sha256(str(pdf_path))
+        copies = self.documents.setdefault(sha256, [])
+        if pdf_path not in copies:
+            copies.append(pdf_path)
+        return sha256
+
+    def add_directory(self, root) -> int:
+        """Register every PDF under a directory tree. Returns the number found."""
+        count = 0
+        for pdf_path in sorted(Path(root).rglob('*.pdf')):
+            self.add(pdf_path)
+            count += 1
+        return count
+
+    def unique_documents(self) -> Dict[str, List[Path]]:
+        """Map of content hash -> every path holding that document."""
+        return self.documents
+
+    def duplicate_count(self) -> int:
+        """Number of registered copies that will not be parsed again."""
+        return sum(len(copies) - 1 for copies in self.documents.values())
+
+
+def extract_registered(registry: StatementRegistry) -> Dict[str, List[Path]]:
+    """Run extraction once per unique document and save every account section.
+
+    Returns a map of content hash -> saved CSV paths.
+    """
+    saved = {}
+    for sha256, copies in registry.unique_documents().items():
+        pdf_path = copies[0]
+        print(f"\n{'=' * 70}")
+        print(f"Extracting {pdf_path.name} ({sha256[:12]})")
+        if len(copies) > 1:
+            print(f"  Skipping {len(copies) - 1} identical copies:")
+            for copy in copies[1:]:
+                print(f"    {copy}")
+        print(f"{'=' * 70}")
+
+        extractor = ChaseRobustExtractor(str(pdf_path), sha256=sha256)
+        extractor.extract_all_accounts()
+
+        saved[sha256] = []
+        for account in extractor.account_sections:
+            output_path = extractor.save_transactions(account)
+            if output_path:
+                saved[sha256].append(output_path)
+    return saved
+
+
+def main():
+    """Extract every unique statement among the given PDFs and directories."""
+    if len(sys.argv) < 2:
+        print("Usage: python statement_registry.py <pdf_or_dir> [<pdf_or_dir> ...]")
+        print("Example: python statement_registry.py 'Bank Statements 2025/'")
+        sys.exit(1)
+
+    registry = StatementRegistry()
+    for arg in sys.argv[1:]:
+        path = Path(arg)
+        if path.is_dir():
+            registry.add_directory(path)
+        else:
+            registry.add(path)
+
+    total = sum(len(copies) for copies in registry.unique_documents().values())
+    print(f"Registered {total} PDFs: {len(registry.unique_documents())} unique, "
+          f"{registry.duplicate_count()} duplicate copies")
+
+    saved = extract_registered(registry)
+
+    print(f"\nSaved {sum(len(paths) for paths in saved.values())} monthly files "
+          f"from {len(saved)} unique statements")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Statement summary metadata saved as a JSON sidecar next to each monthly CSV.
+
+The printed summary of a statement - its period, beginning and ending
+balances and the category totals - is parsed once at extraction and saved
+as accounts/<Bank NNNN>/<year>/monthly/<base>.summary.json, e.g.
+chase_1873_2025-02.summary.json:
+
+    {"statement_id": "2025-02 - Chase 1873", "account": "Chase 1873",
+     "source": "20250207-statements-1873-.pdf",
+     "period_start": "2025-01-09", "period_end": "2025-02-07",
+     "beginning_cents": 1608731, "ending_cents": 52822,
+     "totals": {"deposits": 9, "checks": -28000, "cards": -449680,
+                "electronic": -1078238}}
+
+Totals are in cents with the sign printed on the statement. Reconciliation
+reads the sidecars instead of re-opening the PDF (see reconcile_year.py).
+"""
+
+import json
+import os
+import re
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from money import parse_cents
+
+SIDECAR_SUFFIX = '.summary.json'
+
+# Printed summary label -> totals key
+CHASE_SUMMARY_LABELS = {
+    'Deposits and Additions': 'deposits',
+    'Checks Paid': 'checks',
+    'ATM & Debit Card Withdrawals': 'cards',
+    'Electronic Withdrawals': 'electronic',
+    'Fees': 'fees',
+}
+DISCOVER_SUMMARY_LABELS = {
+    'Previous Balance': 'beginning',
+    'Payments and Credits': 'payments',
+    'Purchases': 'purchases',
+    'Balance Transfers': 'balance_transfers',
+    'Cash Advances': 'cash_advances',
+    'Fees Charged': 'fees',
+    'Interest Charged': 'interest',
+}
+
+MONTH_NAMES = ('January|February|March|April|May|June|July|August|September|October|November|December')
+
+# "January 09, 2025 throughFebruary 07, 2025"
+CHASE_PERIOD_RE = re.compile(
+    rf'((?:{MONTH_NAMES})\s+\d{{1,2}},\s*\d{{4}})\s*through\s*((?:{MONTH_NAMES})\s+\d{{1,2}},\s*\d{{4}})'
+)
+# "OPEN TO CLOSE DATE: 12/13/2024  -01/12/2025"
+DISCOVER_PERIOD_RE = re.compile(r'(\d{2}/\d{2}/\d{4})\s*-\s*(\d{2}/\d{2}/\d{4})')
+# The New Balance amount is printed mid-line: "statementNew Balance: $8,033.78"
+DISCOVER_NEW_BALANCE_RE = re.compile(r'New Balance:\s*(\$[\d,]+\.\d{2})')
+
+
+def _summary_line_re(labels: Dict[str, str]) -> re.Pattern:
+    """Regex for 'Label  -1,234.56' at the start of a line.
+
+    Anchoring at the line start keeps "Total Checks Paid $280.00" from
+    counting as "Checks Paid"; leading symbols ("$Previous Balance") are
+    allowed. Longer labels are tried first so "Fees Charged" is not read
+    as "Fees".
+    """
+    alternatives = '|'.join(re.escape(label) for label in sorted(labels, key=len, reverse=True))
+    return re.compile(
+        rf'^[^\w\n]*(?P<label>{alternatives})[ \t]*:?[ \t]*(?P<amount>[-+]?[ \t]*\$?[\d,]+\.\d{{2}})',
+        re.MULTILINE
+    )
+
+
+CHASE_SUMMARY_RE = _summary_line_re(CHASE_SUMMARY_LABELS)
+DISCOVER_SUMMARY_RE = _summary_line_re(DISCOVER_SUMMARY_LABELS)
+
+
+def parse_summary_totals(text: str, labels: Dict[str, str], pattern: re.Pattern) -> Dict[str, int]:
+    """First printed amount of every summary label found in text, in cents."""
+    totals = {}
+    for match in pattern.finditer(text):
+        key = labels[match.group('label')]
+        if key not in totals:
+            totals[key] = parse_cents(match.group('amount'))
+    return totals
+
+
+def _iso_date(text: str, formats: List[str]) -> Optional[str]:
+    text = ' '.join(text.replace(',', ', ').split())
+    for fmt in formats:
+        try:
+            return datetime.strptime(text, fmt).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    return None
+
+
+def chase_period(text: str) -> Dict[str, Optional[str]]:
+    """{'period_start', 'period_end'} as YYYY-MM-DD (None when not printed)."""
+    if match := CHASE_PERIOD_RE.search(text):
+        return {'period_start': _iso_date(match.group(1), ['%B %d, %Y']),
+                'period_end': _iso_date(match.group(2), ['%B %d, %Y'])}
+    return {'period_start': None, 'period_end': None}
+
+
+def discover_period(text: str) -> Dict[str, Optional[str]]:
+    """{'period_start', 'period_end'} of a Discover statement's open-to-close dates."""
+    if match := DISCOVER_PERIOD_RE.search(text):
+        return {'period_start': _iso_date(match.group(1), ['%m/%d/%Y']),
+                'period_end': _iso_date(match.group(2), ['%m/%d/%Y'])}
+    return {'period_start': None, 'period_end': None}
+
+
+def discover_summary(text: str) -> Dict:
+    """Period, balances and summary totals of a Discover statement's text."""
+    totals = parse_summary_totals(text, DISCOVER_SUMMARY_LABELS, DISCOVER_SUMMARY_RE)
+    beginning = totals.pop('beginning', None)
+    ending = DISCOVER_NEW_BALANCE_RE.search(text)
+    return {
+        **discover_period(text),
+        'beginning_cents': beginning,
+        'ending_cents': parse_cents(ending.group(1)) if ending else None,
+        'totals': totals,
+    }
+
+
+def sidecar_path(output_dir: Path, base_filename: str) -> Path:
+    """Sidecar of a month, e.g. monthly/chase_1873_2025-02.summary.json.
+
+    The summary describes the statement, not one extraction of it, so all
+    versions of a month share one sidecar.
+    """
+    return Path(output_dir) / f"{base_filename}{SIDECAR_SUFFIX}"
+
+
+def write_sidecar(path: Path, metadata: Dict):
+    """Write a sidecar atomically (through a uniquely named temporary file)."""
+    path = Path(path)
+    with tempfile.NamedTemporaryFile('w', dir=path.parent, prefix=f'{path.name}.', suffix='.tmp',
+                                     encoding='utf-8', delete=False) as f:
+        json.dump(metadata, f, indent=2)
+    os.replace(f.name, path)
+
+
+def read_sidecar(path: Path) -> Dict:
+    """Load a sidecar written by write_sidecar()."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def sidecar_month(path: Path) -> str:
+    """'YYYY-MM' of a sidecar from its name."""
+    return Path(path).name[:-len(SIDECAR_SUFFIX)][-7:]
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Reconcile extracted rows against the printed Chase CHECKING SUMMARY, bucket by bucket.
+
+The summary splits a statement's activity into:
+
+    Deposits and Additions          deposits
+    Checks Paid                     checks
+    ATM & Debit Card Withdrawals    cards
+    Electronic Withdrawals          electronic
+    Fees                            fees
+
+One pass over the rows adds each integer amount to its bucket; each bucket
+is then compared with the printed line (from the statement sidecar), so a
+difference points at the kind of row that is missing or misplaced instead
+of only at the net balance. Chase omits a summary line whose total is zero.
+
+Usage (every Chase account and month with a sidecar):
+    python summary_reconciliation.py [year]
+"""
+
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from categorizer import MEMO_SIZE, normalize_description
+from money import format_dollars
+from monthly_manifest import MonthlyManifest
+from statement_summary import SIDECAR_SUFFIX, read_sidecar, sidecar_month
+from transaction import Transaction, iter_transactions
+
+SUMMARY_BUCKETS = ('deposits', 'checks', 'cards', 'electronic', 'fees')
+
+CHECK_RE = re.compile(r'^\s*Check\s*#', re.IGNORECASE)
+FEE_RE = re.compile(r'\bFee\b', re.IGNORECASE)
+# Debit card rows end in "Card 0665"; ATM rows may not name the card
+CARD_RE = re.compile(r'Card Purchase|\bCard\s+\d{4}\b|\bATM\b', re.IGNORECASE)
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _withdrawal_bucket(description: str) -> str:
+    """Summary bucket of a (normalized) withdrawal description."""
+    if CHECK_RE.search(description):
+        return 'checks'
+    if FEE_RE.search(description) and not CARD_RE.search(description):
+        return 'fees'
+    if CARD_RE.search(description):
+        return 'cards'
+    return 'electronic'
+
+
+def summary_bucket(tx: Transaction) -> str:
+    """CHECKING SUMMARY bucket a row is counted in."""
+    if tx.amount_cents > 0:
+        return 'deposits'
+    return _withdrawal_bucket(normalize_description(tx.description))
+
+
+class BucketTotals:
+    """Running per-bucket totals in cents, signed as printed (withdrawals negative)."""
+
+    def __init__(self):
+        self.totals = dict.fromkeys(SUMMARY_BUCKETS, 0)
+        self.counts = dict.fromkeys(SUMMARY_BUCKETS, 0)
+
+    def add(self, tx: Transaction):
+        bucket = summary_bucket(tx)
+        self.totals[bucket] += tx.amount_cents
+        self.counts[bucket] += 1
+
+    @property
+    def net(self) -> int:
+        return sum(self.totals.values())
+
+
+def bucket_totals(transactions: Iterable[Transaction]) -> BucketTotals:
+    """Aggregate every bucket in one pass."""
+    buckets = BucketTotals()
+    for tx in transactions:
+        buckets.add(tx)
+    return buckets
+
+
+def compare_buckets(buckets: BucketTotals, printed: Optional[Dict[str, int]]) -> Dict[str, Dict]:
+    """Per-bucket {'extracted', 'printed', 'difference', 'rows'} (cents).
+
+    A bucket the summary does not print is compared against zero; with no
+    printed summary at all, printed and difference are None.
+    """
+    diff = {}
+    for bucket in SUMMARY_BUCKETS:
+        extracted = buckets.totals[bucket]
+        expected = printed.get(bucket, 0) if printed else None
+        diff[bucket] = {
+            'extracted': extracted,
+            'printed': expected,
+            'difference': extracted - expected if expected is not None else None,
+            'rows': buckets.counts[bucket],
+        }
+    return diff
+
+
+def reconcile_summary(transactions: Iterable[Transaction], beginning_cents: int, ending_cents: int,
+                      printed: Optional[Dict[str, int]] = None) -> Dict:
+    """Balance check plus per-bucket diff of one account's statement.
+
+    Returns {'beginning', 'ending', 'calculated_ending', 'difference',
+    'buckets': compare_buckets(), 'mismatched': [bucket, ...],
+    'reconciles'}. It reconciles when the balances agree and no printed
+    bucket differs.
+    """
+    buckets = bucket_totals(transactions)
+    diff = compare_buckets(buckets, printed)
+    calculated_ending = beginning_cents + buckets.net
+    mismatched = [bucket for bucket, entry in diff.items() if entry['difference']]
+    return {
+        'beginning': beginning_cents,
+        'ending': ending_cents,
+        'calculated_ending': calculated_ending,
+        'difference': calculated_ending - ending_cents,
+        'buckets': diff,
+        'mismatched': mismatched,
+        'reconciles': calculated_ending == ending_cents and not mismatched,
+    }
+
+
+def reconcile_all(root: Path = Path('accounts'), year: Optional[int] = None) -> List[Dict]:
+    """reconcile_summary() for every Chase account and month that has a sidecar.
+
+    Each result also carries 'account', 'month' and 'csv' (the month's
+    authoritative file).
+    """
+    pattern = f'Chase */{year}/monthly' if year is not None else 'Chase */*/monthly'
+    results = []
+    for directory in sorted(Path(root).glob(pattern)):
+        manifest = MonthlyManifest.load(directory)
+        for sidecar in sorted(directory.glob(f'*{SIDECAR_SUFFIX}')):
+            month = sidecar_month(sidecar)
+            csv_path = manifest.authoritative(month)
+            summary = read_sidecar(sidecar)
+            if csv_path is None or summary.get('beginning_cents') is None or summary.get('ending_cents') is None:
+                continue
+            result = reconcile_summary(iter_transactions(csv_path), summary['beginning_cents'],
+                                       summary['ending_cents'], summary.get('totals') or None)
+            result.update(account=summary.get('account', directory.parent.parent.name), month=month, csv=csv_path)
+            results.append(result)
+    return results
+
+
+def print_summary_reconciliation(result: Dict):
+    """Per-bucket table of one reconcile_summary() result."""
+    status = '✓' if result['reconciles'] else '✗'
+    label = ' '.join(str(result[key]) for key in ('account', 'month') if result.get(key))
+    print(f"\n{status} {label}: "
+          f"{format_dollars(result['beginning'])} -> {format_dollars(result['calculated_ending'])} "
+          f"(statement {format_dollars(result['ending'])}, difference {format_dollars(result['difference'])})")
+    for bucket, entry in result['buckets'].items():
+        if entry['printed'] is None:
+            print(f"    {bucket:<11} {format_dollars(entry['extracted']):>13}  ({entry['rows']} rows, no printed summary)")
+            continue
+        mark = '✓' if not entry['difference'] else f"✗ off by {format_dollars(entry['difference'])}"
+        print(f"    {bucket:<11} {format_dollars(entry['extracted']):>13} vs {format_dollars(entry['printed']):>13}  "
+              f"({entry['rows']} rows) {mark}")
+
+
+def main():
+    """Reconcile every Chase account and month of a year against its printed summary."""
+    year = int(sys.argv[1]) if len(sys.argv) > 1 else 2025
+    results = reconcile_all(year=year)
+    for result in results:
+        print_summary_reconciliation(result)
+
+    passed = sum(1 for result in results if result['reconciles'])
+    print(f"\n{passed} of {len(results)} statements reconcile bucket by bucket")
+    sys.exit(0 if passed == len(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
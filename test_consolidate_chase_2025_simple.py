@@ -0,0 +1,51 @@
+"""
+Incremental consolidation must match a full rebuild.
+
+Run with: python -m pytest test_consolidate_chase_2025_simple.py
+"""
+
+import csv
+from pathlib import Path
+
+from consolidate_chase_2025_simple import consolidate_account
+from monthly_files import CSV_FIELDNAMES
+
+ACCOUNT = '9999'
+STATEMENT_A = '2025-01 - Chase 9999'  # Rows in the 01 and 02 monthly files
+STATEMENT_B = '2025-02 - Chase 9999'  # Rows in the 02 and 03 monthly files
+
+
+def write_month(month: str, rows):
+    """Monthly CSV of (description, amount, date, statement id) rows."""
+    directory = Path(f"accounts/Chase {ACCOUNT}/2025/monthly")
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / f"chase_{ACCOUNT}_2025-{month}.csv", 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDNAMES)
+        for description, amount, date, statement_id in rows:
+            writer.writerow([description, amount, date, 'Debit' if amount.startswith('-') else 'Credit',
+                             'New', statement_id, f'Chase {ACCOUNT}'])
+
+
+def consolidated() -> str:
+    return Path(f"accounts/Chase {ACCOUNT}/2025/consolidated/2025 - Chase {ACCOUNT}.csv").read_text()
+
+
+def test_boundary_follows_chained_statements(tmp_path, monkeypatch):
+    """A change in month 03 pulls B back to 02, which must pull A back to 01."""
+    monkeypatch.chdir(tmp_path)
+    write_month('01', [('Alpha', '-10.00', '2025-01-20', STATEMENT_A)])
+    write_month('02', [('Beta', '-20.00', '2025-02-03', STATEMENT_A),
+                       ('Gamma', '-30.00', '2025-02-20', STATEMENT_B)])
+    write_month('03', [('Delta', '-40.00', '2025-03-03', STATEMENT_B)])
+    consolidate_account(ACCOUNT, incremental=False)
+
+    write_month('03', [('Delta', '-40.00', '2025-03-03', STATEMENT_B),
+                       ('Epsilon', '-50.00', '2025-03-05', STATEMENT_B)])
+    consolidate_account(ACCOUNT)
+    incremental = consolidated()
+    consolidate_account(ACCOUNT, incremental=False)
+
+    assert incremental == consolidated()
+    assert [line.split(',')[0] for line in incremental.splitlines()[1:]] == [
+        'Alpha', 'Beta', 'Gamma', 'Delta', 'Epsilon']
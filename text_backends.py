@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Registry of PDF text-extraction backends.
+
+Every way the repo has turned a statement PDF into text sits behind one
+interface, so extractors, the page text cache and the benchmark
+(bench_text_backends.py) can switch between them by name:
+
+- PyPDF2      page by page, in process (the default)
+- pdfplumber  page by page, in process (optional dependency, imported on use)
+- strings     the printable strings of the raw PDF file
+- textutil    macOS textutil -convert txt
+
+Backends whose output is one document (strings, textutil) are split into
+pages at form feeds where present; otherwise the whole text is one page.
+A backend is usable when available() is true: its module is installed or
+its command is on the PATH.
+"""
+
+import importlib
+import importlib.metadata
+import importlib.util
+import os
+import shutil
+import subprocess
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+import PyPDF2
+
+
+class TextBackend(ABC):
+    """A named way of extracting the text of a PDF's pages."""
+
+    name = ''
+    # Whether pages can be extracted independently (and so in parallel)
+    paged = True
+
+    @property
+    def version(self) -> str:
+        """Part of the page text cache key, so an upgrade never serves stale text."""
+        return 'unknown'
+
+    def available(self) -> bool:
+        return True
+
+    def page_count(self, pdf_path: str) -> int:
+        return len(self.extract_pages(pdf_path))
+
+    @abstractmethod
+    def extract_pages(self, pdf_path: str, start: int = 0, stop: int = None) -> List[str]:
+        """Text of pages [start, stop) (all pages when stop is None)."""
+
+
+class PyPDF2Backend(TextBackend):
+    name = 'PyPDF2'
+
+    @property
+    def version(self) -> str:
+        return getattr(PyPDF2, '__version__', 'unknown')
+
+    def page_count(self, pdf_path: str) -> int:
+        with open(pdf_path, 'rb') as file:
+            return len(PyPDF2.PdfReader(file).pages)
+
+    def extract_pages(self, pdf_path: str, start: int = 0, stop: int = None) -> List[str]:
+        # Each call opens the file itself; PdfReader objects do not pickle
+        with open(pdf_path, 'rb') as file:
+            pages = PyPDF2.PdfReader(file).pages
+            stop = len(pages) if stop is None else stop
+            return [pages[i].extract_text() for i in range(start, stop)]
+
+
+class PdfplumberBackend(TextBackend):
+    """Optional dependency, imported on first use so other backends never pay for it."""
+
+    name = 'pdfplumber'
+
+    @property
+    def version(self) -> str:
+        try:
+            return importlib.metadata.version('pdfplumber')
+        except importlib.metadata.PackageNotFoundError:
+            return 'unknown'
+
+    def available(self) -> bool:
+        return importlib.util.find_spec('pdfplumber') is not None
+
+    def _open(self, pdf_path: str):
+        return importlib.import_module('pdfplumber').open(pdf_path)
+
+    def page_count(self, pdf_path: str) -> int:
+        with self._open(pdf_path) as pdf:
+            return len(pdf.pages)
+
+    def extract_pages(self, pdf_path: str, start: int = 0, stop: int = None) -> List[str]:
+        with self._open(pdf_path) as pdf:
+            stop = len(pdf.pages) if stop is None else stop
+            return [pdf.pages[i].extract_text() or '' for i in range(start, stop)]
+
+
+class CommandBackend(TextBackend):
+    """A command-line tool that prints the text of a whole PDF."""
+
+    paged = False
+    command: List[str] = []
+
+    @property
+    def version(self) -> str:
+        # Tools do not agree on a version flag (textutil has none); the
+        # binary's size and mtime change whenever it is upgraded
+        path = shutil.which(self.command[0])
+        if path is None:
+            return 'unknown'
+        stat = os.stat(path)
+        return f"{stat.st_size}-{int(stat.st_mtime)}"
+
+    def available(self) -> bool:
+        return shutil.which(self.command[0]) is not None
+
+    def extract_pages(self, pdf_path: str, start: int = 0, stop: int = None) -> List[str]:
+        result = subprocess.run(self.command + [pdf_path], capture_output=True, text=True,
+                                errors='replace', check=True)
+        pages = result.stdout.split('\f')
+        if len(pages) > 1 and not pages[-1].strip():
+            pages.pop()  # Text after the final form feed
+        return pages[start:stop]
+
+
+class StringsBackend(CommandBackend):
+    name = 'strings'
+    command = ['strings']
+
+
+class TextutilBackend(CommandBackend):
+    name = 'textutil'
+    command = ['textutil', '-convert', 'txt', '-stdout']
+
+
+BACKENDS: Dict[str, TextBackend] = {}
+
+
+def register_backend(backend: TextBackend) -> TextBackend:
+    """Add a backend to the registry under its name."""
+    BACKENDS[backend.name] = backend
+    return backend
+
+
+for _backend in (PyPDF2Backend(), PdfplumberBackend(), StringsBackend(), TextutilBackend()):
+    register_backend(_backend)
+
+
+def get_backend(name: str) -> TextBackend:
+    """Registered backend by name; raises ValueError for unknown or unavailable ones."""
+    backend = BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"Unknown text backend {name!r} (known: {', '.join(BACKENDS)})")
+    if not backend.available():
+        raise ValueError(f"Text backend {name!r} is not available here")
+    return backend
+
+
+def available_backends() -> List[str]:
+    """Names of the registered backends usable on this machine."""
+    return [name for name, backend in BACKENDS.items() if backend.available()]
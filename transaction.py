@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Compact transaction record shared by the extractors and consolidation.
+
+Each row is one slotted Transaction instead of a dict. The CSV column order
+is built in: to_row() is the row for csv.writer and from_row() reads one
+back, so saving and consolidating never copy between dict layouts.
+Descriptions and the 'Bank and last 4' label repeat across rows and
+statements, so both are interned. The running balance printed on the
+statement line is kept for validation but is not a CSV column.
+"""
+
+import csv
+import sys
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from money import format_cents, parse_cents
+from monthly_files import CSV_FIELDNAMES
+
+
+class Transaction:
+    """One statement transaction; the amount is in integer cents."""
+
+    __slots__ = ('date', 'description', 'amount_cents', 'type', 'status', 'statement_id', 'account',
+                 'balance_cents')
+
+    def __init__(self, date: str, description: str, amount_cents: int, tx_type: str,
+                 statement_id: str = '', account: str = '', status: str = 'New',
+                 balance_cents: Optional[int] = None):
+        self.date = date  # YYYY-MM-DD
+        self.description = sys.intern(description)
+        self.amount_cents = amount_cents
+        self.type = tx_type
+        self.status = status
+        self.statement_id = statement_id  # e.g. '2025-02 - Chase 1873'
+        self.account = sys.intern(account)  # e.g. 'Chase 1873'
+        self.balance_cents = balance_cents  # Printed running balance, when the line had one
+
+    def to_row(self) -> List[str]:
+        """CSV row in CSV_FIELDNAMES order."""
+        return [self.description, format_cents(self.amount_cents), self.date, self.type,
+                self.status, self.statement_id, self.account]
+
+    @classmethod
+    def from_row(cls, row: Sequence[str]) -> 'Transaction':
+        """Build a transaction from a CSV row in CSV_FIELDNAMES order."""
+        description, amount, date, tx_type, status, statement_id, account = row
+        return cls(date, description, parse_cents(amount), tx_type, statement_id, account, status)
+
+    def __repr__(self) -> str:
+        return (f"Transaction({self.date!r}, {self.description!r}, "
+                f"{format_cents(self.amount_cents)}, {self.type!r})")
+
+
+def iter_transactions(path: Path) -> Iterator[Transaction]:
+    """Read a monthly or consolidated CSV lazily, one Transaction at a time."""
+    with open(path, 'r', newline='') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if header is None:
+            return
+        if header == CSV_FIELDNAMES:
+            for row in reader:
+                if row:
+                    yield Transaction.from_row(row)
+            return
+
+        # Same columns in another order
+        columns = [header.index(name) for name in CSV_FIELDNAMES]
+        for row in reader:
+            if row:
+                yield Transaction.from_row([row[i] for i in columns])
+
+
+def read_transactions(path: Path) -> List[Transaction]:
+    """Read a monthly or consolidated CSV into Transactions."""
+    return list(iter_transactions(path))
+
+
+def write_transactions(path: Path, transactions: Iterable[Transaction]):
+    """Write Transactions as a CSV with the standard header."""
+    with open(path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(tx.to_row() for tx in transactions)
+
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Hash-indexed matcher between statement transactions and CSV transactions.
+
+Instead of comparing every statement row with every CSV row, CSV rows are
+bucketed twice:
+
+1. by (date, amount in cents) - exact matches, the common case
+2. by amount in cents, kept in date order - rows posted a few days apart
+
+Each statement row only looks at its own bucket, and candidates are scored
+by how many description words they share, using token sets computed once
+per distinct description. Matching is greedy in statement order and each
+CSV row is used at most once, so a whole year of several accounts is
+reconciled in one near-linear call.
+
+    result = match_transactions(statement_rows, csv_rows)
+    result['matched']  # [(statement row, csv row, shared words), ...]
+    result['missing']  # statement rows with no CSV row
+    result['extra']    # CSV rows with no statement row
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, FrozenSet, List, Sequence, Tuple
+
+from transaction import Transaction
+
+# Shared description words needed to call two rows the same transaction
+MIN_COMMON_WORDS = 2
+# Days a CSV row may be posted before or after the statement row
+DATE_WINDOW_DAYS = 3
+
+
+def description_tokens(description: str) -> FrozenSet[str]:
+    """Lowercased words of a description."""
+    return frozenset(description.lower().split())
+
+
+def match_transactions(statement_rows: Sequence[Transaction], csv_rows: Sequence[Transaction],
+                       date_window_days: int = DATE_WINDOW_DAYS,
+                       min_common_words: int = MIN_COMMON_WORDS,
+                       by_account: bool = False) -> Dict[str, List]:
+    """Pair statement rows with CSV rows; return matched, missing and extra.
+
+    A pair needs the same amount in cents, dates at most date_window_days
+    apart and at least min_common_words shared description words (or all
+    the words of a shorter description). Among candidates the most shared
+    words wins, then the closest date. With by_account, rows only match
+    within the same account label.
+    """
+    tokens: Dict[str, FrozenSet[str]] = {}
+    ordinals: Dict[str, int] = {}
+
+    def tokens_of(tx: Transaction) -> FrozenSet[str]:
+        found = tokens.get(tx.description)
+        if found is None:
+            found = tokens[tx.description] = description_tokens(tx.description)
+        return found
+
+    def ordinal_of(tx: Transaction) -> int:
+        found = ordinals.get(tx.date)
+        if found is None:
+            found = ordinals[tx.date] = date.fromisoformat(tx.date).toordinal()
+        return found
+
+    def amount_key(tx: Transaction) -> Tuple:
+        return (tx.account, tx.amount_cents) if by_account else (tx.amount_cents,)
+
+    # (amount key, date) -> csv indices, and amount key -> [(date ordinal, csv index)]
+    exact: Dict[Tuple, List[int]] = {}
+    by_amount: Dict[Tuple, List[Tuple[int, int]]] = {}
+    for index, tx in enumerate(csv_rows):
+        key = amount_key(tx)
+        exact.setdefault(key + (tx.date,), []).append(index)
+        by_amount.setdefault(key, []).append((ordinal_of(tx), index))
+    for rows in by_amount.values():
+        rows.sort()
+
+    used = [False] * len(csv_rows)
+    matched = []
+    unmatched = []
+
+    def best(tx: Transaction, candidates) -> Tuple[int, int]:
+        """(csv index, shared words) of the best unused candidate, or (-1, 0)."""
+        words = tokens_of(tx)
+        best_index, best_score = -1, (0, 0)
+        for distance, index in candidates:
+            if used[index]:
+                continue
+            other = tokens_of(csv_rows[index])
+            common = len(words & other)
+            # Short descriptions ("Deposit") only need all of their words
+            if common < min(min_common_words, len(words), len(other)) or not common:
+                continue
+            score = (common, -distance)
+            if best_index < 0 or score > best_score:
+                best_index, best_score = index, score
+        return best_index, best_score[0]
+
+    # Pass 1: same date and amount
+    for tx in statement_rows:
+        index, common = best(tx, ((0, i) for i in exact.get(amount_key(tx) + (tx.date,), ())))
+        if index < 0:
+            unmatched.append(tx)
+            continue
+        used[index] = True
+        matched.append((tx, csv_rows[index], common))
+
+    # Pass 2: same amount within the date window
+    missing = []
+    if date_window_days > 0:
+        for tx in unmatched:
+            rows = by_amount.get(amount_key(tx), [])
+            day = ordinal_of(tx)
+            lo = bisect_left(rows, (day - date_window_days, -1))
+            hi = bisect_right(rows, (day + date_window_days, len(csv_rows)))
+            index, common = best(tx, ((abs(other_day - day), i) for other_day, i in rows[lo:hi]))
+            if index < 0:
+                missing.append(tx)
+                continue
+            used[index] = True
+            matched.append((tx, csv_rows[index], common))
+    else:
+        missing = unmatched
+
+    extra = [tx for tx, was_used in zip(csv_rows, used) if not was_used]
+    return {'matched': matched, 'missing': missing, 'extra': extra}
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Embedded SQLite store of every extracted transaction.
+
+accounts/transactions.db holds one row per transaction with the amount in
+integer cents, indexed on (account, date), statement id and amount. The
+extractors write each statement in a single transaction, replacing the
+rows it had before - unless the stored rows came from a better version
+([VALIDATED] > highest [vN] > unversioned, as in the monthly manifest).
+The monthly and consolidated CSV layouts are exports of the store.
+
+Usage:
+    python transaction_store.py import [accounts_root]
+    python transaction_store.py query [--account "Chase 1873"] [--from 2025-01-01] [--to 2025-03-31] [--text venmo]
+    python transaction_store.py export "Chase 1873" 2025 <out.csv>
+"""
+
+import csv
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from money import format_dollars
+from monthly_files import CSV_FIELDNAMES
+from monthly_manifest import MONTHLY_FILE_RE, MonthlyManifest, version_rank
+from statement_overlap import OverlapFilter
+from transaction import Transaction, read_transactions
+
+STORE_NAME = 'transactions.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS statements (
+    statement_id TEXT PRIMARY KEY,
+    account TEXT NOT NULL,
+    source TEXT NOT NULL,
+    version_tag TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    statement_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,  -- Row's position in its source file (0 = first row after the header)
+    account TEXT NOT NULL,
+    date TEXT NOT NULL,
+    description TEXT NOT NULL,
+    amount_cents INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    balance_cents INTEGER
+);
+CREATE INDEX IF NOT EXISTS transactions_account_date ON transactions (account, date);
+CREATE INDEX IF NOT EXISTS transactions_statement ON transactions (statement_id, seq);
+CREATE INDEX IF NOT EXISTS transactions_amount ON transactions (amount_cents);
+"""
+
+COLUMNS = 'date, description, amount_cents, type, statement_id, account, status, balance_cents'
+
+
+def store_path(output_root: Path = Path('.')) -> Path:
+    """Location of the store inside an accounts/ tree."""
+    return Path(output_root) / 'accounts' / STORE_NAME
+
+
+def _row_transaction(row) -> Transaction:
+    date, description, amount_cents, tx_type, statement_id, account, status, balance_cents = row
+    return Transaction(date, description, amount_cents, tx_type, statement_id, account, status, balance_cents)
+
+
+class TransactionStore:
+    """SQLite-backed system of record for extracted transactions."""
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path is not None else store_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Parallel batch workers write to the same file; WAL lets readers continue meanwhile
+        self.conn = sqlite3.connect(str(self.path), timeout=60)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> 'TransactionStore':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def save_statement(self, statement_id: str, transactions: List[Transaction],
+                       source: str = '', version_tag: str = '', seqs: Optional[List[int]] = None) -> bool:
+        """Replace a statement's rows in one transaction.
+
+        seqs gives each row's position in the source file (default: the
+        rows are the whole file, in order). Returns False (and changes
+        nothing) when the stored rows came from a better version of the
+        statement than version_tag.
+        """
+        if seqs is None:
+            seqs = range(len(transactions))
+        with self.conn:
+            stored = self.conn.execute(
+                'SELECT version_tag FROM statements WHERE statement_id = ?', (statement_id,)
+            ).fetchone()
+            if stored is not None and version_rank(stored[0]) > version_rank(version_tag):
+                return False
+
+            account = transactions[0].account if transactions else ''
+            self.conn.execute('DELETE FROM transactions WHERE statement_id = ?', (statement_id,))
+            self.conn.execute('INSERT OR REPLACE INTO statements VALUES (?, ?, ?, ?)',
+                              (statement_id, account, source, version_tag))
+            self.conn.executemany(
+                f'INSERT INTO transactions (seq, {COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                [(seq, tx.date, tx.description, tx.amount_cents, tx.type, tx.statement_id, tx.account,
+                  tx.status, tx.balance_cents) for seq, tx in zip(seqs, transactions)]
+            )
+        return True
+
+    def save_monthly_file(self, path, transactions: List[Transaction]) -> int:
+        """Store the rows of a saved monthly CSV, one transaction per statement id.
+
+        Returns the number of statements written.
+        """
+        path = Path(path)
+        match = MONTHLY_FILE_RE.match(path.name)
+        version_tag = (match.group('tag') or '') if match else ''
+
+        # A file can hold rows of several statements (periods straddle months);
+        # each row keeps its position in the file
+        by_statement = {}
+        for seq, tx in enumerate(transactions):
+            rows, seqs = by_statement.setdefault(tx.statement_id, ([], []))
+            rows.append(tx)
+            seqs.append(seq)
+        return sum(self.save_statement(statement_id, rows, path.name, version_tag, seqs)
+                   for statement_id, (rows, seqs) in by_statement.items())
+
+    def import_tree(self, root: Path = Path('accounts')) -> int:
+        """Load the authoritative monthly file of every month under an accounts/ tree."""
+        count = 0
+        for directory in sorted(Path(root).glob('*/*/monthly')):
+            for path in MonthlyManifest.load(directory).authoritative_files():
+                count += self.save_monthly_file(path, read_transactions(path))
+        return count
+
+    def query(self, account: Optional[str] = None, start: Optional[str] = None, end: Optional[str] = None,
+              text: Optional[str] = None, amount_cents: Optional[int] = None) -> List[Transaction]:
+        """Transactions matching every given filter, in date order.
+
+        start/end are inclusive YYYY-MM-DD dates; text is a case-insensitive
+        substring of the description.
+        """
+        where, params = [], []
+        if account is not None:
+            where.append('account = ?')
+            params.append(account)
+        if start is not None:
+            where.append('date >= ?')
+            params.append(start)
+        if end is not None:
+            where.append('date <= ?')
+            params.append(end)
+        if amount_cents is not None:
+            where.append('amount_cents = ?')
+            params.append(amount_cents)
+        if text is not None:
+            where.append('description LIKE ?')
+            params.append(f'%{text}%')
+
+        sql = f'SELECT {COLUMNS} FROM transactions'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY date, statement_id, seq'
+        return [_row_transaction(row) for row in self.conn.execute(sql, params)]
+
+    def statement_transactions(self, statement_id: str) -> List[Transaction]:
+        """Rows of one statement in their original order."""
+        rows = self.conn.execute(
+            f'SELECT {COLUMNS} FROM transactions WHERE statement_id = ? ORDER BY seq', (statement_id,)
+        )
+        return [_row_transaction(row) for row in rows]
+
+    def year_transactions(self, account: str, year: int) -> Iterator[Transaction]:
+        """An account's statements of a year in consolidated order.
+
+        Rows are ordered by date with ties in statement order, and rows two
+        statements share through overlapping periods are dropped, as in
+        consolidate_account().
+        """
+        rows = self.conn.execute(
+            f'SELECT {COLUMNS} FROM transactions WHERE account = ? AND statement_id LIKE ? '
+            'ORDER BY date, statement_id, seq',
+            (account, f'{year}-%')
+        )
+        overlap = OverlapFilter(date_ordered=True)
+        for row in rows:
+            tx = _row_transaction(row)
+            if overlap.keep(tx):
+                yield tx
+
+
+def export_csv(path, transactions: Iterable[Transaction]) -> int:
+    """Write rows in the standard CSV layout. Returns the row count."""
+    count = 0
+    with open(path, 'w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_FIELDNAMES)
+        for tx in transactions:
+            writer.writerow(tx.to_row())
+            count += 1
+    return count
+
+
+def _option(args: List[str], name: str) -> Optional[str]:
+    return args[args.index(name) + 1] if name in args else None
+
+
+def main():
+    """Import the CSV tree, query the store, or export an annual CSV."""
+    if len(sys.argv) < 2 or sys.argv[1] not in ('import', 'query', 'export'):
+        print(__doc__.split('Usage:')[1].rstrip())
+        sys.exit(1)
+
+    command, args = sys.argv[1], sys.argv[2:]
+    with TransactionStore() as store:
+        if command == 'import':
+            root = Path(args[0]) if args else Path('accounts')
+            print(f"Imported {store.import_tree(root)} statements into {store.path}")
+
+        elif command == 'query':
+            start_time = time.perf_counter()
+            transactions = store.query(_option(args, '--account'), _option(args, '--from'),
+                                       _option(args, '--to'), _option(args, '--text'))
+            elapsed = (time.perf_counter() - start_time) * 1000
+            for tx in transactions:
+                print(f"{tx.date} {tx.account:<14} {format_dollars(tx.amount_cents):>13}  {tx.description[:70]}")
+            print(f"{len(transactions)} transactions ({elapsed:.1f} ms)")
+
+        else:
+            if len(args) < 3:
+                print('Usage: python transaction_store.py export "Chase 1873" 2025 <out.csv>')
+                sys.exit(1)
+            account, year, output = args[0], int(args[1]), args[2]
+            count = export_csv(output, store.year_transactions(account, year))
+            print(f"Exported {count} transactions of {account} {year} to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Pair the two legs of transfers between Chase accounts.
+
+A transfer appears once in each account:
+
+    1873: 02/06 Online Transfer To Chk ...8619 Transaction#: 23637622827
+    8619: Online Transfer From Chk ...1873 Transaction#: 23637622827
+
+Every transfer row of every account and month is indexed by its Chase
+transaction number in one pass, and the two directions are joined on that
+key. A pair is flagged when the amounts are not opposite or the accounts do
+not point at each other; a leg is flagged when its counterpart account was
+loaded but has no leg with the same number.
+
+Usage (post-pass over the consolidated files):
+    python transfer_pairing.py [year]
+"""
+
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from money import format_dollars
+from transaction import Transaction, read_transactions
+
+CHASE_ACCOUNTS = ['2084', '1873', '8619']
+
+# "Online Transfer To Chk ...8619 Transaction#: 23637622827" (number optional)
+TRANSFER_RE = re.compile(
+    r'Online Transfer\s+(?P<direction>To|From)\s+Chk\s*\.\.\.(?P<counterpart>\d{4})'
+    r'(?:.*?Transaction#:\s*(?P<number>\d+))?',
+    re.IGNORECASE
+)
+
+
+class TransferLeg:
+    """One side of a transfer: the row, its direction and the other account."""
+
+    __slots__ = ('transaction', 'direction', 'counterpart', 'number')
+
+    def __init__(self, transaction: Transaction, direction: str, counterpart: str, number: Optional[str]):
+        self.transaction = transaction
+        self.direction = direction  # 'to' (money leaves) or 'from' (money arrives)
+        self.counterpart = counterpart  # Last 4 digits of the other account
+        self.number = number  # Chase Transaction#, when printed
+
+    @property
+    def account(self) -> str:
+        """Last 4 digits of the account this leg was posted to."""
+        return self.transaction.account[-4:]
+
+    def __str__(self) -> str:
+        tx = self.transaction
+        number = f" #{self.number}" if self.number else ''
+        return (f"{tx.date} {self.account} {self.direction} {self.counterpart}{number} "
+                f"{format_dollars(tx.amount_cents)}")
+
+
+def transfer_leg(tx: Transaction) -> Optional[TransferLeg]:
+    """The transfer leg described by a row, or None for other transactions."""
+    match = TRANSFER_RE.search(tx.description)
+    if not match:
+        return None
+    return TransferLeg(tx, match.group('direction').lower(), match.group('counterpart'), match.group('number'))
+
+
+def pair_transfers(transactions: Iterable[Transaction],
+                   accounts: Optional[Iterable[str]] = None) -> Dict[str, List]:
+    """Hash-join transfer legs on their transaction number.
+
+    Returns {'paired': [(to leg, from leg)], 'mismatched': [(to leg, from
+    leg or None, problems)], 'unmatched': [leg], 'duplicates': [leg],
+    'unnumbered': [leg]}. accounts are the last 4 digits of every account
+    loaded; pass them when the transactions are only transfer rows, or an
+    account without any looks not loaded. A leg whose counterpart account
+    is not loaded cannot be checked and is not reported as unmatched.
+    """
+    legs_by_number: Dict[Tuple[str, str], TransferLeg] = {}
+    result = {'paired': [], 'mismatched': [], 'unmatched': [], 'duplicates': [], 'unnumbered': []}
+    infer_accounts = accounts is None
+    accounts = set() if infer_accounts else {account[-4:] for account in accounts}
+
+    for tx in transactions:
+        if infer_accounts:
+            accounts.add(tx.account[-4:])
+        leg = transfer_leg(tx)
+        if leg is None:
+            continue
+        if leg.number is None:
+            result['unnumbered'].append(leg)
+            continue
+        if leg.counterpart == leg.account:
+            # Usually the other account's row filed under this account
+            result['mismatched'].append((leg, None, [f"transfer {leg.direction} its own account {leg.account}"]))
+            continue
+        key = (leg.number, leg.direction)
+        if key in legs_by_number:
+            # The same leg extracted twice (e.g. from overlapping statements)
+            result['duplicates'].append(leg)
+            continue
+        legs_by_number[key] = leg
+
+    for (number, direction), leg in legs_by_number.items():
+        if direction != 'to':
+            if (number, 'to') not in legs_by_number and leg.counterpart in accounts:
+                result['unmatched'].append(leg)
+            continue
+
+        other = legs_by_number.get((number, 'from'))
+        if other is None:
+            if leg.counterpart in accounts:
+                result['unmatched'].append(leg)
+            continue
+
+        problems = []
+        if leg.transaction.amount_cents != -other.transaction.amount_cents:
+            problems.append(f"amounts {format_dollars(leg.transaction.amount_cents)} / "
+                            f"{format_dollars(other.transaction.amount_cents)}")
+        if leg.counterpart != other.account or other.counterpart != leg.account:
+            problems.append(f"accounts {leg.account}->{leg.counterpart} / {other.counterpart}->{other.account}")
+        if problems:
+            result['mismatched'].append((leg, other, problems))
+        else:
+            result['paired'].append((leg, other))
+
+    return result
+
+
+def consolidated_path(account: str, year: int) -> Path:
+    """Consolidated file written by consolidate_account()."""
+    return Path(f"accounts/Chase {account}/{year}/consolidated/{year} - Chase {account}.csv")
+
+
+def print_transfer_report(result: Dict[str, List]):
+    """Summarize pair_transfers() and list every flagged leg."""
+    print(f"\nTransfers: {len(result['paired'])} paired, {len(result['mismatched'])} mismatched, "
+          f"{len(result['unmatched'])} unmatched, {len(result['duplicates'])} duplicate, "
+          f"{len(result['unnumbered'])} without a transaction number")
+
+    for leg, other, problems in result['mismatched']:
+        print(f"  ✗ Mismatched #{leg.number}: {'; '.join(problems)}")
+        print(f"      {leg}")
+        if other is not None:
+            print(f"      {other}")
+    for leg in result['unmatched']:
+        print(f"  ✗ No {'incoming' if leg.direction == 'to' else 'outgoing'} leg in {leg.counterpart}: {leg}")
+    for leg in result['duplicates']:
+        print(f"  ✗ Duplicate leg: {leg}")
+
+
+def main():
+    """Pair transfers across the consolidated files of every Chase account."""
+    year = int(sys.argv[1]) if len(sys.argv) > 1 else 2025
+
+    transactions = []
+    loaded = []
+    for account in CHASE_ACCOUNTS:
+        path = consolidated_path(account, year)
+        if not path.exists():
+            print(f"No consolidated file for Chase {account}: {path}")
+            continue
+        transactions.extend(read_transactions(path))
+        loaded.append(account)
+
+    print_transfer_report(pair_transfers(transactions, loaded))
+
+
+if __name__ == "__main__":
+    main()